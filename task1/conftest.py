@@ -1,11 +1,237 @@
+import dataclasses
+import os
+
 import pytest
-from selenium import webdriver
-from typing import Any, Generator
+from typing import Any, Generator, List
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from .lib.constants import Const
+from .lib.driver_pool import DriverPools
+from .lib.instrumentation import recorder, write_report
+from .lib.launch_profile import LaunchProfile, LaunchProfiles
+from .lib.by_type import ByType
+from .lib.constants import Url
+from .lib.locators.locator import Locator
+from .lib.locators.locators_programming_language import ProgrammingLanguagesLocators
+from .lib.offline.archive import MANIFEST_FILE, record_page
+from .lib.offline.server import ArchiveServer
+from .lib.popularity_evaluation import PopularityEvaluation
+from .lib.retry_budget import RetryBudget, retry_budgets
+from .lib.snapshot import Snapshot
+from .lib.server_ui.programming_languages_ui import ProgrammingLanguages, ProgrammingLanguagesUI
+
+MUTATES_PAGE_MARKER = "mutates_page"
+LAUNCH_PROFILE_MARKER = "launch_profile"
+SLOWEST_SUMMARY_SIZE = 10
+PAGE_SNAPSHOTS = pytest.StashKey[List[Snapshot]]()
+WORKER_BUDGET_REPORT = pytest.StashKey[List[str]]()
+WORKER_OUTPUT_KEY = "selenium_totals"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--driver-pool-size", type=int, default=Const.DRIVER_POOL_SIZE,
+                     help="count of pre-warmed browser sessions per worker")
+    parser.addoption("--driver-max-uses", type=int, default=Const.DRIVER_MAX_USES,
+                     help="browser session is restarted after this count of tests")
+    parser.addoption("--launch-profile", default=LaunchProfiles.DEFAULT.name,
+                     help="browser launch profile for tests without launch_profile marker: default, headless, fast")
+    parser.addoption("--instrument", action="store_true", default=False,
+                     help="record timings of WebDriver commands, polls, retries, sleeps and timeouts per test")
+    parser.addoption("--instrument-dir", default="instrumentation",
+                     help="directory for per test <test>.json and <test>.folded (flamegraph) reports")
+    parser.addoption("--retry-budget", type=float, default=Const.TEST_RETRY_BUDGET,
+                     help="seconds, that all element interactions of one test may spend on retries")
+    parser.addoption("--offline-archive", default=None,
+                     help="serve the programming languages page from this archive by the local server")
+    parser.addoption("--record-archive", action="store_true", default=False,
+                     help="record the live page into --offline-archive before the session (when it is missing)")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers",
+                            f"{MUTATES_PAGE_MARKER}: test changes the page, "
+                            f"saved page snapshots are invalidated after it")
+    config.addinivalue_line("markers",
+                            f"{LAUNCH_PROFILE_MARKER}(name): browser launch profile for the test")
+    recorder.enabled = config.getoption("--instrument")
+    config.stash[PAGE_SNAPSHOTS] = []
+
+
+def pytest_runtest_teardown(item: pytest.Item) -> None:
+    """Snapshots of the page are invalidated after the marked test, whatever fixtures it uses."""
+    if item.get_closest_marker(MUTATES_PAGE_MARKER):
+        for snapshot in item.config.stash[PAGE_SNAPSHOTS]:
+            snapshot.invalidate()
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """--record-archive records the page once: by the pytest-xdist controller before the workers are started
+    (or by the single pytest process), workers only serve the recorded archive."""
+    config = session.config
+    archive_dir = config.getoption("--offline-archive")
+    if not archive_dir or os.path.exists(os.path.join(archive_dir, MANIFEST_FILE)):
+        return
+    if not config.getoption("--record-archive"):
+        raise pytest.UsageError(f"No recorded archive in --offline-archive={archive_dir}, "
+                                "record it by --record-archive")
+    if hasattr(config, "workerinput"):
+        return
+    try:
+        record_page(Url.SRV_URL, archive_dir)
+    except OSError as err:
+        raise pytest.UsageError(f"Can't record '{Url.SRV_URL}' into --offline-archive={archive_dir}: {err}")
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """pytest-xdist worker sends its totals to the controller, they are printed by the controller summary."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput[WORKER_OUTPUT_KEY] = {"retry_budget": retry_budgets.report(),
+                                           "by_locator": dict(recorder.totals_by_locator),
+                                           "by_action": dict(recorder.totals_by_action)}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    """pytest-xdist controller collects the totals of the finished worker."""
+    output = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if output is None:
+        return
+    node.config.stash.setdefault(WORKER_BUDGET_REPORT, []).extend(output["retry_budget"])
+    recorder.merge_totals(output["by_locator"], output["by_action"])
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    budget_report = retry_budgets.report() + terminalreporter.config.stash.get(WORKER_BUDGET_REPORT, [])
+    if budget_report:
+        terminalreporter.section("retry budget")
+        for line in budget_report:
+            terminalreporter.write_line(line)
+    if not recorder.enabled:
+        return
+    for title, totals in (("slowest locators", recorder.totals_by_locator),
+                          ("slowest actions and commands", recorder.totals_by_action)):
+        terminalreporter.section(title)
+        slowest = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:SLOWEST_SUMMARY_SIZE]
+        for name, (count, duration) in slowest:
+            terminalreporter.write_line(f"{duration:9.3f}s {int(count):6d}x  {name}")
+
+
+@pytest.fixture(autouse=True)
+def instrumentation(request: pytest.FixtureRequest) -> Generator[None, Any, None]:
+    if not recorder.enabled:
+        yield
+        return
+    recorder.start()
+    yield
+    write_report(request.config.getoption("--instrument-dir"), request.node.nodeid, recorder.stop())
+
+
+@pytest.fixture(autouse=True)
+def retry_budget(request: pytest.FixtureRequest) -> Generator[RetryBudget, Any, None]:
+    """Every test has its own total retry time, locators broken in the previous tests are tried again."""
+    retry_budgets.breaker.reset()
+    with retry_budgets.activate(RetryBudget(request.node.nodeid,
+                                            request.config.getoption("--retry-budget"))) as budget:
+        yield budget
+
 
 @pytest.fixture(scope="session", autouse=True)
-def driver() -> Generator[WebDriver, Any, None]:
-    driver = webdriver.Chrome()
-    yield driver
-    driver.quit()
+def offline_site(pytestconfig: pytest.Config) -> Generator[None, Any, None]:
+    """With --offline-archive the page url is redirected to the local server, page loads are deterministic."""
+    archive_dir = pytestconfig.getoption("--offline-archive")
+    if not archive_dir:
+        yield
+        return
+
+    with ArchiveServer(archive_dir) as server, pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(ProgrammingLanguagesLocators, "PROGRAMMING_LANGUAGES_URL",
+                            Locator(server.page_url, by=ByType.URL))
+        yield
+
+
+@pytest.fixture(scope="session")
+def driver_pools(pytestconfig: pytest.Config) -> Generator[DriverPools, Any, None]:
+    """Pools are created per session, so every pytest-xdist worker has its own browsers."""
+    pools = DriverPools(size=pytestconfig.getoption("--driver-pool-size"),
+                        max_uses=pytestconfig.getoption("--driver-max-uses"))
+    yield pools
+    pools.close()
+
+
+@pytest.fixture(scope="session")
+def snapshot_driver_pools(pytestconfig: pytest.Config) -> Generator[DriverPools, Any, None]:
+    """Snapshots are loaded by their own sessions: with --driver-pool-size=1 the test's driver holds the only
+    session of driver_pools, while a snapshot fixture of the same test is loading."""
+    pools = DriverPools(size=1, max_uses=pytestconfig.getoption("--driver-max-uses"))
+    yield pools
+    pools.close()
+
+
+def _session_profile(config: pytest.Config, name: str) -> LaunchProfile:
+    """With --offline-archive browsers don't reach the live hosts, the replay doesn't depend on the network."""
+    profile = LaunchProfiles.by_name(name)
+    return dataclasses.replace(profile, offline=True) if config.getoption("--offline-archive") else profile
+
+
+@pytest.fixture(scope="session")
+def default_launch_profile(pytestconfig: pytest.Config) -> LaunchProfile:
+    return _session_profile(pytestconfig, pytestconfig.getoption("--launch-profile"))
+
+
+@pytest.fixture
+def launch_profile(request: pytest.FixtureRequest, default_launch_profile: LaunchProfile) -> LaunchProfile:
+    """Profile from the test marker, the fixture can be overridden in a test module as well."""
+    marker = request.node.get_closest_marker(LAUNCH_PROFILE_MARKER)
+    if marker:
+        return _session_profile(request.config, marker.args[0])
+    return default_launch_profile
+
+
+@pytest.fixture
+def driver(driver_pools: DriverPools, launch_profile: LaunchProfile) -> Generator[WebDriver, Any, None]:
+    pool = driver_pools.get(launch_profile)
+    # health check and reset of the pooled session are not the commands of the test
+    with recorder.paused():
+        driver = pool.acquire()
+    try:
+        yield recorder.attach(driver)
+    finally:
+        with recorder.paused():
+            pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def programming_languages_snapshot(pytestconfig: pytest.Config,
+                                   snapshot_driver_pools: DriverPools,
+                                   default_launch_profile: LaunchProfile) -> Snapshot[List[ProgrammingLanguages]]:
+    """The websites table is scraped once per session and shared by all tests."""
+
+    def load() -> List[ProgrammingLanguages]:
+        with snapshot_driver_pools.get(default_launch_profile).session() as driver:
+            return ProgrammingLanguagesUI()._get_programming_languages_used_in_most_popular_websites(
+                recorder.attach(driver))
+
+    snapshot = Snapshot(load)
+    pytestconfig.stash[PAGE_SNAPSHOTS].append(snapshot)
+    return snapshot
+
+
+@pytest.fixture
+def programming_languages(programming_languages_snapshot: Snapshot[List[ProgrammingLanguages]]
+                          ) -> List[ProgrammingLanguages]:
+    return programming_languages_snapshot.get()
+
+
+@pytest.fixture(scope="session")
+def popularity_evaluation_snapshot(programming_languages_snapshot: Snapshot[List[ProgrammingLanguages]]
+                                   ) -> Snapshot[PopularityEvaluation]:
+    """All popularity thresholds are evaluated at once, again after the websites snapshot is invalidated."""
+    return programming_languages_snapshot.derive(
+        lambda websites: PopularityEvaluation(websites, Const.POPULARITY_THRESHOLDS))
+
+
+@pytest.fixture
+def popularity_evaluation(popularity_evaluation_snapshot: Snapshot[PopularityEvaluation]) -> PopularityEvaluation:
+    """Tests only read their column of the shared evaluation."""
+    return popularity_evaluation_snapshot.get()
@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence, TypeVar
+
+from ..elements.actions import READ_COLUMNS_SCRIPT, READ_TABLE_SCRIPT, ElementsColumns
+
+TypeAsyncElement = TypeVar('TypeAsyncElement', bound='AsyncElement')  # any subclass of AsyncElement
+
+
+class AsyncAction(ABC):
+    """Base abstract class for async actions, same as Action, but __call__ is a coroutine."""
+
+    __slots__ = "_owner", "debug_value"
+
+    def __init__(self, owner: TypeAsyncElement) -> None:
+        self._owner: TypeAsyncElement = owner
+        self.debug_value: Optional[Any] = None  # return value of the __call__ method, for logging and debugging
+
+    @abstractmethod
+    async def __call__(self):
+        pass
+
+    def _elements(self) -> list:
+        return self._owner.web_element if isinstance(self._owner.web_element, list) else [self._owner.web_element]
+
+
+class AsyncClickAction(AsyncAction):
+    """Clicks by web page element."""
+
+    async def __call__(self) -> None:
+        await self._owner.web_element.click()
+
+
+class AsyncReadTextAction(AsyncAction):
+    """Reads element's text."""
+
+    async def __call__(self) -> str:
+        self.debug_value = await self._owner.web_element.text()
+        return self.debug_value
+
+
+class AsyncIsOnPageAction(AsyncAction):
+    """Check is element on page."""
+
+    async def __call__(self) -> bool:
+        self.debug_value = self._owner.web_element
+        if self.debug_value is None:
+            return False
+        # stale cached web element raises StaleElementReferenceException, and it is searched again
+        await self.debug_value.is_enabled()
+        return True
+
+
+class AsyncGetLenAction(AsyncAction):
+    """Get self._element length."""
+
+    async def __call__(self) -> int:
+        self.debug_value = len(self._elements())
+        return self.debug_value
+
+
+class AsyncGetAttributeAction(AsyncAction):
+    """Reads attribute value from element."""
+    __slots__ = "_attr_name"
+
+    def __init__(self, owner: TypeAsyncElement, attr_name: str) -> None:
+        super().__init__(owner)
+        self._attr_name = attr_name
+
+    async def __call__(self) -> Optional[str]:
+        self.debug_value = await self._owner.web_element.get_attribute(self._attr_name)
+        return self.debug_value
+
+
+class AsyncReadColumnsListAction(AsyncAction):
+    """This class works in a pair with AsyncElements class. Reads text, attributes and
+    properties from every element by one script call, returns ElementsColumns."""
+    __slots__ = "_text", "_attributes", "_properties"
+
+    def __init__(self, owner: TypeAsyncElement, text: bool, attributes: Sequence[str],
+                 properties: Sequence[str]) -> None:
+        super().__init__(owner)
+        self._text = text
+        self._attributes = attributes
+        self._properties = properties
+
+    async def __call__(self) -> ElementsColumns:
+        result = await self._owner._web_driver.execute_script(READ_COLUMNS_SCRIPT, self._elements(),
+                                                              list(self._attributes), list(self._properties),
+                                                              self._text)
+        self.debug_value = ElementsColumns(result["text"], result["attributes"], result["properties"])
+        return self.debug_value
+
+
+class AsyncReadTableAction(AsyncAction):
+    """This class works in a pair with AsyncTable class. Reads text of every cell
+    from every row by one script call, returns the list of rows."""
+
+    async def __call__(self) -> List[List[str]]:
+        self.debug_value = await self._owner._web_driver.execute_script(READ_TABLE_SCRIPT, self._elements())
+        return self.debug_value
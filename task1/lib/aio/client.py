@@ -0,0 +1,222 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union, NoReturn
+from urllib.parse import quote
+
+import aiohttp
+from selenium.common import exceptions
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+from ..launch_profile import LaunchProfile, LaunchProfiles
+
+# W3C WebDriver protocol: key of the web element reference in JSON
+WEB_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# W3C error codes mapped to the selenium exceptions, so the same IGNORED_EXCEPTIONS work for sync and async code
+ERRORS = {
+    "element click intercepted": exceptions.ElementClickInterceptedException,
+    "element not interactable": exceptions.ElementNotInteractableException,
+    "invalid argument": exceptions.InvalidArgumentException,
+    "invalid selector": exceptions.InvalidSelectorException,
+    "invalid session id": exceptions.InvalidSessionIdException,
+    "javascript error": exceptions.JavascriptException,
+    "no such element": exceptions.NoSuchElementException,
+    "no such window": exceptions.NoSuchWindowException,
+    "session not created": exceptions.SessionNotCreatedException,
+    "stale element reference": exceptions.StaleElementReferenceException,
+    "timeout": exceptions.TimeoutException,
+    "script timeout": exceptions.TimeoutException,
+}
+
+
+def _to_w3c_locator(by: str, value: str) -> Tuple[str, str]:
+    """W3C protocol supports css, xpath, link text and tag name only -
+    like selenium, converts other strategies to css."""
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    return by, value
+
+
+class AsyncWebElement:
+    """Reference to the web element of the async session."""
+    __slots__ = "_driver", "id"
+
+    def __init__(self, driver: "AsyncWebDriver", element_id: str) -> None:
+        self._driver: AsyncWebDriver = driver
+        self.id: str = element_id
+
+    def __repr__(self) -> str:
+        return f"AsyncWebElement(id={self.id})"
+
+    def to_json(self) -> Dict[str, str]:
+        return {WEB_ELEMENT_KEY: self.id}
+
+    async def _command(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._driver.command(method, f"/element/{self.id}{path}", payload)
+
+    async def text(self) -> str:
+        return await self._command("GET", "/text")
+
+    async def click(self) -> None:
+        await self._command("POST", "/click", {})
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        """HTML attribute as it is in the markup (W3C Get Element Attribute).
+        Unlike the sync WebElement.get_attribute, there is no property fallback: for example "value" of the edited
+        input is the initial value, use get_property() for the current one."""
+        return await self._command("GET", f"/attribute/{quote(name, safe='')}")
+
+    async def get_property(self, name: str) -> Any:
+        return await self._command("GET", f"/property/{quote(name, safe='')}")
+
+    async def is_enabled(self) -> bool:
+        return await self._command("GET", "/enabled")
+
+    async def find_element(self, by: str, value: str) -> "AsyncWebElement":
+        using, value = _to_w3c_locator(by, value)
+        return self._driver.unwrap(await self._command("POST", "/element", {"using": using, "value": value}))
+
+    async def find_elements(self, by: str, value: str) -> List["AsyncWebElement"]:
+        using, value = _to_w3c_locator(by, value)
+        return self._driver.unwrap(await self._command("POST", "/elements", {"using": using, "value": value}))
+
+
+class AsyncWebDriver:
+    """Asyncio client of the W3C WebDriver protocol (chromedriver).
+    Commands are not blocking, so many sessions are driven concurrently from one event loop.
+
+    driver = await AsyncWebDriver.start(LaunchProfiles.FAST)
+    await driver.get(url)
+    await driver.quit()
+    """
+
+    def __init__(self, http: aiohttp.ClientSession, executor_url: str, session_id: str,
+                 service: Optional[Service] = None) -> None:
+        self._http: aiohttp.ClientSession = http
+        self._session_url: str = f"{executor_url.rstrip('/')}/session/{session_id}"
+        self._service: Optional[Service] = service
+        self.session_id: str = session_id
+
+    @classmethod
+    async def start(cls,
+                    profile: LaunchProfile = LaunchProfiles.DEFAULT,
+                    executor_url: Optional[str] = None) -> "AsyncWebDriver":
+        """Starts new browser session. Without executor_url the own chromedriver process is started."""
+        service = Service() if executor_url is None else None
+        http = aiohttp.ClientSession()
+        driver = None
+        try:
+            if service is not None:
+                # starting of chromedriver waits for its port, the event loop shouldn't wait with it
+                await asyncio.get_running_loop().run_in_executor(None, service.start)
+                executor_url = service.service_url
+
+            capabilities = {"capabilities": {"alwaysMatch": profile.options().to_capabilities()}}
+            async with http.post(f"{executor_url.rstrip('/')}/session", json=capabilities) as response:
+                value = cls._check_response(await response.json())
+            driver = cls(http, executor_url, value["sessionId"], service)
+
+            blocked_urls = profile.blocked_urls()
+            if blocked_urls:
+                await driver.execute_cdp_cmd("Network.enable", {})
+                await driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        except BaseException:
+            # the failed session shouldn't leave the http connections and chromedriver process
+            if driver is not None:
+                await driver.quit()
+            else:
+                await http.close()
+                if getattr(service, "process", None) is not None:
+                    await cls._stop_service(service)
+            raise
+        return driver
+
+    @staticmethod
+    async def _stop_service(service: Service) -> None:
+        # stop() terminates chromedriver and waits for it, the event loop shouldn't wait with it
+        await asyncio.get_running_loop().run_in_executor(None, service.stop)
+
+    @staticmethod
+    def _check_response(body: Dict[str, Any]) -> Union[Any, NoReturn]:
+        value = body.get("value")
+        if isinstance(value, dict) and "error" in value:
+            exception = ERRORS.get(value["error"], exceptions.WebDriverException)
+            raise exception(value.get("message"))
+        return value
+
+    def wrap(self, value: Any) -> Any:
+        """Python value -> JSON, web elements are replaced by references."""
+        if isinstance(value, AsyncWebElement):
+            return value.to_json()
+        if isinstance(value, (list, tuple)):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
+
+    def unwrap(self, value: Any) -> Any:
+        """JSON -> python value, references are replaced by web elements."""
+        if isinstance(value, dict):
+            if WEB_ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[WEB_ELEMENT_KEY])
+            return {key: self.unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.unwrap(item) for item in value]
+        return value
+
+    async def command(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        async with self._http.request(method, f"{self._session_url}{path}", json=payload) as response:
+            return self._check_response(await response.json())
+
+    async def get(self, url: str) -> None:
+        await self.command("POST", "/url", {"url": url})
+
+    async def refresh(self) -> None:
+        await self.command("POST", "/refresh", {})
+
+    async def current_url(self) -> str:
+        return await self.command("GET", "/url")
+
+    async def title(self) -> str:
+        return await self.command("GET", "/title")
+
+    async def page_source(self) -> str:
+        return await self.command("GET", "/source")
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        using, value = _to_w3c_locator(by, value)
+        return self.unwrap(await self.command("POST", "/element", {"using": using, "value": value}))
+
+    async def find_elements(self, by: str, value: str) -> List[AsyncWebElement]:
+        using, value = _to_w3c_locator(by, value)
+        return self.unwrap(await self.command("POST", "/elements", {"using": using, "value": value}))
+
+    async def execute_script(self, script: str, *args) -> Any:
+        payload = {"script": script, "args": self.wrap(list(args))}
+        return self.unwrap(await self.command("POST", "/execute/sync", payload))
+
+    async def execute_cdp_cmd(self, cmd: str, params: Dict[str, Any]) -> Any:
+        return await self.command("POST", "/goog/cdp/execute", {"cmd": cmd, "params": params})
+
+    async def new_tab(self) -> str:
+        """Opens new tab and returns its handle, use switch_to_window() for activating it."""
+        value = await self.command("POST", "/window/new", {"type": "tab"})
+        return value["handle"]
+
+    async def switch_to_window(self, handle: str) -> None:
+        await self.command("POST", "/window", {"handle": handle})
+
+    async def quit(self) -> None:
+        try:
+            await self.command("DELETE", "")
+        except exceptions.WebDriverException as err:
+            logging.info(f"Can't quit async browser session: {err}")
+        finally:
+            await self._http.close()
+            if self._service is not None:
+                await self._stop_service(self._service)
@@ -0,0 +1,159 @@
+import asyncio
+import copy
+import logging
+import time
+from typing import Any, List, NoReturn, Optional, Sequence, Tuple, TypeVar, Union
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+
+from .actions import AsyncAction, AsyncClickAction, AsyncReadTextAction, AsyncIsOnPageAction, AsyncGetLenAction
+from .actions import AsyncGetAttributeAction, AsyncReadColumnsListAction, AsyncReadTableAction
+from .client import AsyncWebDriver, AsyncWebElement
+from ..constants import Const
+from ..elements.actions import ElementsColumns
+from ..elements.wait import IGNORED_EXCEPTIONS, BackoffSchedule
+
+TypeAsyncAction = TypeVar('TypeAsyncAction', bound=AsyncAction)  # any subclass of AsyncAction
+TypeAsyncPage = TypeVar('TypeAsyncPage', bound='AsyncPage')  # any subclass of AsyncPage
+
+
+class AsyncElement:
+    """Base class for web page elements of async pages.
+    Descriptor returns a copy bound to the page, so concurrent pages never share the found web element:
+
+    text = await page.some_element.text()
+    """
+
+    __slots__ = ("_locator", "web_element", "_timeout", "_web_driver", "_page")
+
+    # found web element is saved to the page element cache
+    _is_cacheable: bool = True
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
+        self._locator: Tuple[str, str] = locator
+        self.web_element: Optional[Union[AsyncWebElement, List[AsyncWebElement]]] = None
+        self._timeout: int = timeout
+        self._web_driver: Optional[AsyncWebDriver] = None
+        self._page: Optional[TypeAsyncPage] = None
+
+    def __get__(self, instance: TypeAsyncPage, owner: Optional[TypeAsyncPage] = None) -> "AsyncElement":
+        bound = copy.copy(self)
+        bound._page = instance
+        bound._web_driver = instance.driver
+        bound.web_element = instance.element_cache.get(self._locator) if self._is_cacheable else None
+        return bound
+
+    def _set_web_element(self, web_element: Optional[Union[AsyncWebElement, List[AsyncWebElement]]]) -> None:
+        self.web_element = web_element
+        if not self._is_cacheable:
+            return
+        if web_element is None:
+            self._page.element_cache.pop(self._locator, None)
+        else:
+            self._page.element_cache[self._locator] = web_element
+
+    async def _locate(self) -> Union[AsyncWebElement, List[AsyncWebElement]]:
+        return await self._web_driver.find_element(*self._locator)
+
+    async def _find_element(self, deadline: Optional[float] = None) -> Optional[NoReturn]:
+        if deadline is None:
+            deadline = time.time() + self._timeout
+
+        schedule = BackoffSchedule()
+        while True:
+            try:
+                self._set_web_element(await self._locate())
+                return
+            except IGNORED_EXCEPTIONS:
+                pass
+            delay = schedule.delay_until(deadline)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        err_message = f"No such element: {self.__class__.__name__}, locator={self._locator}, timeout={self._timeout}"
+        raise TimeoutException(err_message)
+
+    async def _safe_interact(self,
+                             action: TypeAsyncAction,
+                             message: str = '') -> Union[Any, NoReturn]:
+        """Same as Element._safe_interact: reruns action() until it is done,
+        cached web element is searched again only when it is stale."""
+
+        deadline = time.time() + self._timeout
+        schedule = BackoffSchedule()
+        while True:
+            try:
+                if self.web_element is None:
+                    await self._find_element(deadline)
+                return await action()
+            except StaleElementReferenceException:
+                self._set_web_element(None)
+            except (*IGNORED_EXCEPTIONS, TimeoutException):
+                pass
+            delay = schedule.delay_until(deadline)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        message_text = ""
+        if message:
+            message_text = (f"Timeout expired, '{self.__class__.__name__}', locator={self._locator}, {self.web_element}"
+                            f", {message} {action.debug_value}.")
+            logging.info(message_text)
+        raise TimeoutException(message_text)
+
+    ####################################################################################################################
+    # public methods
+    async def wait_on_page(self) -> Optional[NoReturn]:
+        await self._find_element()
+
+    async def is_on_page(self) -> Union[bool, NoReturn]:
+        return await self._safe_interact(AsyncIsOnPageAction(self))
+
+    async def text(self) -> str:
+        return await self._safe_interact(AsyncReadTextAction(self), message="can't read text")
+
+    async def click(self) -> None:
+        await self._safe_interact(AsyncClickAction(self), message="can't click")
+
+    async def get_attribute(self, attr_name: str) -> Optional[str]:
+        return await self._safe_interact(AsyncGetAttributeAction(self, attr_name))
+
+
+class AsyncTableCell(AsyncElement):
+    pass
+
+
+class AsyncElements(AsyncElement):
+    """Class works with a group of elements selected by one locator"""
+
+    # count of elements could be changed, so the list is searched on every interaction
+    _is_cacheable = False
+
+    async def _locate(self) -> List[AsyncWebElement]:
+        elements = await self._web_driver.find_elements(*self._locator)
+        if not elements:
+            raise NoSuchElementException(f"No such elements: {self._locator}")
+        return elements
+
+    async def length(self) -> int:
+        return await self._safe_interact(AsyncGetLenAction(self))
+
+    async def text_list(self) -> List[str]:
+        columns = await self.read_columns(text=True)
+        return columns.text
+
+    async def read_columns(self,
+                           text: bool = False,
+                           attributes: Sequence[str] = (),
+                           properties: Sequence[str] = ()) -> ElementsColumns:
+        message = f"can't read columns text={text} {attributes=} {properties=}"
+        return await self._safe_interact(AsyncReadColumnsListAction(self, text, attributes, properties),
+                                         message=message)
+
+
+class AsyncTable(AsyncElements):
+    """Class reads the whole table by one DOM round-trip, locator selects the table rows."""
+
+    async def rows(self) -> List[List[str]]:
+        return await self._safe_interact(AsyncReadTableAction(self), message="can't read table rows")
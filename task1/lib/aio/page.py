@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Hashable, List, NoReturn, Optional, Union
+
+from selenium.common.exceptions import JavascriptException
+
+from .client import AsyncWebDriver, AsyncWebElement
+from ..constants import Const, Times
+from ..pages.readiness import PAGE_STATE_SCRIPT, PageIsStable
+
+
+class AsyncPage:
+    """Base class for async page object model. Constructor can't wait, so the page is opened by:
+
+    page = await SomePage.open(driver)
+    """
+
+    _URL: str
+
+    def __init__(self, driver: AsyncWebDriver) -> None:
+        self._driver = driver
+        # found web elements by locator, they are reused until they become stale or the page is reloaded
+        self._element_cache: Dict[Hashable, Union[AsyncWebElement, List[AsyncWebElement]]] = {}
+
+    @classmethod
+    async def open(cls, driver: AsyncWebDriver) -> "AsyncPage":
+        page = cls(driver)
+        await page.navigate(page._URL)
+        return page
+
+    async def navigate(self, url: str) -> None:
+        logging.info(f"Calling async driver.get('{url}')...")
+        self.clear_element_cache()
+        await self._driver.get(url)
+        logging.info("Finished calling async driver.get()...")
+        await self._post_init()
+
+    async def _post_init(self) -> None:
+        await self.sanity_check()
+        await self.wait_until_ready()
+
+    async def sanity_check(self) -> Optional[NoReturn]:
+        """Simplest test that checks is web page loading."""
+        deadline = time.time() + Const.ELEMENT_WAIT_TIMEOUT
+        while await self._driver.current_url() != self._URL:
+            if time.time() > deadline:
+                raise AssertionError(f'Error, Sanity check URL={self._URL} failed!')
+            await asyncio.sleep(Const.POLL_FREQUENCY)
+
+    async def wait_until_ready(self, timeout: float = Times.TEN_SECONDS) -> bool:
+        """Same as Page.wait_until_ready(), returns as soon as the page is stable."""
+        condition = PageIsStable(Const.NETWORK_IDLE_TIME, Const.DOM_QUIET_TIME)
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if condition.is_stable(await self._driver.execute_script(PAGE_STATE_SCRIPT)):
+                    return True
+            except JavascriptException:
+                # document is being replaced by navigation
+                pass
+            await asyncio.sleep(Const.READINESS_POLL_FREQUENCY)
+        logging.warning(f"Page '{self._URL}' is not stable after {timeout} sec, continue...")
+        return False
+
+    @property
+    def driver(self) -> AsyncWebDriver:
+        return self._driver
+
+    @property
+    def element_cache(self) -> Dict[Hashable, Union[AsyncWebElement, List[AsyncWebElement]]]:
+        return self._element_cache
+
+    def clear_element_cache(self) -> None:
+        self._element_cache.clear()
+
+    async def title(self) -> str:
+        return await self._driver.title()
+
+    async def refresh(self) -> None:
+        self.clear_element_cache()
+        await self._driver.refresh()
+        await self.wait_until_ready()
@@ -0,0 +1,42 @@
+import logging
+from typing import List, Optional, NoReturn
+
+from selenium.common.exceptions import TimeoutException
+
+from .client import AsyncWebDriver
+from .elements import AsyncElement, AsyncTable
+from .page import AsyncPage
+from ..constants import Times
+from ..locators.locators_programming_language import ProgrammingLanguagesLocators
+from ..pages.page_programming_languages import WebsiteRow, parse_websites_rows
+
+
+class AsyncProgrammingLanguagePage(AsyncPage):
+    _locs = ProgrammingLanguagesLocators
+    _sanity = AsyncElement(ProgrammingLanguagesLocators.PROGRAMMING_LANGUAGES_SANITY_ELEMENT)
+    _all_websites_table = AsyncTable(ProgrammingLanguagesLocators.ALL_WEBSITES_TABLE_ROWS, timeout=Times.TEN_SECONDS)
+
+    def __init__(self, driver: AsyncWebDriver, url: Optional[str] = None) -> None:
+        super().__init__(driver)
+        # any page with the same table layout can be opened
+        _, default_url = self._locs.PROGRAMMING_LANGUAGES_URL
+        self._URL = url or default_url
+
+    @classmethod
+    async def open(cls, driver: AsyncWebDriver, url: Optional[str] = None) -> "AsyncProgrammingLanguagePage":
+        page = cls(driver, url)
+        await page.navigate(page._URL)
+        return page
+
+    async def sanity_check(self) -> Optional[NoReturn]:
+        await super().sanity_check()
+        logging.info("Start waiting sanity element on programming languages page...")
+        await self._sanity.wait_on_page()
+        logging.info("Finished waiting sanity element on programming languages page...")
+
+    async def get_all_websites_rows(self) -> List[WebsiteRow]:
+        """Reads all rows of the websites table by one DOM round-trip and parses them."""
+        try:
+            return parse_websites_rows(await self._all_websites_table.rows())
+        except TimeoutException:
+            return []
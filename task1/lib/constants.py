@@ -8,7 +8,25 @@ class Const:
     """Constants storage class."""
     ELEMENT_WAIT_TIMEOUT: int = 60
     POLL_FREQUENCY: float = 0.5  # faster frequency consume additional memory!
+    POLL_INITIAL_DELAY: float = 0.05  # first poll delay, it grows up to POLL_FREQUENCY
+    POLL_BACKOFF_FACTOR: float = 2.0
+    POLL_JITTER: float = 0.2  # random part of the poll delay, spreads polls of concurrent workers
+    POLL_MODE: str = "backoff"  # WebDriverWaitTill poll schedule: fixed, backoff, dom_mutation
     PROPERTY_VALUE: str = "value"
+    READINESS_POLL_FREQUENCY: float = 0.1
+    NETWORK_IDLE_TIME: float = 0.5  # no new resources loaded during this time - network is idle
+    DOM_QUIET_TIME: float = 0.3  # no DOM mutations during this time - page is rendered
+    DRIVER_POOL_SIZE: int = 1  # browser sessions per worker
+    DRIVER_MAX_USES: int = 50  # browser session is restarted after this count of tests
+    DRIVER_ACQUIRE_TIMEOUT: float = 300  # seconds, waiting for a free browser session of the pool
+    LOCATOR_CACHE_SIZE: int = 1024  # formatted locators per parametric Locator
+    TABLE_CHUNK_SIZE: int = 50  # table rows read by one script call when the table is streamed
+    TEST_RETRY_BUDGET: float = 120  # seconds, that all interactions of the test may spend on retries
+    PAGE_RETRY_BUDGET: float = 60  # seconds, that interactions with one page object may spend on retries
+    CIRCUIT_BREAKER_FAILURES: int = 3  # failed interactions in a row, that open the circuit of the locator
+    CIRCUIT_BREAKER_RESET_TIME: float = 30  # seconds, the open circuit fails interactions without trying
+    RETRY_BUDGET_REPORT_SIZE: int = 10
+    POPULARITY_THRESHOLDS: tuple = (10**7, 1.5 * 10**7, 5 * 10**7, 10**8, 5 * 10**8, 10**9, 1.5 * 10**9)
 
 
 class Url:
@@ -0,0 +1,191 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Generator, Any, Optional, NoReturn, Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .constants import Const
+from .launch_profile import LaunchProfile
+
+ABOUT_BLANK = "about:blank"
+CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+class DriverPoolError(Exception):
+    pass
+
+
+class DriverPool:
+    """Thread safe pool of pre-warmed browser sessions.
+    Every worker (thread, or pytest-xdist process with its own pool) acquires a session, uses it and releases it back.
+    Released session is reset (cookies, storage, about:blank) and recycled after max_uses tests.
+    """
+
+    def __init__(self,
+                 factory: Callable[[], WebDriver],
+                 size: int = Const.DRIVER_POOL_SIZE,
+                 max_uses: int = Const.DRIVER_MAX_USES,
+                 prewarm: bool = True) -> None:
+        if size < 1:
+            raise ValueError(f"Expected pool size >= 1, but actually {size=}")
+
+        self._factory: Callable[[], WebDriver] = factory
+        self._size: int = size
+        self._max_uses: int = max_uses
+        self._idle: "queue.LifoQueue[WebDriver]" = queue.LifoQueue()
+        self._uses: Dict[int, int] = {}  # id(driver): count of uses
+        self._created: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+        if prewarm:
+            self._prewarm()
+
+    def _prewarm(self) -> None:
+        logging.info(f"Starting {self._size} browser sessions...")
+        with self._lock:
+            count = self._size - self._created
+            self._created += count
+        with ThreadPoolExecutor(max_workers=self._size) as executor:
+            futures = [executor.submit(self._create) for _ in range(count)]
+        drivers, errors = [], []
+        for future in futures:
+            try:
+                drivers.append(future.result())
+            except Exception as err:
+                errors.append(err)
+        if errors:
+            # the pool is not created, so the sessions started by the other workers are quit, not leaked
+            for driver in drivers:
+                self._discard(driver)
+            raise errors[0]
+        for driver in drivers:
+            self._idle.put(driver)
+        logging.info("Finished starting browser sessions...")
+
+    def _reserve(self) -> bool:
+        """Takes the slot for a new session, so concurrent workers don't create more sessions than the size."""
+        with self._lock:
+            if self._created >= self._size:
+                return False
+            self._created += 1
+            return True
+
+    def _create(self) -> WebDriver:
+        """Starts the session in the reserved slot, the slot is freed when the start fails."""
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception as err:
+            logging.info(f"Can't quit browser session: {err}")
+
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        # dead browser raises not only WebDriverException, but connection errors of urllib3 as well
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> None:
+        driver.delete_all_cookies()
+        try:
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        except WebDriverException:
+            # storage is not accessible on some pages, for example about:blank
+            pass
+        driver.get(ABOUT_BLANK)
+
+    def acquire(self, timeout: Optional[float] = Const.DRIVER_ACQUIRE_TIMEOUT) -> Union[WebDriver, NoReturn]:
+        """Returns healthy browser session, waits for a released one when all sessions are busy."""
+        if self._closed:
+            raise DriverPoolError("Driver pool is closed")
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve():
+                    return self._create()
+                try:
+                    driver = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise DriverPoolError(f"No free browser session during {timeout} sec")
+
+            if self._is_healthy(driver):
+                return driver
+            logging.info("Browser session is not healthy, replacing...")
+            self._discard(driver)
+
+    def release(self, driver: WebDriver) -> None:
+        """Returns session to the pool, session is recycled after max_uses."""
+        with self._lock:
+            uses = self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self._closed or uses >= self._max_uses:
+            self._discard(driver)
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as err:
+            logging.info(f"Can't reset browser session, replacing: {err}")
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = Const.DRIVER_ACQUIRE_TIMEOUT) -> Generator[WebDriver, Any, None]:
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+class DriverPools:
+    """Pools of browser sessions, one pool per launch profile. Pool is created on the first request of its profile."""
+
+    def __init__(self, size: int = Const.DRIVER_POOL_SIZE, max_uses: int = Const.DRIVER_MAX_USES) -> None:
+        self._size: int = size
+        self._max_uses: int = max_uses
+        self._pools: Dict[LaunchProfile, DriverPool] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, profile: LaunchProfile) -> DriverPool:
+        with self._lock:
+            if profile not in self._pools:
+                self._pools[profile] = DriverPool(profile.create_driver, size=self._size, max_uses=self._max_uses)
+            return self._pools[profile]
+
+    def close(self) -> None:
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
@@ -1,14 +1,88 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, NoReturn, Dict, Any, TypeVar, Callable
+from dataclasses import dataclass, field
+from typing import List, Optional, Union, NoReturn, Dict, Any, TypeVar, Sequence
 
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException
 
 TypeElement = TypeVar('TypeElement', bound='Element')  # any subclass of Element
 
 
-class IncompleteListActionError(Exception):
-    pass
+# Reads text, attributes and DOM properties of all elements by one script call, result is columnar:
+# {"text": [...], "attributes": {name: [...]}, "properties": {name: [...]}}
+# Attributes are read like WebElement.get_attribute (selenium getAttribute atom): the property wins over the
+# markup value (resolved href/src, current value), boolean attributes are "true" or null.
+# Text is innerText: like WebElement.text it is the rendered text of the visible element, but the whitespace
+# is not normalized by the atom rules (only the whole text is trimmed).
+READ_COLUMNS_SCRIPT = """
+var elements = arguments[0], attributes = arguments[1], properties = arguments[2], withText = arguments[3];
+var BOOLEAN_ATTRIBUTES = ['allowfullscreen', 'allowpaymentrequest', 'allowusermedia', 'async', 'autofocus',
+    'autoplay', 'checked', 'compact', 'complete', 'controls', 'declare', 'default', 'defaultchecked',
+    'defaultselected', 'defer', 'disabled', 'ended', 'formnovalidate', 'hidden', 'indeterminate',
+    'iscontenteditable', 'ismap', 'itemscope', 'loop', 'multiple', 'muted', 'nohref', 'nomodule', 'noresize',
+    'noshade', 'novalidate', 'nowrap', 'open', 'paused', 'playsinline', 'pubdate', 'readonly', 'required',
+    'reversed', 'scoped', 'seamless', 'seeking', 'selected', 'truespeed', 'typemustmatch', 'willvalidate'];
+var PROPERTY_ALIASES = {'class': 'className', 'readonly': 'readOnly'};
+function isSelectable(element) {
+    var tag = element.tagName.toLowerCase();
+    return tag == 'option' || (tag == 'input' && (element.type == 'checkbox' || element.type == 'radio'));
+}
+function getAttribute(element, attribute) {
+    var name = attribute.toLowerCase(), value;
+    if (name == 'style') {
+        value = element.style;
+        return value && typeof value != 'string' ? value.cssText : value;
+    }
+    if ((name == 'selected' || name == 'checked') && isSelectable(element)) {
+        return (element.tagName.toLowerCase() == 'option' ? element.selected : element.checked) ? 'true' : null;
+    }
+    if ((element.tagName == 'IMG' && name == 'src') || (element.tagName == 'A' && name == 'href')) {
+        return element.getAttribute(name) ? element[name] : element.getAttribute(name);
+    }
+    if (name == 'spellcheck') {
+        value = element.getAttribute(name);
+        if (value !== null && (value.toLowerCase() == 'false' || value.toLowerCase() == 'true')) {
+            return value.toLowerCase();
+        }
+        return String(element.spellcheck);
+    }
+    var propertyName = PROPERTY_ALIASES[attribute] || attribute;
+    if (BOOLEAN_ATTRIBUTES.indexOf(name) >= 0) {
+        return element.getAttribute(attribute) !== null || element[propertyName] ? 'true' : null;
+    }
+    var property;
+    try { property = element[propertyName]; } catch (error) {}
+    value = property == null || typeof property == 'object' || typeof property == 'function'
+        ? element.getAttribute(attribute) : property;
+    return value != null ? value.toString() : null;
+}
+var result = {text: null, attributes: {}, properties: {}};
+if (withText) {
+    result.text = elements.map(function (element) { return element.innerText.trim(); });
+}
+attributes.forEach(function (name) {
+    result.attributes[name] = elements.map(function (element) { return getAttribute(element, name); });
+});
+properties.forEach(function (name) {
+    result.properties[name] = elements.map(function (element) { return element[name]; });
+});
+return result;
+"""
+
+# Reads text of every cell from every row, result is the list of rows, every row is the list of cells text
+READ_TABLE_SCRIPT = """
+return arguments[0].map(function (row) {
+    return Array.prototype.map.call(row.cells, function (cell) { return cell.innerText.trim(); });
+});
+"""
+
+
+@dataclass
+class ElementsColumns:
+    """Columnar result of batch reading: one list of values per text/attribute/property, in elements order."""
+    text: Optional[List[str]] = None
+    attributes: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+    properties: Dict[str, List[Any]] = field(default_factory=dict)
 
 
 class Action(ABC):
@@ -24,37 +98,14 @@ class Action(ABC):
     def __call__(self):
         pass
 
-    def _continuable_read_list_action(self, method_name: str, *args) -> Any:
+    def _batch_read_list_action(self,
+                                text: bool = False,
+                                attributes: Sequence[str] = (),
+                                properties: Sequence[str] = ()) -> ElementsColumns:
         elements = self._owner.web_element if isinstance(self._owner.web_element, list) else [self._owner.web_element]
-        if self._owner.start_index >= len(elements):
-            # new elements list lesser than was previous
-            # read values from beginning of list
-            start_index = 0
-            self.debug_value = []
-        else:
-            # continue read values from list
-            start_index = self._owner.start_index
-            self.debug_value = self._owner.incomplete_result
-
-        for index, elm in enumerate(elements):
-            # skip values that were already read
-            if index < start_index:
-                continue
-
-            try:
-                attr = getattr(elm, method_name)
-                if isinstance(attr, Callable):
-                    # method
-                    self.debug_value.append(attr(*args))
-                else:
-                    # property
-                    self.debug_value.append(attr)
-            except (NoSuchElementException, StaleElementReferenceException) as err:
-                # save incomplete list and index to Element - for using these values in next reading attempt
-                self._owner.start_index = index
-                self._owner.incomplete_result = self.debug_value
-                raise IncompleteListActionError(f"{index=} {self.debug_value=} {err}")
-        return self.debug_value
+        result = self._owner._web_driver.execute_script(READ_COLUMNS_SCRIPT, elements,
+                                                        list(attributes), list(properties), text)
+        return ElementsColumns(result["text"], result["attributes"], result["properties"])
 
 
 class ClearAction(Action):
@@ -111,7 +162,12 @@ class IsOnPageAction(Action):
 
     def __call__(self) -> bool:
         self.debug_value = self._owner.web_element
-        return self.debug_value is not None
+        if self.debug_value is None:
+            return False
+        # cached web element could leave the DOM: the cheap command raises StaleElementReferenceException then,
+        # and the element is searched again
+        self.debug_value.is_enabled()
+        return True
 
 
 class GetLenAction(Action):
@@ -165,7 +221,8 @@ class ReadTextListAction(Action):
     """
 
     def __call__(self) -> List[str]:
-        return self._continuable_read_list_action("text")
+        self.debug_value = self._batch_read_list_action(text=True).text
+        return self.debug_value
 
 
 class GetAttributeAction(Action):
@@ -214,7 +271,8 @@ class ReadPropertyListAction(Action):
         self._prop_name = prop_name
 
     def __call__(self) -> List[str]:
-        return self._continuable_read_list_action("get_property", self._prop_name)
+        self.debug_value = self._batch_read_list_action(properties=[self._prop_name]).properties[self._prop_name]
+        return self.debug_value
 
 
 class ReadAttributeListAction(Action):
@@ -230,7 +288,48 @@ class ReadAttributeListAction(Action):
         self._attr_name = attr_name
 
     def __call__(self) -> List[str]:
-        return self._continuable_read_list_action("get_attribute", self._attr_name)
+        self.debug_value = self._batch_read_list_action(attributes=[self._attr_name]).attributes[self._attr_name]
+        return self.debug_value
+
+
+class ReadColumnsListAction(Action):
+    """This class works in a pair with Elements class. Reads text and any attributes and
+    properties from every element in self._owner.web_element list by one script call.
+    self._owner.web_element is the List[WebElement] - result of class Elements
+    returns ElementsColumns
+    """
+    __slots__ = "_text", "_attributes", "_properties"
+
+    def __init__(self, owner: TypeElement, text: bool, attributes: Sequence[str], properties: Sequence[str]) -> None:
+        super().__init__(owner)
+        self._text = text
+        self._attributes = attributes
+        self._properties = properties
+
+    def __call__(self) -> ElementsColumns:
+        self.debug_value = self._batch_read_list_action(self._text, self._attributes, self._properties)
+        return self.debug_value
+
+
+class ReadTableAction(Action):
+    """This class works in a pair with Table class. Reads text of every cell
+    from every row in self._owner.web_element list by one script call.
+    self._owner.web_element is the List[WebElement] - rows of the table
+    start, stop - slice of the rows, for reading the table by chunks
+    returns the list of rows, every row is the list of cell text strings
+    """
+    __slots__ = "_start", "_stop"
+
+    def __init__(self, owner: TypeElement, start: int = 0, stop: Optional[int] = None) -> None:
+        super().__init__(owner)
+        self._start = start
+        self._stop = stop
+
+    def __call__(self) -> List[List[str]]:
+        elements = self._owner.web_element if isinstance(self._owner.web_element, list) else [self._owner.web_element]
+        rows = elements[self._start:self._stop]
+        self.debug_value = self._owner._web_driver.execute_script(READ_TABLE_SCRIPT, rows) if rows else []
+        return self.debug_value
 
 
 class ClickByIndexElementsAction(Action):
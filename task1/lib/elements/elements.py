@@ -1,9 +1,11 @@
 import datetime
 import logging
 import time
-from typing import Tuple, Union, NoReturn, Optional, Any, List, Dict, TypeVar, Callable
+from typing import Tuple, Union, NoReturn, Optional, Any, List, Dict, TypeVar, Callable, Hashable, Sequence, Iterator
+from typing import ContextManager
 
 from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
@@ -17,41 +19,219 @@ from .actions import ClearAction, ClickAction, ReadTextAction, SendKeysAction, I
 from .actions import IsEnabledAction, ClickByIndexElementsAction, IsSelectedByIndexElementsAction, SubmitAction
 from .actions import WaitTextAction, IsSelectedAction, ReadTextListAction, GetAttributeAction, GetPropertyAction
 from .actions import WaitTextChangedAction, GetSizeAction, ReadPropertyListAction, ReadAttributeListAction
-from .actions import IncompleteListActionError, TypeElement
+from .actions import ReadColumnsListAction, ReadTableAction, ElementsColumns, TypeElement
 from .wait import IGNORED_EXCEPTIONS
+from .wait import BackoffSchedule
 from .wait import WebDriverWaitTill
-from ..constants import Const, Times
+from ..constants import Const
+from ..instrumentation import EventKind, recorder
 from ..locators.locator import Locator
+from ..retry_budget import RetryBudgetError, RetryScope, retry_budgets
 
 TypeAction = TypeVar('TypeAction', bound=Action)  # any subclass of Action
 TypePage = TypeVar('TypePage', bound='Page')  # any subclass of Page
 
-FIND_ELEMENT_INTERNAL_TIMEOUT = Times.TWO_SECONDS
+
+TypeParent = Union[WebElement, Tuple[str, str]]  # already found parent web element, or parent locator
+
+
+class StaleParentElementError(WebDriverException):
+    """Parent web element is stale, children can't be found in it. Parent should be found again."""
+    pass
+
+
+class ElementLocatedInParent:
+    """ Custom Expected Condition
+
+    An expectation for checking that an element is present inside the parent element.
+    parent is the found WebElement (the cheapest way), or the parent locator
+    locator is relative to the parent, for example (By.XPATH, "./td[2]")
+    returns - WebElement
+    """
+    __slots__ = "parent", "locator"
+
+    def __init__(self, parent: TypeParent, locator: Tuple[str, str]) -> None:
+        self.parent = parent
+        self.locator = locator
+
+    def _find_parent(self, driver: WebDriver) -> WebElement:
+        if isinstance(self.parent, WebElement):
+            return self.parent
+        return driver.find_element(*self.parent)
+
+    def _find(self, parent: WebElement) -> Union[WebElement, List[WebElement]]:
+        return parent.find_element(*self.locator)
+
+    def __call__(self, driver: WebDriver) -> Union[WebElement, List[WebElement], NoReturn]:
+        parent = self._find_parent(driver)
+        try:
+            return self._find(parent)
+        except StaleElementReferenceException as err:
+            if isinstance(self.parent, WebElement):
+                # waiting can't help - the same parent web element will be stale forever
+                raise StaleParentElementError(f"Stale parent {self.parent} of {self.locator}") from err
+            raise
+
+
+class ElementToBeClickableInParent(ElementLocatedInParent):
+    """ Custom Expected Condition
+
+    An expectation for checking that an element inside the parent element is visible and enabled.
+    returns - WebElement, or False while the element is not clickable yet
+    """
+
+    def _find(self, parent: WebElement) -> Union[WebElement, bool]:
+        # parent.parent is the driver of the parent web element
+        return expected_conditions.element_to_be_clickable(super()._find(parent))(parent.parent)
+
+
+class AllElementsLocatedInParent(ElementLocatedInParent):
+    """ Custom Expected Condition
+
+    An expectation for checking that there is at least one element inside the parent element.
+    returns - List[WebElement]
+    """
+
+    def _find(self, parent: WebElement) -> List[WebElement]:
+        elements = parent.find_elements(*self.locator)
+        if not elements:
+            raise NoSuchElementException(f"No such elements: {self.locator} in {self.parent}")
+        return elements
+
+
+FIND_FIRST_OF_LOCATORS_SCRIPT = """
+const locators = arguments[0];
+const root = arguments[1] || document;  // locators are relative to the parent element, if it is given
+function find(by, value) {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                .singleNodeValue;
+        case 'css selector': return root.querySelector(value);
+        case 'id': return root.querySelector('#' + CSS.escape(value));
+        case 'name': return root.querySelector('[name="' + CSS.escape(value) + '"]');
+        case 'class name': return root.getElementsByClassName(value)[0];
+        case 'tag name': return root.getElementsByTagName(value)[0];
+        case 'link text':
+            return Array.from(root.querySelectorAll('a[href], area[href]'))
+                .find(link => link.innerText.trim() === value);
+        case 'partial link text':
+            return Array.from(root.querySelectorAll('a[href], area[href]'))
+                .find(link => link.innerText.includes(value));
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+for (let index = 0; index < locators.length; index++) {
+    let element = null;
+    try {
+        element = find(locators[index][0], locators[index][1]);
+    } catch (error) {
+        // invalid selector finds nothing, the other locators are still checked
+        continue;
+    }
+    if (element) return [index, element];
+}
+return null;
+"""
+SCRIPT_LOCATOR_STRATEGIES = ("xpath", "css selector", "id", "name", "class name", "tag name",
+                             "link text", "partial link text")
+
+
+class OneOfElementsLocated:
+    """ Custom Expected Condition
+
+    An expectation for checking that at least one of the locators finds an element on a web page.
+    All locators are checked by one script call, the first matched locator wins.
+    locator is the single locator Tuple[str, str], or List[locator]
+    parent is the optional parent WebElement or the parent locator, locators are relative to it then
+    returns - the found WebElement
+    """
+    __slots__ = "locator", "parent"
+
+    def __init__(self, locator: Union[Tuple[str, str], List[Tuple[str, str]]],
+                 parent: Optional[TypeParent] = None) -> None:
+        self.locator: List[Tuple[str, str]] = locator if isinstance(locator, list) else [locator]
+        self.parent: Optional[TypeParent] = parent
+        unsupported = [by for by, _ in self.locator if by not in SCRIPT_LOCATOR_STRATEGIES]
+        if unsupported:
+            raise ValueError(f"Locator strategies {unsupported} can't be resolved by script,"
+                             f" expected one of {SCRIPT_LOCATOR_STRATEGIES}")
+
+    def _find_parent(self, driver: WebDriver) -> Optional[WebElement]:
+        if self.parent is None or isinstance(self.parent, WebElement):
+            return self.parent
+        return driver.find_element(*self.parent)
+
+    def _find_first(self, driver: WebDriver) -> Union[Tuple[int, WebElement], NoReturn]:
+        parent = self._find_parent(driver)
+        try:
+            result = driver.execute_script(FIND_FIRST_OF_LOCATORS_SCRIPT,
+                                           [list(locator) for locator in self.locator], parent)
+        except StaleElementReferenceException as err:
+            if isinstance(self.parent, WebElement):
+                # waiting can't help - the same parent web element will be stale forever
+                raise StaleParentElementError(f"Stale parent {self.parent} of {self.locator}") from err
+            raise NoSuchElementException(f"No such element: {self.locator}, {err.msg}") from err
+        except WebDriverException as err:
+            # like failed find_element of every locator: the wait keeps polling instead of aborting
+            raise NoSuchElementException(f"No such element: {self.locator}, {err.msg}") from err
+        if not result:
+            raise NoSuchElementException(f"No such element: {self.locator}")
+        index, web_element = result
+        return index, web_element
+
+    def __call__(self, driver: WebDriver) -> Union[WebElement, NoReturn]:
+        return self._find_first(driver)[1]
+
+
+class IndexOneOfElementsLocated(OneOfElementsLocated):
+    """ Custom Expected Condition
+
+     An expectation for checking that there is at least one element presents
+    on a web page.
+    locator is used to find the element - it is List[locator] = List[Tuple[str, str]]
+    returns - index of found element in the locators list
+    """
+
+    def __call__(self, driver: WebDriver) -> Union[str, NoReturn]:
+        return str(self._find_first(driver)[0])
 
 
 class Element:
-    """Base class for web page elements."""
+    """Base class for web page elements.
+    Element can be found inside the parent: Element((By.XPATH, "./td[2]"), parent=row_web_element)
+    """
 
-    __slots__ = ("_locator", "web_element", "_condition", "_timeout", "_web_driver", "_date")
+    __slots__ = ("_locator", "web_element", "_condition", "_timeout", "_web_driver", "_date", "_page", "_cache_key")
 
     # condition for WebDriverWait
     _default_condition = expected_conditions.presence_of_element_located
+    # condition for WebDriverWait, when the element is searched inside the parent
+    _scoped_condition = ElementLocatedInParent
+    # found web element is saved to the page element cache
+    _is_cacheable: bool = True
 
     def __init__(self, locator: Union[Tuple[str, str], List[Tuple[str, str]]],
                  timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
-                 date: Optional[datetime.datetime] = None
+                 date: Optional[datetime.datetime] = None,
+                 parent: Optional[TypeParent] = None
                  ) -> None:
 
         self._locator: Union[Tuple[str, str], List[Tuple[str, str]]] = locator
         self.web_element: Optional[WebElement] = None
         self._condition: Callable[[Union[Tuple[str, str], List[Tuple[str, str]]]],
-                                  Union[TypeElement, List[TypeElement]]] = self._init_condition(self._locator)
+                                  Union[TypeElement, List[TypeElement]]] = self._init_condition(self._locator, parent)
         self._timeout: int = timeout
         self._web_driver: Optional[WebDriver] = None
         self._date: Optional[datetime.datetime] = date
+        self._page: Optional[TypePage] = None
+        self._cache_key: Hashable = tuple(locator) if isinstance(locator, list) else locator
+        if parent is not None:
+            self._cache_key = (parent.id if isinstance(parent, WebElement) else parent, self._cache_key)
 
     @classmethod
-    def _init_condition(cls, locator: Union[Tuple[str, str], List[Tuple[str, str]]]
+    def _init_condition(cls, locator: Union[Tuple[str, str], List[Tuple[str, str]]],
+                        parent: Optional[TypeParent] = None
                         ) -> Callable[[Union[Tuple[str, str], List[Tuple[str, str]]]],
                                       Union[TypeElement, List[TypeElement]]]:
         if isinstance(locator, Locator) or (isinstance(locator, list) and locator and isinstance(locator[0], Locator)):
@@ -59,63 +239,109 @@ class Element:
                             f" Possibly locator uses formatted string literals {{}} or {{kwarg}}."
                             f" Check your Page class, usage example LOCATOR_ELEMENT(arg1, arg2,..., kwarg3=kwarg3,...)")
 
+        if parent is not None:
+            return cls._scoped_condition(parent, locator)
         return cls._default_condition(locator)
 
     def __get__(self, instance: TypePage, owner: Optional[TypePage] = None) -> TypeElement:
         """When we try to read data from class object, returns wrapped
          web element."""
+        self._page = instance
         self._web_driver = instance.driver
+        self.web_element = instance.element_cache.get(self._condition_cache_key) if self._is_cacheable else None
 
-        end_time = time.time() + self._timeout
+        if self.web_element is None:
+            with self._retry_scope() as scope:
+                self._find_element(scope.deadline)
+        return self
+
+    @property
+    def _condition_cache_key(self) -> Hashable:
+        """Web element found by one condition doesn't satisfy the other one (present element is not clickable yet),
+        so cached web elements are shared only between elements with the same condition.
+        Condition is read here, not in __init__, because subclasses replace it after super().__init__()."""
+        condition = self._condition
+        return getattr(condition, "__qualname__", type(condition).__qualname__), self._cache_key
+
+    def _retry_scope(self) -> ContextManager[RetryScope]:
+        """Deadline of the interaction is limited by the retry budgets of the test and of the page,
+        locators that keep failing are failed fast by the circuit breaker."""
+        # the key has the parent: the same relative locator of cells in other rows has its own circuit
+        return retry_budgets.scope(str(self._cache_key), self._timeout, getattr(self._page, "retry_budget", None))
+
+    def _set_web_element(self, web_element: Optional[Union[WebElement, List[WebElement]]]) -> None:
+        self.web_element = web_element
+        if not self._is_cacheable or self._page is None:
+            return
+        if web_element is None:
+            self._page.element_cache.pop(self._condition_cache_key, None)
+        else:
+            self._page.element_cache[self._condition_cache_key] = web_element
+
+    def _find_element(self, deadline: Optional[float] = None) -> Optional[NoReturn]:
+        """Single lookup loop: polls expected condition (for example element is loaded and located)
+        with exponential backoff until the deadline."""
+        if deadline is None:
+            deadline = time.time() + self._timeout
+
+        schedule = BackoffSchedule()
         while True:
             try:
-                self._find_element()
+                with recorder.span(EventKind.POLL, "find_element", self._locator):
+                    web_element = self._condition(self._web_driver)
+                if web_element:
+                    self._set_web_element(web_element)
+                    return
+            except IGNORED_EXCEPTIONS as err:
+                recorder.record_now(EventKind.RETRY, err.__class__.__name__, self._locator)
+            retry_budgets.record_failure()
+            if not schedule.sleep(deadline):
                 break
-            except (*IGNORED_EXCEPTIONS, TimeoutException):
-                if time.time() > end_time:
-                    raise
-            time.sleep(Const.POLL_FREQUENCY)
 
-        return self
-
-    def _find_element(self) -> Optional[NoReturn]:
-        # wait until expected condition (for example element is loaded and located)
-        wait = WebDriverWaitTill(driver=self._web_driver,
-                                 timeout=FIND_ELEMENT_INTERNAL_TIMEOUT,
-                                 poll_frequency=Const.POLL_FREQUENCY,
-                                 ignored_exceptions=IGNORED_EXCEPTIONS,
-                                 date=self._date)
-
-        try:
-            self.web_element = wait.until(self._condition)
-        except TimeoutException:
-            err_message = (f"No such element: {self.__class__.__name__}, locator={self._locator},"
-                           f" condition={self._condition}, timeout={self._timeout}")
-            raise TimeoutException(err_message)
+        recorder.record_now(EventKind.TIMEOUT, "find_element", self._locator)
+        err_message = (f"No such element: {self.__class__.__name__}, locator={self._locator},"
+                       f" condition={self._condition}, timeout={self._timeout}")
+        raise TimeoutException(err_message)
 
     def _safe_interact(self,
                        action: TypeAction,
                        message: str = '') -> Union[Any, NoReturn]:
         """Try rerun action() again and again, while it will be done,
         because DOM could change suddenly, and the result may be reached far from
-        the first attempt."""
-
-        end_time = time.time() + self._timeout
-        while True:
-            try:
-                self._find_element()
-                return action()
-            except (*IGNORED_EXCEPTIONS, TimeoutException):
-                pass
-            time.sleep(Const.POLL_FREQUENCY)
-            if time.time() > end_time:
-                break
-        message_text = ""
-        if message:
-            message_text = (f"Timeout expired, '{self.__class__.__name__}', locator={self._locator}, {self.web_element}"
-                            f", {message} {action.debug_value}.")
-            logging.info(message_text)
-        raise TimeoutException(message_text)
+        the first attempt. Cached web element is searched again only when it is stale."""
+
+        return self._retry_action(action, message)
+
+    def _retry_action(self,
+                      action: TypeAction,
+                      message: str = '') -> Union[Any, NoReturn]:
+        """Reruns action() with backoff until the deadline of the retry scope."""
+        schedule = BackoffSchedule()
+        with recorder.span(EventKind.ACTION, action.__class__.__name__, self._locator):
+            with self._retry_scope() as scope:
+                while True:
+                    try:
+                        if self.web_element is None:
+                            self._find_element(scope.deadline)
+                        return action()
+                    except RetryBudgetError:
+                        raise
+                    except StaleElementReferenceException as err:
+                        recorder.record_now(EventKind.RETRY, err.__class__.__name__)
+                        self._set_web_element(None)
+                    except (*IGNORED_EXCEPTIONS, TimeoutException) as err:
+                        recorder.record_now(EventKind.RETRY, err.__class__.__name__)
+                    retry_budgets.record_failure()
+                    if schedule.sleep(scope.deadline):
+                        continue
+
+                    recorder.record_now(EventKind.TIMEOUT, action.__class__.__name__)
+                    message_text = ""
+                    if message:
+                        message_text = (f"Timeout expired, '{self.__class__.__name__}', locator={self._locator}, "
+                                        f"{self.web_element}, {message} {action.debug_value}.")
+                        logging.info(message_text)
+                    raise TimeoutException(message_text)
 
     def _click(self) -> Optional[NoReturn]:
         message = "can't click"
@@ -211,10 +437,12 @@ class Element:
 
 class Button(Element):
 
-    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[[Tuple[str, str]],
-                                  TypeElement] = expected_conditions.element_to_be_clickable(self._locator)
+    _default_condition = expected_conditions.element_to_be_clickable
+    _scoped_condition = ElementToBeClickableInParent
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
 
     @property
     def text(self) -> str:
@@ -268,10 +496,12 @@ class Checkbox(Element):
         </div>
     """
 
-    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[[Tuple[str, str]],
-                                  TypeElement] = expected_conditions.element_to_be_clickable(self._locator)
+    _default_condition = expected_conditions.element_to_be_clickable
+    _scoped_condition = ElementToBeClickableInParent
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
 
     @property
     def text(self) -> str:
@@ -317,15 +547,20 @@ class Field(Element):
 
 
 class ClickableField(Field):
-    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[[Tuple[str, str]],
-                                  TypeElement] = expected_conditions.element_to_be_clickable(self._locator)
+    _default_condition = expected_conditions.element_to_be_clickable
+    _scoped_condition = ElementToBeClickableInParent
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
 
 
 class NoElementPresent(Element):
     """Class for element that shouldn't be on page. If the element appears -
-    something is going wrong."""
+    something is going wrong.
+    locator can be List[locator]: none of the elements should appear, all of them are checked by one script."""
+
+    _default_condition = OneOfElementsLocated
 
     def __get__(self, instance: TypePage, owner: Optional[TypePage] = None) -> bool:
         web_driver = instance.driver  # type: WebDriver
@@ -341,10 +576,12 @@ class NoElementPresent(Element):
 class Link(Element):
     """Class for Hyperlinks"""
 
-    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[[Tuple[str, str]],
-                                  TypeElement] = expected_conditions.element_to_be_clickable(self._locator)
+    _default_condition = expected_conditions.element_to_be_clickable
+    _scoped_condition = ElementToBeClickableInParent
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
 
     def click(self) -> None:
         self._click()
@@ -360,45 +597,20 @@ class Link(Element):
 class Elements(Element):
     """Class works with a group of elements selected by one locator"""
 
-    __slots__ = ("incomplete_result", "start_index")
+    __slots__ = ()
     _default_condition = expected_conditions.presence_of_all_elements_located
-
-    def __init__(self, locator: Union[Tuple[str, str], List[Tuple[str, str]]],
-                 timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
-                 date: Optional[datetime.datetime] = None
-                 ) -> None:
-        super().__init__(locator, timeout, date)
-        self.incomplete_result: List[str] = []
-        self.start_index: int = 0
+    _scoped_condition = AllElementsLocatedInParent
+    # count of elements could be changed, so the list is searched on every access
+    _is_cacheable = False
 
     def _safe_list_interact(self,
                             action: TypeAction,
                             message: str = '') -> Union[Any, NoReturn]:
         """Try rerun action() again and again, while it will be done,
         because DOM could change suddenly, and the result may be reached far from
-        the first attempt."""
+        the first attempt. Every list is read by one script call, so stale list is read again from scratch."""
 
-        # reinit vars for processing result before starting interaction
-        self.start_index = 0
-        self.incomplete_result = []
-
-        end_time = time.time() + self._timeout
-        while True:
-            try:
-                self._find_element()
-                return action()
-            except (*IGNORED_EXCEPTIONS, TimeoutException, IncompleteListActionError):
-                pass
-
-            time.sleep(Const.POLL_FREQUENCY)
-            if time.time() > end_time:
-                break
-        message_text = ""
-        if message:
-            message_text = (f"Timeout expired, '{self.__class__.__name__}', locator={self._locator}, {self.web_element}"
-                            f", {message} {action.debug_value}.")
-            logging.info(message_text)
-        raise TimeoutException(message_text)
+        return self._retry_action(action, message)
 
     def _get_text_list(self) -> Union[List[str], NoReturn]:
         message = "can't read text list"
@@ -412,6 +624,13 @@ class Elements(Element):
         message = f"can't read attr '{attr_name}' list"
         return self._safe_list_interact(ReadAttributeListAction(self, attr_name), message=message)
 
+    def _read_columns(self,
+                      text: bool,
+                      attributes: Sequence[str],
+                      properties: Sequence[str]) -> Union[ElementsColumns, NoReturn]:
+        message = f"can't read columns text={text} {attributes=} {properties=}"
+        return self._safe_list_interact(ReadColumnsListAction(self, text, attributes, properties), message=message)
+
     @property
     def length(self) -> int:
         return self._get_len()
@@ -426,6 +645,14 @@ class Elements(Element):
     def get_attribute_list(self, attr_name: str) -> List[str]:
         return self._get_attribute_list(attr_name)
 
+    def read_columns(self,
+                     text: bool = False,
+                     attributes: Sequence[str] = (),
+                     properties: Sequence[str] = ()) -> ElementsColumns:
+        """Reads text, attributes and properties of all elements at once,
+        for example read_columns(text=True, attributes=["href", "title"])"""
+        return self._read_columns(text, attributes, properties)
+
     def click_by_index(self, index: int) -> None:
         self._click_by_index_elements(index)
 
@@ -433,6 +660,33 @@ class Elements(Element):
         return self._is_selected_by_index_elements(index)
 
 
+class Table(Elements):
+    """Class reads the whole table by one DOM round-trip.
+    locator selects the table rows, for example "//table[1]//tbody//tr"
+    """
+
+    __slots__ = ()
+
+    def _get_rows(self, start: int = 0, stop: Optional[int] = None) -> Union[List[List[str]], NoReturn]:
+        message = f"can't read table rows [{start}:{stop}]"
+        return self._safe_list_interact(ReadTableAction(self, start, stop), message=message)
+
+    @property
+    def rows(self) -> List[List[str]]:
+        return self._get_rows()
+
+    def iter_rows(self, chunk_size: int = Const.TABLE_CHUNK_SIZE) -> Iterator[List[str]]:
+        """Yields rows as they are read, one script call per chunk_size rows.
+        Row elements are still found at once by one find_elements call, only reading of the cells is chunked."""
+        start = 0
+        while True:
+            chunk = self._get_rows(start, start + chunk_size)
+            if not chunk:
+                return
+            yield from chunk
+            start += chunk_size
+
+
 class TableCell(Element):
 
     @property
@@ -464,10 +718,12 @@ class ElementPresentTillDate(Element):
 
 class MenuItem(Element):
 
-    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[[Tuple[str, str]],
-                                  TypeElement] = expected_conditions.element_to_be_clickable(self._locator)
+    _default_condition = expected_conditions.element_to_be_clickable
+    _scoped_condition = ElementToBeClickableInParent
+
+    def __init__(self, locator: Tuple[str, str], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
 
     def click(self) -> None:
         self._click()
@@ -494,8 +750,11 @@ class Slider(Element):
 class ElementThatWillDisappear(Element):
     """Class for element that presents on page, and later that element should
      disappear during the timeout.
+     locator can be List[locator]: all of the elements should disappear.
      """
 
+    _default_condition = OneOfElementsLocated
+
     def __get__(self, instance: TypePage, owner: Optional[TypePage] = None) -> bool:
         web_driver = instance.driver  # type: WebDriver
 
@@ -507,32 +766,6 @@ class ElementThatWillDisappear(Element):
         return wait.until_not(self._condition)
 
 
-class IndexOneOfElementsLocated:
-    """ Custom Expected Condition
-
-     An expectation for checking that there is at least one element presents
-    on a web page.
-    locator is used to find the element - it is List[locator] = List[Tuple[str, str]]
-    returns - index of found element in the locators list
-    """
-    __slots__ = "locator"
-
-    def __init__(self, locator: List[Tuple[str, str]]) -> None:
-        self.locator = locator
-
-    def __call__(self, driver: WebDriver) -> Union[str, NoReturn]:
-        for num, locator in enumerate(self.locator):
-            result = None
-            try:
-                result = driver.find_element(*locator)
-                time.sleep(Const.POLL_FREQUENCY)
-            except (NoSuchElementException, WebDriverException):
-                pass
-            if result:
-                return str(num)
-        raise NoSuchElementException(f"No such element: {self.locator}")
-
-
 class PolymorphicElement(Element):
     """ Class for element that can be various types in the same place in UI.
     For example parameters in the profile edit window can be 6 different types:
@@ -545,9 +778,10 @@ class PolymorphicElement(Element):
     element present on page
     """
 
-    def __init__(self, locator: List[Tuple[str, str]], timeout: int = Const.ELEMENT_WAIT_TIMEOUT) -> None:
-        super().__init__(locator, timeout=timeout)
-        self._condition: Callable[..., str] = IndexOneOfElementsLocated(self._locator)
+    def __init__(self, locator: List[Tuple[str, str]], timeout: int = Const.ELEMENT_WAIT_TIMEOUT,
+                 parent: Optional[TypeParent] = None) -> None:
+        super().__init__(locator, timeout=timeout, parent=parent)
+        self._condition: Callable[..., str] = IndexOneOfElementsLocated(self._locator, parent)
 
     def __get__(self, instance: TypePage, owner: Optional[TypePage] = None) -> Union[int, NoReturn]:
         web_driver = instance.driver  # type: WebDriver
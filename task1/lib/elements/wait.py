@@ -1,18 +1,22 @@
 import datetime
 import logging
+import random
 import time
 
-from typing import Callable, Optional, Tuple, Union, List
+from typing import Any, Callable, Optional, Tuple, Union, List
 
 from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 
 from ..constants import Const
+from ..instrumentation import EventKind, recorder
 from .actions import TypeElement
 
 
@@ -22,18 +26,178 @@ IGNORED_EXCEPTIONS = (NoSuchElementException,
                       StaleElementReferenceException)
 
 
+DOM_MUTATION_SCRIPT = """
+const timeout = arguments[0], done = arguments[arguments.length - 1];
+const observer = new MutationObserver(() => finish(true));
+const timer = setTimeout(() => finish(false), timeout);
+function finish(mutated) {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(mutated);
+}
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+
+class PollSchedule:
+    """Base poll schedule: fixed delay between polls.
+    The last delay never exceeds the deadline, so the final poll happens right at the deadline."""
+    __slots__ = "_delay"
+
+    def __init__(self, delay: float = Const.POLL_FREQUENCY) -> None:
+        self._delay: float = delay
+
+    def reset(self) -> None:
+        pass
+
+    def next_delay(self) -> float:
+        return self._delay
+
+    def delay_until(self, deadline: float) -> Optional[float]:
+        """Returns the next delay, or None when deadline is expired."""
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        return min(self.next_delay(), remaining)
+
+    def sleep(self, deadline: float) -> bool:
+        """Sleeps the next delay. Returns False without sleeping when deadline is expired."""
+        delay = self.delay_until(deadline)
+        if delay is None:
+            return False
+        recorder.sleep(delay)
+        return True
+
+
+class BackoffSchedule(PollSchedule):
+    """Poll schedule: delay starts from initial and grows exponentially up to maximum,
+    every delay has a random jitter. The last delay never exceeds the deadline."""
+    __slots__ = "_initial", "_maximum", "_factor", "_jitter"
+
+    def __init__(self,
+                 initial: float = Const.POLL_INITIAL_DELAY,
+                 maximum: float = Const.POLL_FREQUENCY,
+                 factor: float = Const.POLL_BACKOFF_FACTOR,
+                 jitter: float = Const.POLL_JITTER) -> None:
+        super().__init__(initial)
+        self._initial: float = initial
+        self._maximum: float = maximum
+        self._factor: float = factor
+        self._jitter: float = jitter
+
+    def reset(self) -> None:
+        self._delay = self._initial
+
+    def next_delay(self) -> float:
+        delay = self._delay * (1 + random.uniform(-self._jitter, self._jitter))
+        self._delay = min(self._delay * self._factor, self._maximum)
+        return delay
+
+
+class DomMutationSchedule(BackoffSchedule):
+    """Event driven poll schedule: instead of sleeping, blocks in the browser until the DOM is changed
+    (or the maximum delay is expired) - condition is checked again right after the page changes.
+    Backoff delays are the floor between polls, so the continuously changing DOM doesn't make the busy polling.
+    If the browser can't run the observer, the schedule falls back to the plain backoff sleep."""
+    __slots__ = "_driver", "_fallback"
+
+    def __init__(self, driver: WebDriver, maximum: float = Const.POLL_FREQUENCY) -> None:
+        super().__init__(maximum=maximum)
+        self._driver: WebDriver = driver
+        self._fallback: bool = False
+
+    def sleep(self, deadline: float) -> bool:
+        if self._fallback:
+            return super().sleep(deadline)
+        floor = self.delay_until(deadline)
+        if floor is None:
+            return False
+        start = time.time()
+        try:
+            with recorder.span(EventKind.SLEEP, "dom_mutation"):
+                self._driver.execute_async_script(DOM_MUTATION_SCRIPT,
+                                                  int(min(self._maximum, deadline - start) * 1000))
+        except WebDriverException as err:
+            logging.info(f"DOM mutation wait is not available, fallback to backoff polling: {err.msg}")
+            self._fallback = True
+        remaining = min(floor - (time.time() - start), deadline - time.time())
+        if remaining > 0:
+            recorder.sleep(remaining)
+        return True
+
+
+class PollMode:
+    FIXED: str = "fixed"
+    BACKOFF: str = "backoff"
+    DOM_MUTATION: str = "dom_mutation"
+
+
+def poll_schedule(mode: str, driver: WebDriver, poll_frequency: float = Const.POLL_FREQUENCY) -> PollSchedule:
+    """Creates the poll schedule by PollMode, poll_frequency is the longest delay between polls."""
+    if mode == PollMode.FIXED:
+        return PollSchedule(poll_frequency)
+    if mode == PollMode.BACKOFF:
+        return BackoffSchedule(maximum=poll_frequency)
+    if mode == PollMode.DOM_MUTATION:
+        return DomMutationSchedule(driver, maximum=poll_frequency)
+    raise ValueError(f"Unknown poll mode '{mode}', expected one of: "
+                     f"{PollMode.FIXED}, {PollMode.BACKOFF}, {PollMode.DOM_MUTATION}")
+
+
 class WebDriverWaitTill(WebDriverWait):
-    """Class extends selenium WebDriverWait."""
-    __slots__ = "_date"
+    """Class extends selenium WebDriverWait: polls are spaced by the pluggable poll schedule
+    (fast-start backoff by default) instead of the fixed poll_frequency."""
+    __slots__ = "_date", "_schedule"
 
     def __init__(self,
                  driver: WebDriver,
                  timeout: int,
                  poll_frequency: float = Const.POLL_FREQUENCY,
                  ignored_exceptions: Optional[Tuple[Exception]] = None,
-                 date: Optional[datetime.datetime] = None) -> None:
+                 date: Optional[datetime.datetime] = None,
+                 poll_mode: str = Const.POLL_MODE) -> None:
         super().__init__(driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=ignored_exceptions)
         self._date: Optional[datetime.datetime] = date
+        self._schedule: PollSchedule = poll_schedule(poll_mode, driver, self._poll)
+
+    def _poll_once(self, method: Callable[[WebDriver], Any]) -> Any:
+        try:
+            with recorder.span(EventKind.POLL, method.__class__.__name__):
+                return method(self._driver)
+        except self._ignored_exceptions as err:
+            recorder.record_now(EventKind.RETRY, err.__class__.__name__)
+            return None
+
+    def until(self, method: Callable[[WebDriver], Any], message: str = "") -> Any:
+        """Same as WebDriverWait.until, but spaced by the poll schedule."""
+        deadline = time.time() + self._timeout
+        self._schedule.reset()
+        while True:
+            value = self._poll_once(method)
+            if value:
+                return value
+            if not self._schedule.sleep(deadline):
+                break
+        recorder.record_now(EventKind.TIMEOUT, "until")
+        raise TimeoutException(message)
+
+    def until_not(self, method: Callable[[WebDriver], Any], message: str = "") -> Any:
+        """Same as WebDriverWait.until_not, but spaced by the poll schedule.
+        Ignored exceptions mean the condition is false."""
+        deadline = time.time() + self._timeout
+        self._schedule.reset()
+        while True:
+            try:
+                with recorder.span(EventKind.POLL, method.__class__.__name__):
+                    value = method(self._driver)
+                if not value:
+                    return value
+            except self._ignored_exceptions:
+                return True
+            if not self._schedule.sleep(deadline):
+                break
+        recorder.record_now(EventKind.TIMEOUT, "until_not")
+        raise TimeoutException(message)
 
     def till(self, method: Callable[[Union[Tuple[str, str], List[Tuple[str, str]]]],
                                     Union[TypeElement, List[TypeElement]]]) -> bool:
@@ -41,17 +205,14 @@ class WebDriverWaitTill(WebDriverWait):
         return value is not True. If method's value is True - returns False.
         When timeout expired return True."""
 
-        end_time = time.time() + self._timeout
+        deadline = time.time() + self._timeout
+        self._schedule.reset()
         while True:
-            try:
-                value = method(self._driver)
-                if value:
-                    return False
-            except self._ignored_exceptions:
-                pass
-            time.sleep(self._poll)
-            if time.time() > end_time:
+            if self._poll_once(method):
+                return False
+            if not self._schedule.sleep(deadline):
                 break
+        recorder.record_now(EventKind.TIMEOUT, "till")
         return True
 
     def till_date(self, method: Callable[[Union[Tuple[str, str], List[Tuple[str, str]]]],
@@ -63,15 +224,16 @@ class WebDriverWaitTill(WebDriverWait):
         date_str = self._date.strftime('%Y-%m-%d %H:%M:%S')
         logging.info(f"Waiting till '{date_str}'")
 
+        deadline = self._date.timestamp()
+        self._schedule.reset()
         while True:
-            try:
-                success = method(self._driver)
-            except self._ignored_exceptions:
-                success = False
+            success = self._poll_once(method)
 
             if datetime.datetime.now() >= self._date:
+                recorder.record_now(EventKind.TIMEOUT, "till_date")
                 return True
 
             if not success:
                 return False
-            time.sleep(self._poll)
+            # the schedule never sleeps past the date, so the final poll happens right at the date
+            self._schedule.sleep(deadline)
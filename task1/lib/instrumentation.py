@@ -0,0 +1,168 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class EventKind:
+    COMMAND: str = "command"  # WebDriver HTTP command
+    ACTION: str = "action"  # element action, including its retries
+    POLL: str = "poll"  # one check of the wait condition
+    RETRY: str = "retry"  # failed attempt, name is the exception
+    SLEEP: str = "sleep"
+    TIMEOUT: str = "timeout"
+    PAGE: str = "page"  # page loading and readiness
+
+
+@dataclass
+class Event:
+    kind: str
+    name: str
+    start: float  # seconds from the test start
+    duration: float  # seconds
+    locator: Optional[str]
+    stack: Tuple[str, ...]  # names of the outer spans
+
+
+_stack: ContextVar[Tuple[str, ...]] = ContextVar("instrumentation_stack", default=())
+_locator: ContextVar[Optional[str]] = ContextVar("instrumentation_locator", default=None)
+_paused: ContextVar[bool] = ContextVar("instrumentation_paused", default=False)
+_NO_SPAN = nullcontext()
+
+
+class Recorder:
+    """Records timings of the hot path (WebDriver commands, polls, retries, sleeps, timeouts) of the current test.
+    Disabled recorder costs one attribute check per call: span() returns the shared no-op context manager."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self._events: List[Event] = []
+        self._origin: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+        # totals of the whole session for the terminal summary: (kind, name or locator) -> [count, duration]
+        self.totals_by_locator: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        self.totals_by_action: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+
+    def start(self) -> None:
+        with self._lock:
+            self._events = []
+            self._origin = time.perf_counter()
+
+    def stop(self) -> List[Event]:
+        with self._lock:
+            events, self._events = self._events, []
+        for event in events:
+            if event.kind == EventKind.ACTION or event.kind == EventKind.COMMAND:
+                totals = self.totals_by_action[f"{event.kind}:{event.name}"]
+                totals[0] += 1
+                totals[1] += event.duration
+            if event.kind == EventKind.ACTION and event.locator:
+                totals = self.totals_by_locator[event.locator]
+                totals[0] += 1
+                totals[1] += event.duration
+        return events
+
+    def merge_totals(self, totals_by_locator: Dict[str, List[float]], totals_by_action: Dict[str, List[float]]) -> None:
+        """Adds totals of the other recorder, for example of the pytest-xdist worker."""
+        for own, other in ((self.totals_by_locator, totals_by_locator), (self.totals_by_action, totals_by_action)):
+            for name, (count, duration) in other.items():
+                totals = own[name]
+                totals[0] += count
+                totals[1] += duration
+
+    @contextmanager
+    def paused(self) -> Generator[None, Any, None]:
+        """Commands inside are not recorded, for example the browser reset after the test."""
+        token = _paused.set(True)
+        try:
+            yield
+        finally:
+            _paused.reset(token)
+
+    def record(self, kind: str, name: str, start: float, duration: float, locator: Optional[Any] = None) -> None:
+        if not self.enabled or _paused.get():
+            return
+        locator = str(locator) if locator is not None else _locator.get()
+        event = Event(kind, name, start - self._origin, duration, locator, _stack.get())
+        with self._lock:
+            self._events.append(event)
+
+    def record_now(self, kind: str, name: str, locator: Optional[Any] = None) -> None:
+        """Records the instant event, for example timeout."""
+        self.record(kind, name, time.perf_counter(), 0.0, locator)
+
+    def span(self, kind: str, name: str, locator: Optional[Any] = None) -> AbstractContextManager:
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(kind, name, locator)
+
+    @contextmanager
+    def _span(self, kind: str, name: str, locator: Optional[Any]) -> Generator[None, Any, None]:
+        locator_token = _locator.set(str(locator)) if locator is not None else None
+        stack_token = _stack.set(_stack.get() + (f"{kind}:{name}",))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            _stack.reset(stack_token)
+            self.record(kind, name, start, duration)
+            if locator_token is not None:
+                _locator.reset(locator_token)
+
+    def sleep(self, seconds: float) -> None:
+        start = time.perf_counter()
+        time.sleep(seconds)
+        self.record(EventKind.SLEEP, "sleep", start, time.perf_counter() - start)
+
+    def attach(self, driver: WebDriver) -> WebDriver:
+        """Wraps driver.execute, so every WebDriver command is recorded. Safe to call more than once."""
+        if getattr(driver, "_instrumented", False):
+            return driver
+        execute = driver.execute
+
+        def instrumented_execute(driver_command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            with self.span(EventKind.COMMAND, driver_command):
+                return execute(driver_command, params)
+
+        driver.execute = instrumented_execute
+        driver._instrumented = True
+        return driver
+
+
+def folded_stacks(test_name: str, events: List[Event]) -> List[str]:
+    """Collapsed stacks format of flamegraph.pl / speedscope: "frame;frame;frame value", value is self time in us.
+    Events are summed per stack first: children of repeated spans on the same stack are known only by the stack,
+    so the self time of the stack is its total time minus the total time of all its children."""
+    total_time: Dict[Tuple[str, ...], float] = defaultdict(float)  # in order of the first event of the stack
+    children_time: Dict[Tuple[str, ...], float] = defaultdict(float)
+    for event in events:
+        total_time[event.stack + (f"{event.kind}:{event.name}",)] += event.duration
+        children_time[event.stack] += event.duration
+
+    lines = []
+    for frames, duration in total_time.items():
+        self_time = max(duration - children_time.get(frames, 0.0), 0.0)
+        lines.append(f"{';'.join((test_name,) + frames)} {round(self_time * 1_000_000)}")
+    return lines
+
+
+def write_report(directory: str, test_name: str, events: List[Event]) -> None:
+    """Writes <test>.json with all events and <test>.folded for flamegraph tools."""
+    os.makedirs(directory, exist_ok=True)
+    file_name = re.sub(r"[^\w.-]+", "_", test_name)
+    with open(os.path.join(directory, f"{file_name}.json"), "w") as file:
+        json.dump({"test": test_name, "events": [asdict(event) for event in events]}, file, indent=1)
+    with open(os.path.join(directory, f"{file_name}.folded"), "w") as file:
+        file.write("\n".join(folded_stacks(file_name, events)))
+
+
+recorder = Recorder()
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union, NoReturn
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+IMAGES_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"]
+FONTS_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_URL_PATTERNS = ["*.mp4", "*.webm", "*.ogg", "*.ogv", "*.mp3", "*.wav"]
+
+BLOCK_CONTENT_SETTING = 2
+# every host name is not resolved, only the local archive server is reachable
+OFFLINE_HOST_RESOLVER_RULES = "MAP * ~NOTFOUND , EXCLUDE 127.0.0.1, EXCLUDE localhost"
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """Browser launch settings. Trimmed profile uses less memory per browser and loads pages faster."""
+    name: str
+    headless: bool = False
+    block_images: bool = False
+    block_fonts: bool = False
+    block_media: bool = False
+    disable_extensions: bool = False
+    disable_gpu: bool = False
+    window_size: Optional[Tuple[int, int]] = None
+    page_load_strategy: str = "normal"  # "normal", "eager" or "none"
+    offline: bool = False  # replay of the offline archive: requests to the other hosts fail
+
+    def options(self) -> Options:
+        options = Options()
+        options.page_load_strategy = self.page_load_strategy
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.disable_extensions:
+            options.add_argument("--disable-extensions")
+        if self.disable_gpu:
+            options.add_argument("--disable-gpu")
+        if self.offline:
+            options.add_argument(f"--host-resolver-rules={OFFLINE_HOST_RESOLVER_RULES}")
+        if self.window_size:
+            options.add_argument("--window-size={},{}".format(*self.window_size))
+        if self.block_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs",
+                                            {"profile.managed_default_content_settings.images": BLOCK_CONTENT_SETTING})
+        return options
+
+    def blocked_urls(self) -> List[str]:
+        urls = []
+        if self.block_images:
+            urls += IMAGES_URL_PATTERNS
+        if self.block_fonts:
+            urls += FONTS_URL_PATTERNS
+        if self.block_media:
+            urls += MEDIA_URL_PATTERNS
+        return urls
+
+    def create_driver(self) -> WebDriver:
+        driver = webdriver.Chrome(options=self.options())
+        blocked_urls = self.blocked_urls()
+        if blocked_urls:
+            # fonts and media have no content settings, they are blocked on the network level
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        return driver
+
+
+class LaunchProfiles:
+    """Launch profiles storage class, tests select profile by name: @pytest.mark.launch_profile("fast")."""
+    DEFAULT: LaunchProfile = LaunchProfile("default")
+    HEADLESS: LaunchProfile = LaunchProfile("headless",
+                                            headless=True,
+                                            window_size=(1920, 1080))
+    FAST: LaunchProfile = LaunchProfile("fast",
+                                        headless=True,
+                                        block_images=True,
+                                        block_fonts=True,
+                                        block_media=True,
+                                        disable_extensions=True,
+                                        disable_gpu=True,
+                                        window_size=(1920, 1080),
+                                        page_load_strategy="eager")
+
+    @classmethod
+    def by_name(cls, name: str) -> Union[LaunchProfile, NoReturn]:
+        for profile in (cls.DEFAULT, cls.HEADLESS, cls.FAST):
+            if profile.name == name:
+                return profile
+        raise ValueError(f"Unknown launch profile {name=}")
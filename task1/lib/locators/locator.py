@@ -1,28 +1,58 @@
-from typing import Any, Tuple, Union, NoReturn
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Optional, Tuple, Union, NoReturn
 from ..by_type import ByType
+from ..constants import Const
 
 
 class Locator:
-    __slots__ = "_by", "_locator"
+    """Locator template, it is parsed once at class creation:
+    static locator (without formatted string literals) returns the same prepared tuple(by, locator),
+    parametric locator returns itself, and formats tuple(by, locator) on call, formatted tuples are cached."""
+    __slots__ = "_by", "_locator", "_is_parametric", "_static", "_format"
 
     def __init__(self, locator: str, by: str = ByType.XPATH) -> None:
         self._by: str = by
         self._locator: str = locator
+        self._is_parametric: bool = any(field is not None for _, field, _, _ in Formatter().parse(locator))
+        # format() also unescapes {{ and }} of the static locator
+        self._static: Optional[Tuple[str, str]] = None if self._is_parametric else (by, locator.format())
+        self._format: Callable[..., Tuple[str, str]] = lru_cache(maxsize=Const.LOCATOR_CACHE_SIZE)(self._build)
 
-    def __call__(self, *args, **kwargs) -> Tuple[str, str]:
-        # return tuple(by, locator) with formatted string literals
+    def _build(self, *args, **kwargs) -> Tuple[str, str]:
         return self._by, self._locator.format(*args, **kwargs)
 
-    def __get__(self, instance: Any, owner: Any) -> Union[Tuple[str, str], NoReturn]:
+    @property
+    def is_parametric(self) -> bool:
+        return self._is_parametric
+
+    def __call__(self, *args, **kwargs) -> Tuple[str, str]:
+        # return tuple(by, locator) with formatted string literals
         try:
-            # return tuple(by, locator) when no formatted string literals
-            return self._by, self._locator.format()
-        except (IndexError, KeyError):
-            # return itself when executed from __call__ method
-            return self
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            # unhashable arguments can't be cached, formatting errors are raised by _build
+            return self._build(*args, **kwargs)
+        return self._format(*args, **kwargs)
+
+    def __get__(self, instance: Any, owner: Any) -> Union[Tuple[str, str], "Locator"]:
+        # return tuple(by, locator) when no formatted string literals,
+        # return itself when executed from __call__ method
+        return self if self._is_parametric else self._static
 
     def __repr__(self) -> str:
         return f'Locator(by={self._by}, "{self._locator}")'
 
     def __str__(self) -> str:
         return self.__repr__()
+
+
+@lru_cache(maxsize=Const.LOCATOR_CACHE_SIZE)
+def compiled_xpath(locator: Tuple[str, str]) -> Union[Any, NoReturn]:
+    """Pre-compiled lxml XPath of tuple(by, locator) for the browser-free backend."""
+    from lxml import etree  # lxml is needed for the browser-free backend only
+
+    by, expression = locator
+    if by != ByType.XPATH:
+        raise ValueError(f"Expected XPath locator, but actually {locator=}")
+    return etree.XPath(expression)
@@ -0,0 +1,154 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+import urllib.request
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+from lxml import html as lxml_html
+
+from ..constants import Url
+
+MANIFEST_FILE = "manifest.json"
+PAGE_FILE = "index.html"
+ASSETS_DIR = "assets"
+USER_AGENT = "Mozilla/5.0 (offline archive recorder)"
+FETCH_TIMEOUT = 30
+
+# tag: attributes with urls of the assets that are needed for page rendering
+ASSET_ATTRIBUTES = {"link": ("href",), "script": ("src",), "img": ("src", "srcset"), "source": ("src", "srcset"),
+                    "video": ("poster",), "input": ("src",)}
+SRCSET_ATTRIBUTE = "srcset"
+ASSET_LINK_RELS = {"stylesheet", "icon", "preload", "modulepreload"}
+STYLESHEET_REL = "stylesheet"
+CSS_EXTENSION = ".css"
+# url(...) of CSS, @import "..." is the url as well
+CSS_URL_PATTERN = re.compile(r"""url\(\s*(['"]?)([^'")]+?)\1\s*\)|@import\s+(['"])([^'"]+)\3""")
+RECORDED_SCHEMES = ("http", "https")
+
+
+def _fetch(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def _asset_file_name(url: str, extension: Optional[str] = None) -> str:
+    if extension is None:
+        extension = posixpath.splitext(urlparse(url).path)[1][:8]
+    return hashlib.sha1(url.encode()).hexdigest() + extension
+
+
+class _PageRecorder:
+    """Saves the assets of the page and rewrites their urls to the local /assets/ paths.
+    Stylesheets are rewritten as well, so the fonts and images of the styles are local too."""
+
+    def __init__(self, archive_dir: str) -> None:
+        self._archive_dir: str = archive_dir
+        self.assets: Dict[str, str] = {}  # absolute url: local url
+
+    def asset(self, url: str, is_stylesheet: bool = False) -> Optional[str]:
+        """Local url of the recorded asset, None when it can't be recorded (the url is left as it is)."""
+        if url in self.assets:
+            return self.assets[url]
+        if urlparse(url).scheme not in RECORDED_SCHEMES:
+            return None
+        is_stylesheet = is_stylesheet or urlparse(url).path.endswith(CSS_EXTENSION)
+        try:
+            content = _fetch(url)
+        except OSError as err:
+            logging.info(f"Can't record asset '{url}': {err}")
+            return None
+
+        file_name = _asset_file_name(url, CSS_EXTENSION if is_stylesheet else None)
+        # saved before the styles are rewritten: stylesheets can import each other
+        local_url = self.assets[url] = f"/{ASSETS_DIR}/{file_name}"
+        if is_stylesheet:
+            content = self.rewrite_css(content.decode("utf-8", errors="replace"), url).encode("utf-8")
+        with open(os.path.join(self._archive_dir, ASSETS_DIR, file_name), "wb") as file:
+            file.write(content)
+        return local_url
+
+    def rewrite_css(self, css: str, base_url: str) -> str:
+        def replace(match: re.Match) -> str:
+            is_import = match.group(4) is not None
+            value = match.group(4) if is_import else match.group(2)
+            local_url = self.asset(urljoin(base_url, value.strip()), is_stylesheet=is_import)
+            if local_url is None:
+                return match.group(0)
+            return f'@import "{local_url}"' if is_import else f'url("{local_url}")'
+
+        return CSS_URL_PATTERN.sub(replace, css)
+
+    def rewrite_srcset(self, srcset: str, base_url: str) -> str:
+        """srcset is the list of "url descriptor" candidates, separated by commas."""
+        candidates = []
+        for candidate in srcset.split(","):
+            parts = candidate.split()
+            if parts:
+                parts[0] = self.asset(urljoin(base_url, parts[0])) or parts[0]
+                candidates.append(" ".join(parts))
+        return ", ".join(candidates)
+
+    def rewrite_page(self, tree: lxml_html.HtmlElement, base_url: str) -> None:
+        """Asset attributes are rewritten in the parsed page, text and other attributes are not changed."""
+        for element in tree.iter(*ASSET_ATTRIBUTES):
+            rels = set((element.get("rel") or "").split())
+            if element.tag == "link" and not ASSET_LINK_RELS.intersection(rels):
+                continue
+            for attribute in ASSET_ATTRIBUTES[element.tag]:
+                value = element.get(attribute)
+                if not value:
+                    continue
+                if attribute == SRCSET_ATTRIBUTE:
+                    element.set(attribute, self.rewrite_srcset(value, base_url))
+                    continue
+                local_url = self.asset(urljoin(base_url, value.strip()), is_stylesheet=STYLESHEET_REL in rels)
+                if local_url is not None:
+                    element.set(attribute, local_url)
+        for element in tree.iter("style"):
+            if element.text:
+                element.text = self.rewrite_css(element.text, base_url)
+        for element in tree.xpath("//*[@style]"):
+            element.set("style", self.rewrite_css(element.get("style"), base_url))
+
+
+def record_page(url: str, archive_dir: str) -> Dict[str, str]:
+    """Captures the page and its assets (styles with their fonts and images, scripts, images) into archive_dir once.
+    Links to the assets are rewritten to the local /assets/ paths, assets that can't be loaded are skipped.
+    Assets loaded by scripts at runtime are not recorded, the replay browser doesn't reach the other hosts
+    (LaunchProfile.offline).
+    returns manifest: {"url": original page url, "path": path of the page on the local server, ...}
+    """
+    os.makedirs(os.path.join(archive_dir, ASSETS_DIR), exist_ok=True)
+    logging.info(f"Recording '{url}' to '{archive_dir}'...")
+    tree = lxml_html.document_fromstring(_fetch(url).decode("utf-8"))
+    recorder = _PageRecorder(archive_dir)
+    recorder.rewrite_page(tree, url)
+    html = lxml_html.tostring(tree, encoding="unicode", doctype=tree.getroottree().docinfo.doctype)
+
+    with open(os.path.join(archive_dir, PAGE_FILE), "w", encoding="utf-8") as file:
+        file.write(html)
+
+    manifest = {"url": url, "path": urlparse(url).path or "/", "assets": recorder.assets}
+    with open(os.path.join(archive_dir, MANIFEST_FILE), "w") as file:
+        json.dump(manifest, file, indent=1)
+    logging.info(f"Finished recording, {len(recorder.assets)} assets...")
+    return manifest
+
+
+def load_manifest(archive_dir: str) -> Dict[str, str]:
+    with open(os.path.join(archive_dir, MANIFEST_FILE)) as file:
+        return json.load(file)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Record the page into the offline archive")
+    arg_parser.add_argument("archive_dir")
+    arg_parser.add_argument("--url", default=Url.SRV_URL)
+    arguments = arg_parser.parse_args()
+    record_page(arguments.url, arguments.archive_dir)
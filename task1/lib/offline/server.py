@@ -0,0 +1,92 @@
+import logging
+import mimetypes
+import os
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from .archive import ASSETS_DIR, PAGE_FILE, load_manifest
+
+LOCALHOST = "127.0.0.1"
+
+
+class _ArchiveRequestHandler(BaseHTTPRequestHandler):
+    """Serves the recorded page by its original path and the assets from /assets/, everything else is 404."""
+
+    def __init__(self, *args, archive_dir: str, page_path: str, **kwargs) -> None:
+        self._archive_dir = archive_dir
+        self._page_path = page_path
+        super().__init__(*args, **kwargs)
+
+    def _file_path(self) -> Optional[str]:
+        path = urlparse(self.path).path
+        if path == self._page_path:
+            return os.path.join(self._archive_dir, PAGE_FILE)
+        if path.startswith(f"/{ASSETS_DIR}/"):
+            file_name = os.path.basename(path)
+            return os.path.join(self._archive_dir, ASSETS_DIR, file_name)
+        return None
+
+    def do_GET(self) -> None:
+        file_path = self._file_path()
+        if file_path is None or not os.path.isfile(file_path):
+            self.send_error(404)
+            return
+
+        with open(file_path, "rb") as file:
+            content = file.read()
+        content_type = "text/html; charset=utf-8" if file_path.endswith(PAGE_FILE) else (
+            mimetypes.guess_type(file_path)[0] or "application/octet-stream")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.debug(f"Archive server: {format % args}")
+
+
+class ArchiveServer:
+    """Local HTTP server of the offline archive, runs in the background thread:
+
+    with ArchiveServer(archive_dir) as server:
+        driver.get(server.page_url)
+    """
+
+    def __init__(self, archive_dir: str, port: int = 0) -> None:
+        self._manifest = load_manifest(archive_dir)
+        handler = partial(_ArchiveRequestHandler, archive_dir=archive_dir, page_path=self._manifest["path"])
+        self._server = ThreadingHTTPServer((LOCALHOST, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def page_url(self) -> str:
+        """Url of the recorded page on the local server."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{self._manifest['path']}"
+
+    @property
+    def original_url(self) -> str:
+        return self._manifest["url"]
+
+    def start(self) -> "ArchiveServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logging.info(f"Archive server of '{self.original_url}' is started on '{self.page_url}'")
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ArchiveServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
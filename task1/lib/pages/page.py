@@ -1,12 +1,15 @@
 import logging
-import time
-from typing import Optional, NoReturn
+from typing import Optional, NoReturn, Dict, Hashable, Union, List
 
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 
-from ..constants import Const, Times
+from .readiness import wait_until_page_ready
+from ..constants import Const
+from ..instrumentation import EventKind, recorder
+from ..retry_budget import RetryBudget
 
 
 class Page:
@@ -14,16 +17,23 @@ class Page:
 
     def __init__(self, driver: WebDriver) -> None:
         self._driver = driver
-        url = self._URL
-        logging.info(f"Calling griver.get('{url}')...")
-        self._driver.get(url)
-        logging.info("Finished calling driver.get()...")
-        self._post_init()
+        # found web elements by locator, they are reused until they become stale or the page is reloaded
+        self._element_cache: Dict[Hashable, Union[WebElement, List[WebElement]]] = {}
+        # total retry time of the page elements, a broken page fails fast instead of timing out element by element
+        self.retry_budget: RetryBudget = RetryBudget(self.__class__.__name__, Const.PAGE_RETRY_BUDGET)
+        self.navigate(self._URL)
+
+    def navigate(self, url: str) -> None:
+        with recorder.span(EventKind.PAGE, f"{self.__class__.__name__}.navigate"):
+            logging.info(f"Calling griver.get('{url}')...")
+            self.clear_element_cache()
+            self._driver.get(url)
+            logging.info("Finished calling driver.get()...")
+            self._post_init()
 
     def _post_init(self) -> None:
         self.sanity_check()
-        logging.info("Sleeping 3 sec...")
-        time.sleep(Times.THREE_SECONDS)    # delay that eliminates errors after page loading
+        self.wait_until_ready()
 
     def sanity_check(self, check_url: bool = True, check_title: bool = False) -> Optional[NoReturn]:
         """Simplest test that checks is selenium working, and is web page loading."""
@@ -49,6 +59,14 @@ class Page:
             assert wait.until(title_match_condition)
             logging.info("Finished sanity check page title...")
 
+    def wait_until_ready(self) -> bool:
+        """Waits until the page is loaded and stable, eliminates errors after page loading."""
+        logging.info("Waiting page readiness...")
+        with recorder.span(EventKind.PAGE, "wait_until_ready"):
+            is_ready = wait_until_page_ready(self._driver)
+        logging.info("Finished waiting page readiness...")
+        return is_ready
+
     @property
     def driver(self) -> WebDriver:
         return self._driver
@@ -57,6 +75,14 @@ class Page:
     def title(self) -> str:
         return self._driver.title
 
+    @property
+    def element_cache(self) -> Dict[Hashable, Union[WebElement, List[WebElement]]]:
+        return self._element_cache
+
+    def clear_element_cache(self) -> None:
+        self._element_cache.clear()
+
     def refresh(self) -> None:
+        self.clear_element_cache()
         self._driver.refresh()
-        time.sleep(Times.THREE_SECONDS)
+        self.wait_until_ready()
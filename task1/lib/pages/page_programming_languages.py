@@ -1,14 +1,45 @@
 import re
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
 import logging
-from typing import Optional, NoReturn, List
+from typing import Optional, NoReturn, List, Tuple, Iterator
 from .page import Page
-from ..elements.elements import Element, Elements, TableCell
+from ..elements.elements import Element, Elements, Table, TableCell, StaleParentElementError
 from ..locators.locators_programming_language import ProgrammingLanguagesLocators
-from ..constants import Times
+from ..constants import Const, Times
 
 PROGRAMMING_LANGUAGE_PAGE_TITLE = "Programming languages used in most popular websites"
 
+# columns order of the websites table
+WEBSITE_COLUMN, POPULARITY_COLUMN, FRONT_END_COLUMN, BACK_END_COLUMN, DATABASE_COLUMN, NOTE_COLUMN = range(6)
+
+WebsiteRow = Tuple[str, float, List[str], List[str], List[str], Optional[str]]
+
+
+def parse_website_name(text: str) -> str:
+    return text.split('[')[0].strip()
+
+
+def parse_popularity(text: str) -> float:
+    popularity = text.split('[')[0]
+    numbers = re.findall(r'\b\d+\b', popularity)
+    return float(''.join(numbers))
+
+
+def parse_list(text: str) -> List[str]:
+    return text.split(',')
+
+
+def parse_websites_rows(cells_list: List[List[str]]) -> List[WebsiteRow]:
+    """Parses text of the websites table cells, every row is the list of cells text."""
+    return [(parse_website_name(cells[WEBSITE_COLUMN]),
+             parse_popularity(cells[POPULARITY_COLUMN]),
+             parse_list(cells[FRONT_END_COLUMN]),
+             parse_list(cells[BACK_END_COLUMN]),
+             parse_list(cells[DATABASE_COLUMN]),
+             cells[NOTE_COLUMN] if len(cells) > NOTE_COLUMN else None)
+            for cells in cells_list]
+
 
 class ProgrammingLanguagePage(Page):
     _PAGE_TITLE = PROGRAMMING_LANGUAGE_PAGE_TITLE
@@ -16,20 +47,15 @@ class ProgrammingLanguagePage(Page):
     _sanity: Element
 
     _all_website_elements: Elements
-    _website_name_by_row_table_cell: TableCell
-    _popularity_by_row_table_cell: TableCell
-    _front_end_by_row_table_cell: TableCell
-    _back_end_by_row_table_cell: TableCell
-    _database_by_row_table_cell: TableCell
-    _note_by_row_table_cell: TableCell
+    _all_websites_table: Table
+    _row_table_cell: TableCell
 
     def __init__(self, driver) -> None:
         logging.info("Initializing ProgrammingLanguagesLocators...")
         ProgrammingLanguagePage._locs = ProgrammingLanguagesLocators()
+        self._rows: List[WebElement] = []
         _, self._URL = self._locs.PROGRAMMING_LANGUAGES_URL
         super().__init__(driver)
-        self.sanity_check()
-        self._post_init()
 
     def sanity_check(self, check_url: bool = True, check_title: bool = True) -> Optional[NoReturn]:
         super().sanity_check()
@@ -38,41 +64,75 @@ class ProgrammingLanguagePage(Page):
         self._sanity.wait_on_page()
         logging.info("Finished waiting sanity element on programming languages page...")
 
-    @classmethod
-    def _post_init(cls) -> None:
-        pass
-
     def get_count_all_websites(self) -> int:
         try:
             ProgrammingLanguagePage._all_website_elements = Elements(self._locs.ALL_WEBSITES_ELEMENTS,
                                                                      timeout=Times.TEN_SECONDS)
-            return self._all_website_elements.length
+            all_website_elements = self._all_website_elements
+            self._rows = all_website_elements.web_element
+            return all_website_elements.length
         except TimeoutException:
             return 0
 
+    def get_all_websites_rows(self) -> List[WebsiteRow]:
+        """Reads all rows of the websites table by one DOM round-trip and parses them."""
+        ProgrammingLanguagePage._all_websites_table = Table(self._locs.ALL_WEBSITES_TABLE_ROWS,
+                                                            timeout=Times.TEN_SECONDS)
+        try:
+            return parse_websites_rows(self._all_websites_table.rows)
+        except TimeoutException:
+            return []
+
+    def iter_all_websites_rows(self, chunk_size: int = Const.TABLE_CHUNK_SIZE) -> Iterator[WebsiteRow]:
+        """Yields parsed rows of the websites table as they are read by chunks.
+        Timeout ends the rows like in get_all_websites_rows, also when it happens in the middle of the table."""
+        ProgrammingLanguagePage._all_websites_table = Table(self._locs.ALL_WEBSITES_TABLE_ROWS,
+                                                            timeout=Times.TEN_SECONDS)
+        try:
+            rows = self._all_websites_table.iter_rows(chunk_size)
+        except TimeoutException:
+            return
+        while True:
+            # only reading of the rows is guarded, exceptions thrown into this generator are not swallowed
+            try:
+                cells = next(rows)
+            except (StopIteration, TimeoutException):
+                return
+            yield from parse_websites_rows([cells])
+
+    def _get_row_web_element(self, row: int) -> WebElement:
+        """Rows are found once by one find_elements pass, row is 1-based like XPath tr[row]."""
+        if not self._rows:
+            self.get_count_all_websites()
+        if not 1 <= row <= len(self._rows):
+            raise NoSuchElementException(f"No such row {row}, the table has {len(self._rows)} rows")
+        return self._rows[row - 1]
+
+    def _get_row_table_cell_text(self, locator: Tuple[str, str], row: int) -> str:
+        """Cell is searched relative to the already found row, instead of the whole document."""
+        try:
+            ProgrammingLanguagePage._row_table_cell = TableCell(locator, parent=self._get_row_web_element(row))
+            return self._row_table_cell.text
+        except StaleParentElementError:
+            # the table was rerendered, find rows again
+            self._rows = []
+            ProgrammingLanguagePage._row_table_cell = TableCell(locator, parent=self._get_row_web_element(row))
+            return self._row_table_cell.text
+
     def get_website_name_by_row_table_cell(self, row: int) -> str:
-        ProgrammingLanguagePage._website_name_by_row_table_cell = TableCell(self._locs.WEBSITE_NAME_BY_ROW_TABLE_CELL(
-            row))
-        return self._website_name_by_row_table_cell.text
+        return self._get_row_table_cell_text(self._locs.WEBSITE_NAME_ROW_TABLE_CELL, row)
 
     def get_popularity_by_row_table_cell(self, row: int) -> float:
-        ProgrammingLanguagePage._popularity_by_row_table_cell = TableCell(self._locs.POPULARITY_BY_ROW_TABLE_CELL(row))
-        popularity = self._popularity_by_row_table_cell.text.split('[')[0]
-        numbers = re.findall(r'\b\d+\b', popularity)
-        return float(''.join(numbers))
+        return parse_popularity(self._get_row_table_cell_text(self._locs.POPULARITY_ROW_TABLE_CELL, row))
 
     def get_front_end_by_row_table_cell(self, row: int) -> List[str]:
-        ProgrammingLanguagePage._front_end_by_row_table_cell = TableCell(self._locs.FRONT_END_BY_ROW_TABLE_CELL(row))
-        return self._front_end_by_row_table_cell.text.split(',')
+        return parse_list(self._get_row_table_cell_text(self._locs.FRONT_END_ROW_TABLE_CELL, row))
 
     def get_back_end_by_row_table_cell(self, row: int) -> List[str]:
-        ProgrammingLanguagePage._back_end_by_row_table_cell = TableCell(self._locs.BACK_END_BY_ROW_TABLE_CELL(row))
-        return self._back_end_by_row_table_cell.text.split(',')
+        return parse_list(self._get_row_table_cell_text(self._locs.BACK_END_ROW_TABLE_CELL, row))
 
     def get_database_by_row_table_cell(self, row: int) -> List[str]:
-        ProgrammingLanguagePage._database_by_row_table_cell = TableCell(self._locs.DATABASE_BY_ROW_TABLE_CELL(row))
-        return self._database_by_row_table_cell.text.split(',')
+        return parse_list(self._get_row_table_cell_text(self._locs.DATABASE_ROW_TABLE_CELL, row))
 
     def get_note_by_row_table_cell(self, row: int) -> Optional[str]:
-        ProgrammingLanguagePage._note_by_row_table_cell = TableCell(self._locs.NODE_BY_ROW_TABLE_CELL(row))
-        return self._note_by_row_table_cell.text
+        return self._get_row_table_cell_text(self._locs.NODE_ROW_TABLE_CELL, row)
@@ -0,0 +1,80 @@
+import logging
+from typing import Any, Dict, Optional
+
+from selenium.common.exceptions import TimeoutException, JavascriptException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ..constants import Const, Times
+
+# Installs MutationObserver once per document and returns the page state for the one poll:
+# document.readyState, count of loaded resources, and milliseconds since the last network and DOM activity.
+PAGE_STATE_SCRIPT = """
+if (!window.__pageReadiness) {
+    window.__pageReadiness = {lastMutation: performance.now()};
+    new MutationObserver(function () {
+        window.__pageReadiness.lastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+var now = performance.now();
+var lastResponse = 0;
+var resources = performance.getEntriesByType('resource');
+performance.getEntriesByType('navigation').concat(resources).forEach(function (entry) {
+    lastResponse = Math.max(lastResponse, entry.responseEnd);
+});
+return {readyState: document.readyState,
+        resources: resources.length,
+        networkIdle: now - lastResponse,
+        domIdle: now - window.__pageReadiness.lastMutation};
+"""
+
+
+class PageIsStable:
+    """ Custom Expected Condition
+
+    An expectation for checking that the page is loaded and stable:
+    document.readyState is 'complete', no new resources were loaded during network_idle_time
+    and DOM was not changed during dom_quiet_time.
+    returns - True when the page is stable
+    """
+    __slots__ = "_network_idle_ms", "_dom_quiet_ms", "_resources"
+
+    def __init__(self, network_idle_time: float, dom_quiet_time: float) -> None:
+        self._network_idle_ms: float = network_idle_time * 1000
+        self._dom_quiet_ms: float = dom_quiet_time * 1000
+        self._resources: Optional[int] = None
+
+    def __call__(self, driver: WebDriver) -> bool:
+        try:
+            state: Dict[str, Any] = driver.execute_script(PAGE_STATE_SCRIPT)
+        except JavascriptException:
+            # document is being replaced by navigation
+            return False
+        return self.is_stable(state)
+
+    def is_stable(self, state: Dict[str, Any]) -> bool:
+        """Checks the result of PAGE_STATE_SCRIPT."""
+        # resource entries appear only after the request is finished, so the count must be the same twice
+        resources_settled = state["resources"] == self._resources
+        self._resources = state["resources"]
+        return (state["readyState"] == "complete"
+                and resources_settled
+                and state["networkIdle"] >= self._network_idle_ms
+                and state["domIdle"] >= self._dom_quiet_ms)
+
+
+def wait_until_page_ready(driver: WebDriver,
+                          timeout: float = Times.TEN_SECONDS,
+                          network_idle_time: float = Const.NETWORK_IDLE_TIME,
+                          dom_quiet_time: float = Const.DOM_QUIET_TIME) -> bool:
+    """Returns as soon as the page is stable. The page that never settles (animations, long polling)
+    is not an error - the waiting is finished by timeout with a warning, and returns False."""
+
+    wait = WebDriverWait(driver=driver,
+                         timeout=timeout,
+                         poll_frequency=Const.READINESS_POLL_FREQUENCY)
+    try:
+        return wait.until(PageIsStable(network_idle_time, dom_quiet_time))
+    except TimeoutException:
+        logging.warning(f"Page '{driver.current_url}' is not stable after {timeout} sec, continue...")
+        return False
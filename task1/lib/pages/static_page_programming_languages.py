@@ -0,0 +1,132 @@
+import logging
+import re
+from typing import List, Optional, NoReturn, Tuple, Union
+
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .page_programming_languages import WebsiteRow, parse_list, parse_popularity, parse_websites_rows
+from ..locators.locator import compiled_xpath
+from ..locators.locators_programming_language import ProgrammingLanguagesLocators
+
+# elements, that start and end a line of innerText
+BLOCK_TAGS = frozenset(("address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt",
+                        "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+                        "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul"))
+# elements, which text is never rendered
+NOT_RENDERED_TAGS = frozenset(("head", "noscript", "script", "style", "template"))
+DISPLAY_NONE = re.compile(r"display\s*:\s*none", re.IGNORECASE)
+WHITESPACE = re.compile(r"[ \t\n\r\f]+")  # CSS white space, no-break space is kept
+
+
+def _is_rendered(element: lxml_html.HtmlElement) -> bool:
+    return (element.tag not in NOT_RENDERED_TAGS and element.get("hidden") is None
+            and not DISPLAY_NONE.search(element.get("style", "")))
+
+
+def _collect_inner_text(element: lxml_html.HtmlElement, parts: List[str]) -> None:
+    if isinstance(element.tag, str) and _is_rendered(element):
+        if element.tag == "br":
+            parts.append("\n")
+        is_block = element.tag in BLOCK_TAGS
+        if is_block:
+            parts.append("\n")
+        if element.text:
+            parts.append(WHITESPACE.sub(" ", element.text))
+        for child in element:
+            _collect_inner_text(child, parts)
+        if is_block:
+            parts.append("\n")
+    # text after the element (tail) belongs to the parent, it is rendered even for the hidden element or comment
+    if element.tail:
+        parts.append(WHITESPACE.sub(" ", element.tail))
+
+
+def inner_text(element: lxml_html.HtmlElement) -> str:
+    """Approximation of the browser innerText for the static html (lxml text_content() is the textContent):
+    hidden elements, scripts and styles are skipped, <br> and blocks break lines, whitespace runs are collapsed.
+    CSS of the stylesheets is not applied, only inline display:none and the hidden attribute."""
+    parts: List[str] = []
+    if element.text and _is_rendered(element):
+        parts.append(WHITESPACE.sub(" ", element.text))
+    for child in element:
+        _collect_inner_text(child, parts)
+    lines = (line.strip(" ") for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line).strip()
+
+
+class StaticProgrammingLanguagePage:
+    """Browser-free backend of ProgrammingLanguagePage: evaluates the same Locator XPaths by lxml
+    over the static html (saved file, or driver.page_source read once). Returns the same values."""
+
+    _locs = ProgrammingLanguagesLocators
+
+    def __init__(self, html: str) -> None:
+        self._tree = lxml_html.fromstring(html)
+        self._rows: Optional[List[lxml_html.HtmlElement]] = None
+        self.sanity_check()
+
+    @classmethod
+    def from_file(cls, path: str) -> "StaticProgrammingLanguagePage":
+        with open(path, encoding="utf-8") as file:
+            return cls(file.read())
+
+    @classmethod
+    def from_driver(cls, driver: WebDriver) -> "StaticProgrammingLanguagePage":
+        """One WebDriver command for the whole page."""
+        return cls(driver.page_source)
+
+    @staticmethod
+    def _text(element: lxml_html.HtmlElement) -> str:
+        return inner_text(element)
+
+    def _find(self, locator: Tuple[str, str]) -> List[lxml_html.HtmlElement]:
+        return compiled_xpath(locator)(self._tree)
+
+    def sanity_check(self) -> Optional[NoReturn]:
+        locator = self._locs.PROGRAMMING_LANGUAGES_SANITY_ELEMENT
+        if not self._find(locator):
+            raise AssertionError(f"Error, Sanity check element {locator} is not found in html!")
+        logging.info("Finished sanity check of static programming languages page...")
+
+    def get_count_all_websites(self) -> int:
+        return len(self._find(self._locs.ALL_WEBSITES_ELEMENTS))
+
+    def get_all_websites_rows(self) -> List[WebsiteRow]:
+        cells_xpath = compiled_xpath(self._locs.ROW_CELLS)
+        cells_list = [[self._text(cell) for cell in cells_xpath(row)]
+                      for row in self._find(self._locs.ALL_WEBSITES_TABLE_ROWS)]
+        return parse_websites_rows(cells_list)
+
+    def _find_row_table_cell_text(self, locator: Tuple[str, str], row: int,
+                                  is_required: bool = True) -> Union[Optional[str], NoReturn]:
+        """Like TableCell of the Selenium page, the missing cell is an error, unless it is optional (note)."""
+        if self._rows is None:
+            self._rows = self._find(self._locs.ALL_WEBSITES_ELEMENTS)
+        if not 1 <= row <= len(self._rows):
+            raise NoSuchElementException(f"No such row {row}, the table has {len(self._rows)} rows")
+        cells = compiled_xpath(locator)(self._rows[row - 1])
+        if cells:
+            return self._text(cells[0])
+        if is_required:
+            raise NoSuchElementException(f"No such element: {locator} in row {row}")
+        return None
+
+    def get_website_name_by_row_table_cell(self, row: int) -> str:
+        return self._find_row_table_cell_text(self._locs.WEBSITE_NAME_ROW_TABLE_CELL, row)
+
+    def get_popularity_by_row_table_cell(self, row: int) -> float:
+        return parse_popularity(self._find_row_table_cell_text(self._locs.POPULARITY_ROW_TABLE_CELL, row))
+
+    def get_front_end_by_row_table_cell(self, row: int) -> List[str]:
+        return parse_list(self._find_row_table_cell_text(self._locs.FRONT_END_ROW_TABLE_CELL, row))
+
+    def get_back_end_by_row_table_cell(self, row: int) -> List[str]:
+        return parse_list(self._find_row_table_cell_text(self._locs.BACK_END_ROW_TABLE_CELL, row))
+
+    def get_database_by_row_table_cell(self, row: int) -> List[str]:
+        return parse_list(self._find_row_table_cell_text(self._locs.DATABASE_ROW_TABLE_CELL, row))
+
+    def get_note_by_row_table_cell(self, row: int) -> Optional[str]:
+        return self._find_row_table_cell_text(self._locs.NODE_ROW_TABLE_CELL, row, is_required=False)
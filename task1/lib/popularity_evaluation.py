@@ -0,0 +1,57 @@
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .server_ui.programming_languages_table import ProgrammingLanguagesTable
+from .server_ui.programming_languages_ui import ProgrammingLanguages
+
+
+def _as_list(values: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Languages are stored as tuples, messages show them as lists like the page getters return."""
+    return None if values is None else list(values)
+
+
+class PopularityEvaluation:
+    """Pass/fail matrix of all websites against all popularity thresholds.
+
+    Websites are kept as the columnar table, its popularity column is sorted once, every threshold is resolved
+    by binary search: websites failed by the threshold are the sorted prefix before it.
+    Failure messages are built only when they are requested.
+    """
+
+    def __init__(self, websites: Sequence[ProgrammingLanguages], thresholds: Sequence[float]) -> None:
+        self.table: ProgrammingLanguagesTable = ProgrammingLanguagesTable.from_records(websites)
+        self.thresholds: np.ndarray = np.asarray(thresholds, dtype=np.float64)
+        self._order: np.ndarray = np.argsort(self.table.popularity, kind="stable")
+        self._sorted_popularity: np.ndarray = self.table.popularity[self._order]
+        # count of websites with popularity < threshold, for every threshold
+        self.failures_count: np.ndarray = np.searchsorted(self._sorted_popularity, self.thresholds, side="left")
+
+    def _threshold_index(self, threshold: float) -> int:
+        indexes = np.flatnonzero(self.thresholds == threshold)
+        if not indexes.size:
+            raise KeyError(f"Threshold {threshold} is not evaluated, expected one of {self.thresholds.tolist()}")
+        return int(indexes[0])
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Boolean pass matrix [websites x thresholds] in order of websites, built on demand."""
+        ranks = np.empty_like(self._order)
+        ranks[self._order] = np.arange(len(self._order))
+        return ranks[:, None] >= self.failures_count[None, :]
+
+    def failed_websites(self, threshold: float) -> Iterator[ProgrammingLanguages]:
+        # failed websites are reported in order of the page table, as before
+        for index in np.sort(self._order[:self.failures_count[self._threshold_index(threshold)]]):
+            yield self.table.record(index)
+
+    def failures(self, threshold: float) -> Iterator[str]:
+        for website in self.failed_websites(threshold):
+            yield (f"{website.website} (Frontend:{_as_list(website.front_end)}|Backend{_as_list(website.back_end)}) "
+                   f"has {website.popularity} unique visitor per month. Expected more {threshold}  ")
+
+    def is_passed(self, threshold: float) -> bool:
+        return not self.failures_count[self._threshold_index(threshold)]
+
+    def failure_messages(self, threshold: float) -> List[str]:
+        return list(self.failures(threshold))
@@ -0,0 +1,207 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Generator, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+
+from .constants import Const
+
+
+class RetryBudgetError(Exception):
+    """Base of the fail fast errors: the interaction is not retried until its own timeout.
+    It is not TimeoutException on purpose: page methods return empty results on timeout, the spent budget
+    and the open circuit should fail the test instead."""
+    pass
+
+
+class RetryBudgetExceeded(RetryBudgetError):
+    """Retry time of the test or of the page is spent."""
+    pass
+
+
+class CircuitOpenError(RetryBudgetError):
+    """Locator failed too many times in a row, it is not tried again until the circuit breaker reset time."""
+    pass
+
+
+class RetryBudget:
+    """Total time, that interactions of the test (or of the page) may spend on retries.
+    Time is charged only for interactions, which were not done by the first attempt."""
+
+    def __init__(self, name: str, limit: float) -> None:
+        self.name: str = name
+        self.limit: float = limit
+        self.spent: float = 0.0
+        self.spent_by_locator: Dict[str, float] = defaultdict(float)
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def remaining(self) -> float:
+        return self.limit - self.spent
+
+    def charge(self, locator: str, seconds: float) -> None:
+        with self._lock:
+            self.spent += seconds
+            self.spent_by_locator[locator] += seconds
+
+    def top_locators(self, count: int) -> List[Tuple[str, float]]:
+        return sorted(self.spent_by_locator.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+class CircuitBreaker:
+    """Circuit breaker per locator: after failure_threshold failed interactions in a row the circuit is open,
+    and interactions with the locator fail at once. After reset_time one trial interaction is allowed (half open):
+    success closes the circuit, failure opens it again."""
+
+    def __init__(self,
+                 failure_threshold: int = Const.CIRCUIT_BREAKER_FAILURES,
+                 reset_time: float = Const.CIRCUIT_BREAKER_RESET_TIME) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.reset_time: float = reset_time
+        self._failures: Dict[str, int] = defaultdict(int)
+        self._opened_at: Dict[str, float] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def before_call(self, locator: str) -> None:
+        """Raises CircuitOpenError, when the circuit of the locator is open."""
+        with self._lock:
+            opened_at = self._opened_at.get(locator)
+            if opened_at is None:
+                return
+            if time.time() - opened_at < self.reset_time:
+                raise CircuitOpenError(f"Circuit is open for locator={locator} after "
+                                       f"{self._failures[locator]} failures in a row, fail fast")
+            # half open: the next failure opens the circuit again at once
+            del self._opened_at[locator]
+            self._failures[locator] = self.failure_threshold - 1
+
+    def record_success(self, locator: str) -> None:
+        with self._lock:
+            self._failures.pop(locator, None)
+
+    def record_failure(self, locator: str) -> None:
+        with self._lock:
+            self._failures[locator] += 1
+            if self._failures[locator] >= self.failure_threshold:
+                self._opened_at[locator] = time.time()
+
+    @property
+    def open_locators(self) -> List[str]:
+        with self._lock:
+            return list(self._opened_at)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+
+
+class RetryScope:
+    """One interaction with the element: its deadline is cut by the remaining budgets."""
+    __slots__ = "locator", "deadline", "failed_at", "is_limited_by_budget"
+
+    def __init__(self, locator: str, deadline: float, is_limited_by_budget: bool) -> None:
+        self.locator: str = locator
+        self.deadline: float = deadline
+        self.failed_at: Optional[float] = None
+        self.is_limited_by_budget: bool = is_limited_by_budget
+
+
+_budgets: ContextVar[Tuple[RetryBudget, ...]] = ContextVar("retry_budgets", default=())
+_scope: ContextVar[Optional[RetryScope]] = ContextVar("retry_scope", default=None)
+
+
+class RetryBudgets:
+    """Active retry budgets (for example, the budget of the current test) and the circuit breaker of locators."""
+
+    def __init__(self, report_size: int = Const.RETRY_BUDGET_REPORT_SIZE) -> None:
+        self.breaker: CircuitBreaker = CircuitBreaker()
+        self._report_size: int = report_size
+        # budgets with the most spent time for the report: min-heap of (spent, order, budget), not more than report_size
+        self._finished: List[Tuple[float, int, RetryBudget]] = []
+        self._order = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def finished(self) -> List[RetryBudget]:
+        """Finished budgets with the most spent time, from the largest."""
+        with self._lock:
+            return [budget for _, _, budget in sorted(self._finished, reverse=True)]
+
+    def _add_finished(self, budget: RetryBudget) -> None:
+        if not budget.spent:
+            return
+        item = (budget.spent, next(self._order), budget)
+        with self._lock:
+            if len(self._finished) < self._report_size:
+                heapq.heappush(self._finished, item)
+            elif item > self._finished[0]:
+                heapq.heapreplace(self._finished, item)
+
+    @contextmanager
+    def activate(self, budget: RetryBudget) -> Generator[RetryBudget, None, None]:
+        token = _budgets.set(_budgets.get() + (budget,))
+        try:
+            yield budget
+        finally:
+            _budgets.reset(token)
+            self._add_finished(budget)
+
+    @contextmanager
+    def scope(self, locator: str, timeout: float, *budgets: Optional[RetryBudget]) -> Generator[RetryScope, None, None]:
+        """Interaction scope: deadline is the element timeout, but not later than the smallest remaining budget.
+        Nested scopes (find element inside the action) are charged by the outer one."""
+        outer = _scope.get()
+        if outer is not None:
+            yield outer
+            return
+
+        self.breaker.before_call(locator)
+        budgets = _budgets.get() + tuple(budget for budget in budgets if budget is not None)
+        remaining = min((budget.remaining for budget in budgets), default=float("inf"))
+        if remaining <= 0:
+            exhausted = ", ".join(budget.name for budget in budgets if budget.remaining <= 0)
+            raise RetryBudgetExceeded(f"Retry budget of {exhausted} is spent, locator={locator} is not tried")
+
+        start = time.time()
+        scope = RetryScope(locator, start + min(timeout, remaining), is_limited_by_budget=remaining < timeout)
+        token = _scope.set(scope)
+        try:
+            yield scope
+        except RetryBudgetError:
+            raise
+        except TimeoutException as err:
+            self.breaker.record_failure(locator)
+            if scope.is_limited_by_budget:
+                raise RetryBudgetExceeded(f"Retry budget is spent on locator={locator}: {err.msg}") from err
+            raise
+        else:
+            self.breaker.record_success(locator)
+        finally:
+            _scope.reset(token)
+            if scope.failed_at is not None:
+                for budget in budgets:
+                    budget.charge(locator, time.time() - scope.failed_at)
+
+    @staticmethod
+    def record_failure() -> None:
+        """Marks the failed attempt of the current interaction: time from the first failure is retry time."""
+        scope = _scope.get()
+        if scope is not None and scope.failed_at is None:
+            scope.failed_at = time.time()
+
+    def report(self, count: int = Const.RETRY_BUDGET_REPORT_SIZE) -> List[str]:
+        lines = []
+        for budget in self.finished[:count]:
+            lines.append(f"{budget.spent:9.3f}s of {budget.limit:.0f}s  {budget.name}")
+            lines.extend(f"{'':4}{spent:9.3f}s  {locator}" for locator, spent in budget.top_locators(count))
+        lines.extend(f"circuit open: {locator}" for locator in self.breaker.open_locators)
+        return lines
+
+
+retry_budgets = RetryBudgets()
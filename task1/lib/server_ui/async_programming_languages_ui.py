@@ -0,0 +1,38 @@
+import asyncio
+import logging
+from abc import ABC
+from typing import Dict, List, Optional, Sequence
+
+from .programming_languages_ui import ProgrammingLanguages
+from ..aio.client import AsyncWebDriver
+from ..aio.page_programming_languages import AsyncProgrammingLanguagePage
+
+
+class AsyncProgrammingLanguagesUI(ABC):
+
+    @staticmethod
+    async def _get_programming_languages_used_in_most_popular_websites(driver: AsyncWebDriver,
+                                                                       url: Optional[str] = None
+                                                                       ) -> List[ProgrammingLanguages]:
+        logging.info(f"Run async _get_programming_languages_used_in_most_popular_websites({url=})")
+        page = await AsyncProgrammingLanguagePage.open(driver, url)
+        return [ProgrammingLanguages.from_row(row) for row in await page.get_all_websites_rows()]
+
+    @staticmethod
+    async def _get_programming_languages_from_urls(drivers: Sequence[AsyncWebDriver],
+                                                   urls: Sequence[str]) -> Dict[str, List[ProgrammingLanguages]]:
+        """Scrapes tables of many pages concurrently from one event loop, every browser session
+        takes the next url from the shared queue."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            queue.put_nowait(url)
+        results: Dict[str, List[ProgrammingLanguages]] = {}
+
+        async def worker(driver: AsyncWebDriver) -> None:
+            while not queue.empty():
+                url = queue.get_nowait()
+                results[url] = await AsyncProgrammingLanguagesUI(
+                    )._get_programming_languages_used_in_most_popular_websites(driver, url)
+
+        await asyncio.gather(*(worker(driver) for driver in drivers))
+        return {url: results[url] for url in urls}
@@ -0,0 +1,156 @@
+import csv
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .programming_languages_ui import ProgrammingLanguages
+
+LIST_SEPARATOR = ","
+NONE_CODE = -1  # code of None value in the string columns
+LIST_COLUMNS = ("front_end", "back_end", "database")
+
+
+class StringDictionary:
+    """Every distinct string is stored once, columns keep int32 codes of the strings."""
+    __slots__ = "_values", "_codes"
+
+    def __init__(self, values: Sequence[str] = ()) -> None:
+        self._values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == NONE_CODE else self._values[code]
+
+    @property
+    def values(self) -> List[str]:
+        return self._values
+
+
+class ProgrammingLanguagesTable:
+    """Columnar container of scraped rows: numpy arrays and one shared string dictionary.
+    List columns (front_end, back_end, database) are stored as offsets + flat codes + null mask,
+    like Arrow list arrays: None list and empty list stay different values.
+
+    table = ProgrammingLanguagesTable.from_records(websites)
+    failed = table.filter(table.popularity < threshold)
+    """
+
+    def __init__(self,
+                 strings: StringDictionary,
+                 website: np.ndarray,
+                 popularity: np.ndarray,
+                 note: np.ndarray,
+                 lists: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> None:
+        self.strings: StringDictionary = strings
+        self.website: np.ndarray = website
+        self.popularity: np.ndarray = popularity
+        self.note: np.ndarray = note
+        self.lists: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = lists  # name: (offsets, codes, is_null)
+
+    @classmethod
+    def from_records(cls, records: Iterable[ProgrammingLanguages]) -> "ProgrammingLanguagesTable":
+        strings = StringDictionary()
+        website, popularity, note = [], [], []
+        offsets: Dict[str, List[int]] = {name: [0] for name in LIST_COLUMNS}
+        codes: Dict[str, List[int]] = {name: [] for name in LIST_COLUMNS}
+        is_null: Dict[str, List[bool]] = {name: [] for name in LIST_COLUMNS}
+        for record in records:
+            website.append(strings.encode(record.website))
+            popularity.append(record.popularity)
+            note.append(strings.encode(record.note))
+            for name in LIST_COLUMNS:
+                values = getattr(record, name)
+                is_null[name].append(values is None)
+                codes[name].extend(strings.encode(value) for value in values or ())
+                offsets[name].append(len(codes[name]))
+
+        lists = {name: (np.array(offsets[name], dtype=np.int32), np.array(codes[name], dtype=np.int32),
+                        np.array(is_null[name], dtype=bool))
+                 for name in LIST_COLUMNS}
+        return cls(strings, np.array(website, dtype=np.int32), np.array(popularity, dtype=np.float64),
+                   np.array(note, dtype=np.int32), lists)
+
+    def __len__(self) -> int:
+        return len(self.popularity)
+
+    def _decode_list(self, name: str, index: int) -> Optional[Tuple[str, ...]]:
+        offsets, codes, is_null = self.lists[name]
+        if is_null[index]:
+            return None
+        return tuple(self.strings.decode(code) for code in codes[offsets[index]:offsets[index + 1]])
+
+    def record(self, index: int) -> ProgrammingLanguages:
+        return ProgrammingLanguages(self.strings.decode(self.website[index]),
+                                    float(self.popularity[index]),
+                                    *(self._decode_list(name, index) for name in LIST_COLUMNS),
+                                    self.strings.decode(self.note[index]))
+
+    def __iter__(self) -> Iterator[ProgrammingLanguages]:
+        return (self.record(index) for index in range(len(self)))
+
+    def popularity_less_than(self, threshold: float) -> np.ndarray:
+        """Boolean mask of the rows, one vectorized comparison for all rows."""
+        return self.popularity < threshold
+
+    def filter(self, mask: np.ndarray) -> "ProgrammingLanguagesTable":
+        """New table with the rows selected by the boolean mask, strings dictionary is shared."""
+        indexes = np.flatnonzero(mask)
+        lists = {}
+        for name, (offsets, codes, is_null) in self.lists.items():
+            starts, stops = offsets[indexes], offsets[indexes + 1]
+            lengths = stops - starts
+            new_offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int32)
+            # flat positions of the selected lists: start of every list + position inside the list
+            positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+            lists[name] = (new_offsets, codes[positions], is_null[indexes])
+        return ProgrammingLanguagesTable(self.strings, self.website[indexes], self.popularity[indexes],
+                                         self.note[indexes], lists)
+
+    def to_csv(self, path: str) -> None:
+        """List columns are joined by LIST_SEPARATOR, like in the scraped table."""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(ProgrammingLanguages.__dataclass_fields__.keys())
+            for record in self:
+                writer.writerow([record.website, record.popularity,
+                                 *(LIST_SEPARATOR.join(getattr(record, name) or ()) for name in LIST_COLUMNS),
+                                 record.note])
+
+    def save(self, path: str) -> None:
+        """Columnar binary file (numpy .npz): every column and the strings dictionary are stored as arrays.
+        Strings are one utf-8 buffer + offsets, like Arrow string arrays: no padding to the longest string,
+        NUL characters are kept, and the file is loaded without pickle."""
+        encoded = [value.encode("utf-8") for value in self.strings.values]
+        string_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=string_offsets[1:])
+        arrays = {"strings_data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+                  "strings_offsets": string_offsets, "website": self.website,
+                  "popularity": self.popularity, "note": self.note}
+        for name, (offsets, codes, is_null) in self.lists.items():
+            arrays[f"{name}_offsets"] = offsets
+            arrays[f"{name}_codes"] = codes
+            arrays[f"{name}_is_null"] = is_null
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "ProgrammingLanguagesTable":
+        with np.load(path) as arrays:
+            lists = {name: (arrays[f"{name}_offsets"], arrays[f"{name}_codes"], arrays[f"{name}_is_null"])
+                     for name in LIST_COLUMNS}
+            data, offsets = arrays["strings_data"].tobytes(), arrays["strings_offsets"].tolist()
+            strings = StringDictionary([data[start:stop].decode("utf-8") for start, stop in zip(offsets, offsets[1:])])
+            return cls(strings, arrays["website"], arrays["popularity"], arrays["note"], lists)
@@ -1,21 +1,39 @@
 from abc import ABC
 import logging
+import sys
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
-from ..pages.page_programming_languages import ProgrammingLanguagePage
+from ..pages.page_programming_languages import ProgrammingLanguagePage, WebsiteRow
+from ..pages.static_page_programming_languages import StaticProgrammingLanguagePage
 from selenium.webdriver.remote.webdriver import WebDriver
+from ..constants import Const
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _intern_all(values: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    return tuple(sys.intern(value) for value in values) if values is not None else None
+
+
+@dataclass(frozen=True, slots=True)
 class ProgrammingLanguages:
+    """Compact immutable scraped row: no instance __dict__, languages are interned strings in tuples."""
     website: Optional[str] = None
     popularity: float = 0.0
-    front_end: Optional[List[str]] = None
-    back_end: Optional[List[str]] = None
-    database: Optional[List[str]] = None
+    front_end: Optional[Tuple[str, ...]] = None
+    back_end: Optional[Tuple[str, ...]] = None
+    database: Optional[Tuple[str, ...]] = None
     note: Optional[str] = None
 
+    @classmethod
+    def from_row(cls, row: WebsiteRow) -> "ProgrammingLanguages":
+        website, popularity, front_end, back_end, database, note = row
+        return cls(_intern(website), popularity, _intern_all(front_end), _intern_all(back_end),
+                   _intern_all(database), _intern(note))
+
 
 class ProgrammingLanguagesUI(ABC):
 
@@ -24,14 +42,23 @@ class ProgrammingLanguagesUI(ABC):
         logging.info(f"Run _get_programming_languages_used_in_most_popular_websites()")
         programming_languages_page = ProgrammingLanguagePage(driver=driver)
 
-        num_website = programming_languages_page.get_count_all_websites()
-        websites_list = []
-        for row in range(1, num_website + 1):
-            website = programming_languages_page.get_website_name_by_row_table_cell(row)
-            popularity = programming_languages_page.get_popularity_by_row_table_cell(row)
-            front_end = programming_languages_page.get_front_end_by_row_table_cell(row)
-            back_end = programming_languages_page.get_back_end_by_row_table_cell(row)
-            database = programming_languages_page.get_database_by_row_table_cell(row)
-            note = programming_languages_page.get_note_by_row_table_cell(row)
-            websites_list.append(ProgrammingLanguages(website, popularity, front_end, back_end, database, note))
-        return websites_list
+        # the whole table is read by one snapshot, instead of a lookup per every cell
+        return [ProgrammingLanguages.from_row(row) for row in programming_languages_page.get_all_websites_rows()]
+
+    @staticmethod
+    def _iter_programming_languages_used_in_most_popular_websites(driver: WebDriver,
+                                                                  chunk_size: int = Const.TABLE_CHUNK_SIZE
+                                                                  ) -> Iterator[ProgrammingLanguages]:
+        """Yields rows as they are scraped, chunk_size rows per DOM round-trip.
+        Consumer can stop on the first failed row, without reading the whole table."""
+        logging.info(f"Run _iter_programming_languages_used_in_most_popular_websites({chunk_size=})")
+        programming_languages_page = ProgrammingLanguagePage(driver=driver)
+        for row in programming_languages_page.iter_all_websites_rows(chunk_size):
+            yield ProgrammingLanguages.from_row(row)
+
+    @staticmethod
+    def _get_programming_languages_from_html(html: str) -> List[ProgrammingLanguages]:
+        """Browser-free variant: parses saved html or driver.page_source by lxml."""
+        logging.info(f"Run _get_programming_languages_from_html()")
+        programming_languages_page = StaticProgrammingLanguagePage(html)
+        return [ProgrammingLanguages.from_row(row) for row in programming_languages_page.get_all_websites_rows()]
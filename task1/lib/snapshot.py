@@ -0,0 +1,46 @@
+import threading
+from typing import Callable, Generic, List, Optional, TypeVar
+
+TypeValue = TypeVar('TypeValue')
+TypeDerived = TypeVar('TypeDerived')
+
+
+class Snapshot(Generic[TypeValue]):
+    """Lazily computed value, that is shared between tests until it is invalidated.
+    loader is called on the first get() and after every invalidate(), concurrent workers wait for the one loading
+    """
+
+    __slots__ = "_loader", "_value", "_is_loaded", "_lock", "_dependents"
+
+    def __init__(self, loader: Callable[[], TypeValue]) -> None:
+        self._loader: Callable[[], TypeValue] = loader
+        self._value: Optional[TypeValue] = None
+        self._is_loaded: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._dependents: List[Snapshot] = []
+
+    def get(self) -> TypeValue:
+        with self._lock:
+            if not self._is_loaded:
+                self._value = self._loader()
+                self._is_loaded = True
+            return self._value
+
+    def derive(self, function: Callable[[TypeValue], TypeDerived]) -> "Snapshot[TypeDerived]":
+        """Snapshot of the value computed from this one, it is invalidated together with this snapshot."""
+        derived = Snapshot(lambda: function(self.get()))
+        self._dependents.append(derived)
+        return derived
+
+    def invalidate(self) -> None:
+        """Drops saved value, use it after the test that changes the page."""
+        with self._lock:
+            self._value = None
+            self._is_loaded = False
+        # derived snapshot takes its lock before this one in get(), so dependents are invalidated without it
+        for dependent in self._dependents:
+            dependent.invalidate()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
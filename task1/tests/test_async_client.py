@@ -0,0 +1,137 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from ..lib.aio.client import WEB_ELEMENT_KEY, AsyncWebDriver, AsyncWebElement
+from ..lib.launch_profile import LaunchProfiles
+
+
+class TestAsyncWebDriverJson:
+    driver = AsyncWebDriver(http=None, executor_url="http://localhost:9515/", session_id="session")
+
+    def test_web_element_key_is_w3c_identifier(self):
+        assert WEB_ELEMENT_KEY == "element-6066-11e4-a52e-4f735466cecf"
+
+    def test_unwrap_replaces_references_by_elements(self):
+        value = self.driver.unwrap({"rows": [{WEB_ELEMENT_KEY: "first"}, {WEB_ELEMENT_KEY: "second"}], "count": 2})
+        assert [element.id for element in value["rows"]] == ["first", "second"]
+        assert all(isinstance(element, AsyncWebElement) for element in value["rows"])
+        assert value["count"] == 2
+
+    def test_wrap_is_reverse_of_unwrap(self):
+        payload = [{WEB_ELEMENT_KEY: "first"}, "text", {"nested": [{WEB_ELEMENT_KEY: "second"}]}]
+        assert self.driver.wrap(self.driver.unwrap(payload)) == payload
+
+
+class StubWebDriverServer:
+    """Minimal W3C WebDriver endpoint: one session, one page with two rows."""
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.runner = None
+        self.url = None
+
+    def _reply(self, request, value, status=200):
+        self.requests.append((request.method, request.raw_path))
+        return web.json_response({"value": value}, status=status)
+
+    async def create_session(self, request):
+        self.capabilities = (await request.json())["capabilities"]
+        return self._reply(request, {"sessionId": "stub", "capabilities": {}})
+
+    async def find_element(self, request):
+        payload = await request.json()
+        if payload["value"] == "missing":
+            return self._reply(request, {"error": "no such element", "message": "missing"}, status=404)
+        return self._reply(request, {WEB_ELEMENT_KEY: "table"})
+
+    async def find_elements(self, request):
+        return self._reply(request, [{WEB_ELEMENT_KEY: "row-1"}, {WEB_ELEMENT_KEY: "row-2"}])
+
+    async def attribute(self, request):
+        return self._reply(request, request.match_info["name"])
+
+    async def delete_session(self, request):
+        return self._reply(request, None)
+
+    async def __aenter__(self) -> "StubWebDriverServer":
+        app = web.Application()
+        app.router.add_post("/session", self.create_session)
+        app.router.add_post("/session/stub/element", self.find_element)
+        app.router.add_post("/session/stub/element/{id}/elements", self.find_elements)
+        app.router.add_get("/session/stub/element/{id}/attribute/{name}", self.attribute)
+        app.router.add_delete("/session/stub", self.delete_session)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.runner.cleanup()
+
+
+class TestAsyncWebDriverSession:
+    def test_session_create_find_and_quit(self):
+        async def scenario():
+            async with StubWebDriverServer() as server:
+                driver = await AsyncWebDriver.start(LaunchProfiles.HEADLESS, executor_url=server.url)
+                assert driver.session_id == "stub"
+                assert "--headless=new" in server.capabilities["alwaysMatch"]["goog:chromeOptions"]["args"]
+
+                table = await driver.find_element(By.ID, "table")
+                rows = await table.find_elements(By.TAG_NAME, "tr")
+                await driver.quit()
+                return server.requests, table, rows
+
+        requests, table, rows = asyncio.run(scenario())
+        assert table.id == "table"
+        assert [row.id for row in rows] == ["row-1", "row-2"]
+        assert requests == [("POST", "/session"), ("POST", "/session/stub/element"),
+                            ("POST", "/session/stub/element/table/elements"), ("DELETE", "/session/stub")]
+
+    def test_error_is_selenium_exception(self):
+        async def scenario():
+            async with StubWebDriverServer() as server:
+                driver = await AsyncWebDriver.start(executor_url=server.url)
+                try:
+                    await driver.find_element(By.XPATH, "missing")
+                finally:
+                    await driver.quit()
+
+        with pytest.raises(NoSuchElementException):
+            asyncio.run(scenario())
+
+    def test_attribute_name_is_url_encoded(self):
+        async def scenario():
+            async with StubWebDriverServer() as server:
+                driver = await AsyncWebDriver.start(executor_url=server.url)
+                value = await AsyncWebElement(driver, "table").get_attribute("data-x/y?z")
+                await driver.quit()
+                return value, server.requests
+
+        value, requests = asyncio.run(scenario())
+        assert value == "data-x/y?z"
+        assert ("GET", "/session/stub/element/table/attribute/data-x%2Fy%3Fz") in requests
+
+    def test_quit_stops_service_out_of_event_loop(self):
+        class FakeService:
+            stopped_in = None
+
+            def stop(self):
+                FakeService.stopped_in = threading.get_ident()
+
+        async def scenario():
+            async with StubWebDriverServer() as server:
+                driver = await AsyncWebDriver.start(executor_url=server.url)
+                driver._service = FakeService()
+                await driver.quit()
+
+        asyncio.run(scenario())
+        assert FakeService.stopped_in not in (None, threading.get_ident())
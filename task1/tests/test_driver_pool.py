@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from ..lib.driver_pool import ABOUT_BLANK, DriverPool, DriverPoolError
+
+
+class FakeDriver:
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.is_alive = True
+        self.is_quit = False
+        self.urls = []
+
+    def execute_script(self, script, *args):
+        if not self.is_alive:
+            raise ConnectionError("browser is dead")
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def quit(self):
+        self.is_quit = True
+
+
+class FakeFactory:
+    def __init__(self) -> None:
+        self.drivers = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> FakeDriver:
+        with self._lock:
+            driver = FakeDriver(len(self.drivers))
+            self.drivers.append(driver)
+            return driver
+
+
+class TestDriverPool:
+    def test_prewarm_creates_all_sessions(self):
+        factory = FakeFactory()
+        DriverPool(factory, size=3)
+        assert len(factory.drivers) == 3
+
+    def test_released_session_is_reset_and_reused(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=1, prewarm=False)
+        with pool.session() as driver:
+            pass
+        assert driver.urls == [ABOUT_BLANK]
+        assert pool.acquire() is driver
+        assert len(factory.drivers) == 1
+
+    def test_busy_pool_doesnt_create_more_sessions_than_size(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=2, prewarm=False)
+        pool.acquire()
+        pool.acquire()
+        with pytest.raises(DriverPoolError):
+            pool.acquire(timeout=0.01)
+        assert len(factory.drivers) == 2
+
+    def test_unhealthy_session_is_replaced(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=1, prewarm=False)
+        with pool.session() as driver:
+            pass
+        driver.is_alive = False
+        replacement = pool.acquire()
+        assert replacement is not driver
+        assert driver.is_quit
+
+    def test_session_is_recycled_after_max_uses(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=1, max_uses=2, prewarm=False)
+        for _ in range(2):
+            with pool.session() as driver:
+                pass
+        assert driver.is_quit
+        assert pool.acquire() is not driver
+        assert len(factory.drivers) == 2
+
+    def test_failed_start_frees_the_slot(self):
+        factory = FakeFactory()
+        calls = []
+
+        def flaky_factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("can't start browser")
+            return factory()
+
+        pool = DriverPool(flaky_factory, size=1, prewarm=False)
+        with pytest.raises(ConnectionError):
+            pool.acquire()
+        assert pool.acquire() is factory.drivers[0]
+
+    def test_concurrent_workers_share_sessions(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=2, max_uses=1000, prewarm=False)
+        in_use = set()
+        errors = []
+        lock = threading.Lock()
+
+        def work():
+            for _ in range(20):
+                with pool.session(timeout=5) as driver:
+                    with lock:
+                        if driver.number in in_use:
+                            errors.append(driver.number)
+                        in_use.add(driver.number)
+                    with lock:
+                        in_use.discard(driver.number)
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert len(factory.drivers) <= 2
+
+    def test_failed_prewarm_quits_started_sessions(self):
+        factory = FakeFactory()
+        calls = []
+
+        def flaky_factory():
+            calls.append(1)
+            if len(calls) == 2:
+                raise ConnectionError("can't start browser")
+            return factory()
+
+        with pytest.raises(ConnectionError):
+            DriverPool(flaky_factory, size=3)
+        assert len(factory.drivers) == 2
+        assert all(driver.is_quit for driver in factory.drivers)
+
+    def test_closed_pool_quits_idle_sessions(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, size=2)
+        pool.close()
+        assert all(driver.is_quit for driver in factory.drivers)
+        with pytest.raises(DriverPoolError):
+            pool.acquire()
@@ -0,0 +1,77 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from ..lib.elements.elements import (Button, Checkbox, ClickableField, ElementLocatedInParent,
+                                     ElementToBeClickableInParent, IndexOneOfElementsLocated, Link, MenuItem,
+                                     PolymorphicElement, StaleParentElementError)
+
+
+class FakeDriver:
+    session_id = "fake"
+
+    def __init__(self, script_result=None, script_error=None):
+        self.script_result = script_result
+        self.script_error = script_error
+        self.script_arguments = None
+
+    def execute_script(self, script, *arguments):
+        self.script_arguments = arguments
+        if self.script_error:
+            raise self.script_error
+        return self.script_result
+
+
+class FakeWebElement(WebElement):
+    """Web element without a browser, children are found by the locator."""
+
+    def __init__(self, element_id, children=None, displayed=True, enabled=True):
+        super().__init__(parent=FakeDriver(), id_=element_id)
+        self.children = children or {}
+        self.displayed = displayed
+        self.enabled = enabled
+
+    def find_element(self, by=By.ID, value=None):
+        return self.children[(by, value)]
+
+    def is_displayed(self):
+        return self.displayed
+
+    def is_enabled(self):
+        return self.enabled
+
+
+BUTTON = (By.XPATH, "./button")
+
+
+class TestClickableElementsInParent:
+    @pytest.mark.parametrize("element_class", [Button, Checkbox, ClickableField, Link, MenuItem])
+    def test_parent_scopes_clickable_condition(self, element_class):
+        parent = FakeWebElement("row")
+        element = element_class(BUTTON, parent=parent)
+        assert isinstance(element._condition, ElementToBeClickableInParent)
+        assert element._cache_key == ("row", BUTTON)
+        assert not isinstance(element_class(BUTTON)._condition, ElementLocatedInParent)
+
+    def test_only_visible_and_enabled_child_is_clickable(self):
+        button = FakeWebElement("button", enabled=False)
+        condition = ElementToBeClickableInParent(FakeWebElement("row", {BUTTON: button}), BUTTON)
+        assert condition(FakeDriver()) is False
+        button.enabled = True
+        assert condition(FakeDriver()) is button
+
+
+class TestPolymorphicElementInParent:
+    def test_locators_are_relative_to_parent(self):
+        parent = FakeWebElement("row")
+        element = PolymorphicElement([BUTTON, (By.XPATH, "./a")], parent=parent)
+        assert isinstance(element._condition, IndexOneOfElementsLocated)
+        driver = FakeDriver(script_result=[1, FakeWebElement("link")])
+        assert element._condition(driver) == "1"
+        assert driver.script_arguments == ([list(BUTTON), [By.XPATH, "./a"]], parent)
+
+    def test_stale_parent_is_not_waited(self):
+        condition = IndexOneOfElementsLocated([BUTTON], FakeWebElement("row"))
+        with pytest.raises(StaleParentElementError):
+            condition(FakeDriver(script_error=StaleElementReferenceException("stale")))
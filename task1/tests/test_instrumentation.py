@@ -0,0 +1,48 @@
+from ..lib.instrumentation import Event, EventKind, Recorder, folded_stacks
+
+
+class TestFoldedStacks:
+    def test_self_time_excludes_nested_events(self):
+        events = [
+            Event(EventKind.COMMAND, "findElement", 0.1, 0.25, "//td", ("action:click",)),
+            Event(EventKind.SLEEP, "sleep", 0.4, 0.5, "//td", ("action:click",)),
+            Event(EventKind.ACTION, "click", 0.0, 1.0, "//td", ()),
+        ]
+        assert folded_stacks("test_table", events) == [
+            "test_table;action:click;command:findElement 250000",
+            "test_table;action:click;sleep:sleep 500000",
+            "test_table;action:click 250000",
+        ]
+
+    def test_sibling_spans_on_the_same_stack(self):
+        events = [
+            Event(EventKind.COMMAND, "find", 0.0, 0.9, None, ("action:read",)),
+            Event(EventKind.ACTION, "read", 0.0, 1.0, None, ()),
+            Event(EventKind.COMMAND, "find", 1.0, 0.1, None, ("action:read",)),
+            Event(EventKind.ACTION, "read", 1.0, 1.0, None, ()),
+        ]
+        assert folded_stacks("t", events) == ["t;action:read;command:find 1000000", "t;action:read 1000000"]
+
+    def test_no_events(self):
+        assert folded_stacks("test_empty", []) == []
+
+
+class TestRecorder:
+    def test_disabled_recorder_records_nothing(self):
+        recorder = Recorder()
+        with recorder.span(EventKind.ACTION, "click"), recorder.span(EventKind.ACTION, "click"):
+            pass
+        recorder.start()
+        assert recorder.stop() == []
+
+    def test_nested_spans_have_stack(self):
+        recorder = Recorder()
+        recorder.enabled = True
+        recorder.start()
+        with recorder.span(EventKind.ACTION, "click", locator="//td"):
+            with recorder.span(EventKind.COMMAND, "findElement"):
+                pass
+        command, action = recorder.stop()
+        assert (command.stack, command.locator) == (("action:click",), "//td")
+        assert (action.stack, action.locator) == ((), "//td")
+        assert recorder.totals_by_locator["//td"][0] == 1
@@ -0,0 +1,58 @@
+import pytest
+
+from ..lib import launch_profile
+from ..lib.launch_profile import (FONTS_URL_PATTERNS, IMAGES_URL_PATTERNS, MEDIA_URL_PATTERNS, LaunchProfile,
+                                  LaunchProfiles)
+
+
+class FakeChrome:
+    def __init__(self, options):
+        self.options = options
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, arguments):
+        self.cdp_commands.append((command, arguments))
+
+
+class TestLaunchProfile:
+    def test_default_profile_has_no_arguments(self):
+        options = LaunchProfiles.DEFAULT.options()
+        assert options.arguments == []
+        assert options.experimental_options == {}
+        assert options.page_load_strategy == "normal"
+        assert LaunchProfiles.DEFAULT.blocked_urls() == []
+
+    def test_fast_profile_options(self):
+        options = LaunchProfiles.FAST.options()
+        assert options.arguments == ["--headless=new", "--disable-extensions", "--disable-gpu",
+                                     "--window-size=1920,1080", "--blink-settings=imagesEnabled=false"]
+        assert options.experimental_options == {"prefs": {"profile.managed_default_content_settings.images": 2}}
+        assert options.page_load_strategy == "eager"
+
+    @pytest.mark.parametrize("flags, patterns", [
+        ({"block_images": True}, IMAGES_URL_PATTERNS),
+        ({"block_fonts": True}, FONTS_URL_PATTERNS),
+        ({"block_media": True}, MEDIA_URL_PATTERNS),
+        ({"block_images": True, "block_fonts": True, "block_media": True},
+         IMAGES_URL_PATTERNS + FONTS_URL_PATTERNS + MEDIA_URL_PATTERNS),
+    ])
+    def test_blocked_urls(self, flags, patterns):
+        assert LaunchProfile("blocking", **flags).blocked_urls() == patterns
+
+    def test_blocked_urls_are_not_shared(self):
+        LaunchProfiles.FAST.blocked_urls().append("*.html")
+        assert "*.html" not in LaunchProfiles.FAST.blocked_urls()
+        assert "*.html" not in IMAGES_URL_PATTERNS
+
+    def test_create_driver_blocks_urls_by_cdp(self, monkeypatch):
+        monkeypatch.setattr(launch_profile.webdriver, "Chrome", FakeChrome)
+        driver = LaunchProfile("fonts", block_fonts=True).create_driver()
+        assert driver.cdp_commands == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": FONTS_URL_PATTERNS})]
+        assert LaunchProfiles.DEFAULT.create_driver().cdp_commands == []
+
+
+class TestLaunchProfiles:
+    def test_by_name(self):
+        assert LaunchProfiles.by_name("fast") is LaunchProfiles.FAST
+        with pytest.raises(ValueError):
+            LaunchProfiles.by_name("unknown")
@@ -0,0 +1,44 @@
+import pytest
+
+from ..lib.by_type import ByType
+from ..lib.locators.locator import Locator, compiled_xpath
+
+
+class Page:
+    STATIC = Locator("//table[@class='{{wikitable}}']")
+    ROW = Locator("//table//tr[{row}]/td[{column}]")
+
+
+class TestLocator:
+    def test_static_locator_is_prepared_tuple(self):
+        assert Page.STATIC == (ByType.XPATH, "//table[@class='{wikitable}']")
+        assert Page.STATIC is Page.STATIC
+
+    def test_parametric_locator_is_formatted_on_call(self):
+        assert isinstance(Page.ROW, Locator)
+        assert Page.ROW.is_parametric
+        assert Page.ROW(row=2, column=3) == (ByType.XPATH, "//table//tr[2]/td[3]")
+        assert Page.ROW(row=2, column=3) is Page.ROW(row=2, column=3)
+
+    def test_unhashable_arguments_are_formatted_without_cache(self):
+        locator = Locator("//div[@id='{0[0]}']", by=ByType.XPATH)
+        assert locator(["first"]) == (ByType.XPATH, "//div[@id='first']")
+
+    def test_formatting_errors_are_raised(self):
+        locator = Locator("//div[@id='{0:d}']", by=ByType.XPATH)
+        with pytest.raises(ValueError):
+            locator("first")
+        with pytest.raises(TypeError):
+            Locator("//div[@id='{0[0]}']", by=ByType.XPATH)(1)
+        with pytest.raises(KeyError):
+            Page.ROW(row=2)
+
+
+class TestCompiledXpath:
+    def test_xpath_is_compiled_once(self):
+        locator = (ByType.XPATH, "//td")
+        assert compiled_xpath(locator) is compiled_xpath(locator)
+
+    def test_css_locator_is_rejected(self):
+        with pytest.raises(ValueError):
+            compiled_xpath((ByType.CSS_SELECTOR, "td"))
@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ..lib.launch_profile import LaunchProfile
+from ..lib.offline.archive import ASSETS_DIR, MANIFEST_FILE, PAGE_FILE, record_page
+from ..lib.offline.server import ArchiveServer
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+<link rel="stylesheet" href="style.css">
+<link rel="canonical" href="/wiki/page.html">
+<script src="/app.js"></script>
+<style>.logo { background: url(logo.png) }</style>
+</head><body>
+<p title="logo.png">"logo.png" is the text, not the asset</p>
+<img src="logo.png" srcset="logo.png 1x, logo@2x.png 2x">
+<img src="missing.png">
+<div style="background-image: url('logo@2x.png')"></div>
+</body></html>
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def live_site(tmp_path):
+    """Local stand-in of the live site."""
+    site = tmp_path / "site"
+    (site / "wiki").mkdir(parents=True)
+    (site / "wiki" / "page.html").write_text(PAGE)
+    (site / "wiki" / "style.css").write_text('@import "print.css"; body { background: url(/logo.png) }')
+    (site / "wiki" / "print.css").write_text("@font-face { src: url('font.woff2') }")
+    (site / "wiki" / "font.woff2").write_bytes(b"font")
+    (site / "wiki" / "logo.png").write_bytes(b"logo")
+    (site / "wiki" / "logo@2x.png").write_bytes(b"logo 2x")
+    (site / "logo.png").write_bytes(b"root logo")
+    (site / "app.js").write_text("console.log('app');")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(site)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/wiki/page.html"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+
+class TestRecordPage:
+    def test_assets_are_local(self, live_site, tmp_path):
+        archive_dir = str(tmp_path / "archive")
+        manifest = record_page(live_site, archive_dir)
+        with open(os.path.join(archive_dir, PAGE_FILE), encoding="utf-8") as file:
+            html = file.read()
+
+        assets = manifest["assets"]
+        names = ("style.css", "logo.png", "logo@2x.png")
+        local = {name: assets[live_site.replace("page.html", name)] for name in names}
+        assert f'href="{local["style.css"]}"' in html
+        assert f'src="{local["logo.png"]}"' in html
+        assert f'srcset="{local["logo.png"]} 1x, {local["logo@2x.png"]} 2x"' in html
+        assert f'url("{local["logo.png"]}")' in html
+        assert f"""style='background-image: url("{local["logo@2x.png"]}")'""" in html
+        # only asset attributes are rewritten
+        assert '<p title="logo.png">"logo.png" is the text, not the asset</p>' in html
+        assert 'href="/wiki/page.html"' in html
+        assert 'src="missing.png"' in html
+        assert html.startswith("<!DOCTYPE html>")
+
+    def test_stylesheet_urls_are_local(self, live_site, tmp_path):
+        archive_dir = str(tmp_path / "archive")
+        assets = record_page(live_site, archive_dir)["assets"]
+        style_path = os.path.join(archive_dir, assets[live_site.replace("page.html", "style.css")].lstrip("/"))
+        with open(style_path) as file:
+            style = file.read()
+        print_url = assets[live_site.replace("page.html", "print.css")]
+        logo_url = assets[live_site.replace("wiki/page.html", "logo.png")]
+        assert style == f'@import "{print_url}"; body {{ background: url("{logo_url}") }}'
+        with open(os.path.join(archive_dir, print_url.lstrip("/"))) as file:
+            assert assets[live_site.replace("page.html", "font.woff2")] in file.read()
+
+
+class TestArchiveServer:
+    def test_serves_page_and_assets_only(self, live_site, tmp_path):
+        archive_dir = str(tmp_path / "archive")
+        manifest = record_page(live_site, archive_dir)
+        with ArchiveServer(archive_dir) as server:
+            assert server.original_url == live_site
+            assert server.page_url.endswith("/wiki/page.html")
+            assert b"<html>" in _get(server.page_url)
+            asset_path = manifest["assets"][live_site.replace("page.html", "logo.png")]
+            assert _get(server.page_url.replace("/wiki/page.html", asset_path)) == b"logo"
+            with pytest.raises(urllib.error.HTTPError):
+                _get(server.page_url.replace("page.html", "logo.png"))
+
+    def test_missing_archive(self, tmp_path):
+        assert not os.path.exists(tmp_path / MANIFEST_FILE)
+        with pytest.raises(FileNotFoundError):
+            ArchiveServer(str(tmp_path))
+
+
+class TestOfflineProfile:
+    def test_other_hosts_are_not_resolved(self):
+        arguments = LaunchProfile("offline", offline=True).options().arguments
+        assert any(argument.startswith("--host-resolver-rules=MAP * ~NOTFOUND") for argument in arguments)
+        assert not any("host-resolver" in argument for argument in LaunchProfile("live").options().arguments)
+
+
+def test_manifest_is_json(live_site, tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    record_page(live_site, archive_dir)
+    with open(os.path.join(archive_dir, MANIFEST_FILE)) as file:
+        assert json.load(file)["path"] == "/wiki/page.html"
+    assert os.path.isdir(os.path.join(archive_dir, ASSETS_DIR))
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from ..lib.popularity_evaluation import PopularityEvaluation
+from ..lib.server_ui.programming_languages_ui import ProgrammingLanguages
+
+WEBSITES = [
+    ProgrammingLanguages("Google", 1e9, ("JavaScript",), ("C++",), None, None),
+    ProgrammingLanguages("Wikipedia", 5e7, ("JavaScript",), ("PHP", "Hack"), None, None),
+    ProgrammingLanguages("Bing", 5e8, ("JavaScript",), None, None, None),
+]
+
+
+@pytest.fixture
+def evaluation() -> PopularityEvaluation:
+    return PopularityEvaluation(WEBSITES, [1e7, 1e8, 6e8, 2e9])
+
+
+class TestPopularityEvaluation:
+    def test_failures_count_by_threshold(self, evaluation):
+        assert evaluation.failures_count.tolist() == [0, 1, 2, 3]
+        assert evaluation.is_passed(1e7)
+        assert not evaluation.is_passed(1e8)
+
+    def test_matrix_in_order_of_websites(self, evaluation):
+        assert np.array_equal(evaluation.matrix, [[True, True, True, False],
+                                                  [True, False, False, False],
+                                                  [True, True, False, False]])
+
+    def test_failed_websites_in_order_of_page(self, evaluation):
+        assert [website.website for website in evaluation.failed_websites(6e8)] == ["Wikipedia", "Bing"]
+
+    def test_failure_messages_show_lists(self, evaluation):
+        assert evaluation.failure_messages(6e8) == [
+            "Wikipedia (Frontend:['JavaScript']|Backend['PHP', 'Hack']) has 50000000.0 unique visitor per month. "
+            "Expected more 600000000.0  ",
+            "Bing (Frontend:['JavaScript']|BackendNone) has 500000000.0 unique visitor per month. "
+            "Expected more 600000000.0  ",
+        ]
+
+    def test_not_evaluated_threshold(self, evaluation):
+        with pytest.raises(KeyError):
+            evaluation.is_passed(42)
@@ -0,0 +1,59 @@
+import csv
+
+import numpy as np
+import pytest
+
+from ..lib.server_ui.programming_languages_table import ProgrammingLanguagesTable
+from ..lib.server_ui.programming_languages_ui import ProgrammingLanguages
+
+RECORDS = [
+    ProgrammingLanguages("Google", 1.5e9, ("JavaScript", "TypeScript"), ("C", "C++", "Go"), ("Bigtable",), "note"),
+    ProgrammingLanguages("Bing", 1e9, (), ("C++", "C#"), None, None),
+    ProgrammingLanguages("Yahoo", 5e8, ("JavaScript",), None, ("PostgreSQL",), None),
+]
+
+
+@pytest.fixture
+def table() -> ProgrammingLanguagesTable:
+    return ProgrammingLanguagesTable.from_records(RECORDS)
+
+
+class TestProgrammingLanguagesTable:
+    def test_records_round_trip(self, table):
+        assert list(table) == RECORDS
+
+    def test_strings_are_stored_once(self, table):
+        assert table.strings.values.count("C++") == 1
+
+    def test_filter_keeps_lists_of_selected_rows(self, table):
+        assert list(table.filter(table.popularity_less_than(1.2e9))) == RECORDS[1:]
+        assert list(table.filter(np.array([True, False, True]))) == [RECORDS[0], RECORDS[2]]
+        assert list(table.filter(table.popularity_less_than(0))) == []
+
+    def test_save_and_load(self, table, tmp_path):
+        path = tmp_path / "table.npz"
+        table.save(path)
+        with np.load(path) as arrays:
+            assert arrays["strings_data"].dtype == np.uint8
+            assert len(arrays["strings_offsets"]) == len(table.strings) + 1
+        assert list(ProgrammingLanguagesTable.load(path)) == RECORDS
+
+    def test_save_and_load_nul_and_unicode_strings(self, tmp_path):
+        records = [ProgrammingLanguages("trailing\0\0", 1.0, ("\0", ""), ("C\0++", "Jäva"), None, "日本語")]
+        path = tmp_path / "table.npz"
+        ProgrammingLanguagesTable.from_records(records).save(path)
+        assert list(ProgrammingLanguagesTable.load(path)) == records
+
+    def test_save_and_load_empty_table(self, tmp_path):
+        path = tmp_path / "table.npz"
+        ProgrammingLanguagesTable.from_records([]).save(path)
+        assert list(ProgrammingLanguagesTable.load(path)) == []
+
+    def test_to_csv(self, table, tmp_path):
+        path = tmp_path / "table.csv"
+        table.to_csv(path)
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ["website", "popularity", "front_end", "back_end", "database", "note"]
+        assert rows[1] == ["Google", "1500000000.0", "JavaScript,TypeScript", "C,C++,Go", "Bigtable", "note"]
+        assert rows[2] == ["Bing", "1000000000.0", "", "C++,C#", "", ""]
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from ..lib.pages.page_programming_languages import ProgrammingLanguagePage
+from ..lib.retry_budget import (CircuitBreaker, CircuitOpenError, RetryBudget, RetryBudgetExceeded, RetryBudgets,
+                                retry_budgets)
+
+
+class TestRetryBudget:
+    def test_charges_are_summed_by_locator(self):
+        budget = RetryBudget("test", limit=10)
+        budget.charge("first", 1.5)
+        budget.charge("second", 3)
+        budget.charge("first", 2)
+        assert budget.spent == 6.5
+        assert budget.remaining == 3.5
+        assert budget.top_locators(1) == [("first", 3.5)]
+
+
+class TestCircuitBreaker:
+    def test_opens_after_failures_in_a_row(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_time=60)
+        breaker.record_failure("row")
+        breaker.record_success("row")
+        breaker.record_failure("row")
+        breaker.before_call("row")
+        breaker.record_failure("row")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("row")
+        breaker.before_call("other row")
+        assert breaker.open_locators == ["row"]
+
+    def test_half_open_after_reset_time(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_time=0)
+        for _ in range(3):
+            breaker.record_failure("row")
+        assert breaker.before_call("row") is None  # trial call is allowed
+        breaker.record_failure("row")
+        assert breaker.open_locators == ["row"]
+
+
+class TestRetryBudgets:
+    def test_retry_time_is_charged_from_first_failure(self):
+        budgets = RetryBudgets()
+        with budgets.activate(RetryBudget("test", limit=10)) as budget:
+            start = time.time()
+            with budgets.scope("locator", timeout=5):
+                time.sleep(0.01)
+                failed_at = time.time()
+                budgets.record_failure()
+                time.sleep(0.02)
+            finished = time.time()
+            with budgets.scope("passed by the first attempt", timeout=5):
+                time.sleep(0.01)
+        assert 0.02 <= budget.spent <= finished - failed_at < finished - start
+        assert list(budget.spent_by_locator) == ["locator"]
+
+    def test_spent_budget_fails_fast(self):
+        budgets = RetryBudgets()
+        with budgets.activate(RetryBudget("test", limit=0.01)):
+            with pytest.raises(RetryBudgetExceeded):
+                with budgets.scope("locator", timeout=5) as scope:
+                    assert scope.is_limited_by_budget
+                    budgets.record_failure()
+                    time.sleep(0.02)
+                    raise TimeoutException("not found")
+            with pytest.raises(RetryBudgetExceeded):
+                with budgets.scope("other", timeout=5):
+                    pass
+
+    def test_report_keeps_only_the_most_spent_budgets(self):
+        budgets = RetryBudgets(report_size=2)
+        for spent in (1, 5, 0, 3, 2):
+            budget = RetryBudget(f"test {spent}", limit=10)
+            budget.charge("locator", spent)
+            with budgets.activate(budget):
+                pass
+        assert [budget.name for budget in budgets.finished] == ["test 5", "test 3"]
+        assert budgets.report(count=1) == ["    5.000s of 10s  test 5", "        5.000s  locator"]
+
+
+class FakeDriver:
+    def get(self, url):
+        pass
+
+
+@pytest.fixture
+def page_without_browser(monkeypatch) -> ProgrammingLanguagePage:
+    monkeypatch.setattr(ProgrammingLanguagePage, "_post_init", lambda self: None)
+    yield ProgrammingLanguagePage(FakeDriver())
+    retry_budgets.breaker.reset()
+
+
+class TestFailFastOnPage:
+    def test_open_circuit_is_not_hidden_by_page_fallbacks(self, page_without_browser):
+        locs = page_without_browser._locs
+        for locator in (locs.ALL_WEBSITES_TABLE_ROWS, locs.ALL_WEBSITES_ELEMENTS):
+            for _ in range(retry_budgets.breaker.failure_threshold):
+                retry_budgets.breaker.record_failure(str(locator))
+
+        # without the circuit breaker these methods return [] and 0 on timeout
+        with pytest.raises(CircuitOpenError):
+            page_without_browser.get_all_websites_rows()
+        with pytest.raises(CircuitOpenError):
+            page_without_browser.get_count_all_websites()
+        with pytest.raises(CircuitOpenError):
+            list(page_without_browser.iter_all_websites_rows())
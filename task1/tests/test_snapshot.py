@@ -0,0 +1,52 @@
+import threading
+import time
+
+from ..lib.snapshot import Snapshot
+
+
+class TestSnapshot:
+    def test_value_is_loaded_once(self):
+        calls = []
+        snapshot = Snapshot(lambda: calls.append(1) or len(calls))
+        assert not snapshot.is_loaded
+        assert snapshot.get() == snapshot.get() == 1
+        assert snapshot.is_loaded
+
+    def test_invalidate_loads_again(self):
+        calls = []
+        snapshot = Snapshot(lambda: calls.append(1) or len(calls))
+        snapshot.get()
+        snapshot.invalidate()
+        assert not snapshot.is_loaded
+        assert snapshot.get() == 2
+
+    def test_concurrent_workers_wait_for_one_loading(self):
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        snapshot = Snapshot(load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(snapshot.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    def test_derived_snapshot_is_invalidated_with_source(self):
+        source = Snapshot(lambda: [1, 2, 3])
+        derived_calls = []
+        derived = source.derive(lambda values: derived_calls.append(1) or sum(values))
+        assert derived.get() == 6
+        assert derived.get() == 6
+        assert len(derived_calls) == 1
+
+        source.invalidate()
+        assert not source.is_loaded and not derived.is_loaded
+        assert derived.get() == 6
+        assert len(derived_calls) == 2
@@ -0,0 +1,61 @@
+import os
+import pathlib
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..lib.by_type import ByType
+from ..lib.locators.locator import Locator
+from ..lib.locators.locators_programming_language import ProgrammingLanguagesLocators
+from ..lib.pages.page_programming_languages import ProgrammingLanguagePage
+from ..lib.pages.static_page_programming_languages import StaticProgrammingLanguagePage
+
+PAGE_FILE = os.path.join(os.path.dirname(__file__), "data", "programming_languages.html")
+
+EXPECTED_ROWS = [
+    ("Google", 4.9e9, ["JavaScript", " TypeScript"], ["C", " C++", " Go", "[3] Java", " Python", " Node"],
+     ["Bigtable", "[4] MariaDB[5]"], "The most used search engine in the world"),
+    ("Facebook", 1.12e9, ["JavaScript", " TypeScript", " Flow"],
+     ["Hack", " PHP (HHVM)", " Python", " C++", " Java", " Erlang", " D", "\nXHP", "[6] Haskell"],
+     ["MariaDB", " MySQL", "[7] HBase", " Cassandra"], "The most visited social networking site"),
+    ("Wikipedia", 4.75e8, ["JavaScript"], ["PHP", " Hack"], ["MariaDB"], '"Free Online Encyclopedia"'),
+    ("Bing", 1.1e9, ["JavaScript"], ["C++", " C#"], ["Microsoft\xa0SQL Server", " Cosmos DB"], None),
+]
+
+
+class TestStaticProgrammingLanguagePage:
+    def test_rows_are_read_like_inner_text(self):
+        page = StaticProgrammingLanguagePage.from_file(PAGE_FILE)
+        assert page.get_all_websites_rows() == EXPECTED_ROWS
+
+    def test_row_getters_read_the_same_cells(self):
+        page = StaticProgrammingLanguagePage.from_file(PAGE_FILE)
+        assert page.get_count_all_websites() == len(EXPECTED_ROWS) + 1  # with the header row
+        assert page.get_popularity_by_row_table_cell(2) == 4.9e9
+        assert page.get_back_end_by_row_table_cell(4) == ["PHP", " Hack"]
+        assert page.get_note_by_row_table_cell(5) is None
+
+    def test_missing_required_cell_is_error(self):
+        page = StaticProgrammingLanguagePage(
+            "<table><caption>Programming languages</caption><tbody><tr><td>Site</td></tr></tbody></table>")
+        with pytest.raises(NoSuchElementException):
+            page.get_popularity_by_row_table_cell(1)
+
+    @pytest.mark.parametrize("row", [0, len(EXPECTED_ROWS) + 2])
+    def test_out_of_range_row_is_error(self, row):
+        page = StaticProgrammingLanguagePage.from_file(PAGE_FILE)
+        with pytest.raises(NoSuchElementException):
+            page.get_website_name_by_row_table_cell(row)
+
+
+def test_static_and_selenium_backends_read_the_same_rows(driver: WebDriver, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ProgrammingLanguagesLocators, "PROGRAMMING_LANGUAGES_URL",
+                        Locator(pathlib.Path(PAGE_FILE).as_uri(), by=ByType.URL))
+    selenium_page = ProgrammingLanguagePage(driver)
+    static_page = StaticProgrammingLanguagePage.from_file(PAGE_FILE)
+    assert selenium_page.get_all_websites_rows() == static_page.get_all_websites_rows()
+    for page in (selenium_page, static_page):
+        for row in (0, len(EXPECTED_ROWS) + 2):
+            with pytest.raises(NoSuchElementException):
+                page.get_website_name_by_row_table_cell(row)
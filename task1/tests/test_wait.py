@@ -0,0 +1,32 @@
+import time
+
+from ..lib.elements.wait import BackoffSchedule, PollSchedule
+
+
+class TestBackoffSchedule:
+    def test_delay_grows_up_to_maximum(self):
+        schedule = BackoffSchedule(initial=0.1, maximum=0.5, factor=2, jitter=0)
+        assert [schedule.next_delay() for _ in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    def test_reset_starts_from_initial_delay(self):
+        schedule = BackoffSchedule(initial=0.1, maximum=0.5, factor=2, jitter=0)
+        schedule.next_delay()
+        schedule.next_delay()
+        schedule.reset()
+        assert schedule.next_delay() == 0.1
+
+    def test_jitter_is_bounded(self):
+        schedule = BackoffSchedule(initial=1, maximum=1, factor=2, jitter=0.2)
+        assert all(0.8 <= schedule.next_delay() <= 1.2 for _ in range(100))
+
+    def test_delay_never_exceeds_deadline(self):
+        schedule = BackoffSchedule(initial=10, maximum=10, factor=2, jitter=0)
+        assert schedule.delay_until(time.time() + 0.05) <= 0.05
+        assert schedule.delay_until(time.time() - 1) is None
+        assert not schedule.sleep(time.time() - 1)
+
+
+class TestPollSchedule:
+    def test_fixed_delay(self):
+        schedule = PollSchedule(0.3)
+        assert [schedule.next_delay() for _ in range(3)] == [0.3, 0.3, 0.3]
@@ -29,6 +29,8 @@ class Settings:
     SIX_PIXELS: int = 6
 
     BUTTON_B1: str = '<B1-Motion>'
+    BUTTON_B1_RELEASE: str = '<ButtonRelease-1>'
+    BUTTON_1: str = '<Button-1>'
     BUTTON_3: str = '<Button-3>'
 
     COLON: str = ':'
@@ -43,6 +45,17 @@ class Settings:
 
     FALSE_VALUE: bool = False
 
+    ROUND: str = 'round'
+    ANCHOR_NW: str = 'nw'
+    END: str = 'end'
+    RELIEF_SUNKEN: str = 'sunken'
+    RELIEF_RAISED: str = 'raised'
+    FILL_TOLERANCE: int = 0  # max difference of color channels of the filled pixels from the clicked one
+    STROKE_BUFFER_SIZE: int = 256  # points, the buffer grows twice when it is full
+    STROKE_CHUNK_SEGMENTS: int = 64  # segments of the stroke rasterized in one box
+    STROKE_CHUNK_PIXELS: int = 4_000_000  # pixel-segment distances computed at once
+    TILE_SIZE: int = 256  # pixels, side of the backing image tile
+
 
 class Title:
     ENGINE2D: str = 'Engine2D'
@@ -59,6 +72,11 @@ class Title:
     CLEAR: str = 'Clear'
 
 
+class Tool:
+    PEN: str = 'pen'
+    FILL: str = 'fill'
+
+
 class Color:
     WHITE: str = 'white'
     BLACK: str = 'black'
@@ -1,167 +1,125 @@
-from tkinter import *
-from PIL import Image, ImageDraw
 from random import randint
-from tkinter import colorchooser, messagebox
-from figures import Circle, Rectangle, Triangle
-from constants import Settings, Title, Color
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from figures import Circle, FillArea, Figure, Rectangle, Stroke, Triangle
+from constants import Settings, Color, Tool
+from flood_fill import flood_fill_mask
+from scene import Scene
+from tiled_image import TiledDraw, TiledImage
 
 
 class Engine2D:
+    """Drawing engine on the Pillow image. Tk window is an optional front-end:
+    Engine2D(headless=True) doesn't touch Tk at all, so it works on a server without a display."""
     x: int = Settings.POINT_ZERO
     y: int = Settings.POINT_ZERO
-    root: Tk = Tk()
     brush_size: int = Settings.SIZE_TEN
     color: str = Color.BLACK
-    canvas: Canvas = Canvas(root, bg=Color.WHITE)
-    menu: Menu = Menu(tearoff=0)
-    image1: Image = Image.new('RGB', (Settings.POINT_1280, Settings.POINT_640), Color.WHITE)
-    draw_img: ImageDraw = ImageDraw.Draw(image1)
-    color_lab: Label = Label(root, bg=color, width=Settings.WIDTH_TEN)
-    start_value: IntVar = IntVar(value=Settings.TEN_VALUE)
-    figures = []
-
-    def __init__(self) -> None:
-        self._post_init()
-        # self.root.mainloop()
-
-    def _post_init(self) -> None:
-        self._init_root()
-        self._init_canvas()
-        self._create_menu()
-        self._create_interface()
-
-    def _init_root(self) -> None:
-        self.root.title(Title.ENGINE2D)
-        self.root.geometry(Settings.SIZE_1280x720)
-        self.root.resizable(Settings.FALSE_VALUE,
-                            Settings.FALSE_VALUE)
-        self.root.columnconfigure(Settings.SIX_COLUMN,
-                                  weight=Settings.WEIGHT_ONE)
-        self.root.rowconfigure(Settings.TWO_ROW,
-                               weight=Settings.WEIGHT_ONE)
-
-    def _init_canvas(self) -> None:
-        self.canvas.grid(row=Settings.TWO_ROW,
-                         column=Settings.ZERO_COLUMN,
-                         columnspan=Settings.SEVEN_COLUMN,
-                         padx=Settings.FIVE_PIXELS,
-                         pady=Settings.FIVE_PIXELS,
-                         sticky=E + W + S + N)
-        self.canvas.bind(Settings.BUTTON_B1, self.draw_pen)
-        self.canvas.bind(Settings.BUTTON_3, self.popup)
-
-    def _create_menu(self) -> None:
-        self.menu.add_command(label=Title.RECTANGLE, command=self.draw_rectangle)
-        self.menu.add_command(label=Title.CIRCLE, command=self.draw_circle)
-        self.menu.add_command(label=Title.TRIANGLE, command=self.draw_triangle)
-
-    def _create_interface(self) -> None:
-        Label(self.root,
-              text=Title.OPTIONS + Settings.COLON).grid(row=Settings.ZERO_ROW,
-                                                        column=Settings.ZERO_COLUMN,
-                                                        padx=Settings.SIX_PIXELS)
-        Button(self.root,
-               text=Title.CHOOSE_COLOR,
-               width=Settings.WEIGHT_ELEVEN,
-               command=self.choose_color).grid(row=Settings.ZERO_ROW,
-                                               column=Settings.ONE_COLUMN,
-                                               padx=Settings.SIX_PIXELS)
-
-        self.color_lab.grid(row=Settings.ZERO_ROW,
-                            column=Settings.TWO_COLUMN,
-                            padx=Settings.SIX_PIXELS)
-
-        Scale(self.root,
-              variable=self.start_value,
-              from_=Settings.VALUE_ONE,
-              to=Settings.VALUE_ONE_HUNDRED,
-              orient=HORIZONTAL,
-              command=self.select).grid(row=Settings.ZERO_ROW,
-                                        column=Settings.THREE_COLUMN,
-                                        padx=Settings.SIX_PIXELS)
-
-        Label(self.root,
-              text=Title.ACTIONS + Settings.COLON).grid(row=Settings.ONE_ROW,
-                                                        column=Settings.ONE_COLUMN)
-
-        Button(self.root,
-               text=Title.FILL,
-               width=Settings.WEIGHT_TEN,
-               command=self.pour).grid(row=Settings.ONE_ROW,
-                                       column=Settings.ONE_COLUMN)
-
-        Button(self.root,
-               text=Title.CLEAR,
-               width=Settings.WEIGHT_TEN,
-               command=self.clear_canvas).grid(row=Settings.ONE_ROW,
-                                               column=Settings.TWO_COLUMN)
-
-        Button(self.root,
-               text=Title.SAVE,
-               width=Settings.WEIGHT_TEN,
-               command=self.save_img).grid(row=Settings.ONE_ROW,
-                                           column=Settings.SIX_COLUMN)
-
-    def popup(self, event) -> None:
-        self.x = event.x
-        self.y = event.y
-        self.menu.post(event.x_root, event.y_root)
+    tool: str = Tool.PEN
+    fill_tolerance: int = Settings.FILL_TOLERANCE
+
+    def __init__(self, headless: bool = False,
+                 size: Tuple[int, int] = (Settings.POINT_1280, Settings.POINT_640)) -> None:
+        # image can be larger than the screen, only the edited tiles take memory
+        self.image1: TiledImage = TiledImage(size, Color.WHITE)
+        self.draw_img: TiledDraw = self.image1.draw()
+        self.frontend = None
+        self.canvas = None
+        self._stroke: Optional[Stroke] = None  # current pen stroke, while the mouse button is pressed
+        if not headless:
+            # Tk is imported and started only for the window
+            from frontend import TkFrontend
+            self.frontend = TkFrontend(self)
+            self.canvas = self.frontend.canvas
+        # every engine has its own figures, they are drawn by the scene once per frame
+        self.scene: Scene = Scene(self.image1, self.canvas, Color.WHITE)
+
+    @property
+    def headless(self) -> bool:
+        return self.frontend is None
 
     def draw_pen(self, event) -> None:
-        x1, y1 = (event.x - self.brush_size), (event.y - self.brush_size)
-        x2, y2 = (event.x + self.brush_size), (event.y + self.brush_size)
-        self.canvas.create_oval(x1, y1, x2, y2, fill=self.color, width=Settings.WIDTH_ZERO)
-        self.draw_img.ellipse((x1, y1, x2, y2), fill=self.color)
+        """Motion points are added to the current stroke, it is drawn once per frame."""
+        if self.tool != Tool.PEN:
+            return
+        if self._stroke is None:
+            self._stroke = Stroke(event.x, event.y, self.canvas, self.brush_size, self.color, self.draw_img)
+            self.add_figure(self._stroke)
+            return
+        self._stroke.add_point(event.x, event.y)
+        self.scene.extend(self._stroke.id)
+
+    def end_stroke(self, event=None) -> None:
+        self._stroke = None
 
     def draw_rectangle(self) -> None:
-        rectangle = Rectangle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img)
-        rectangle.draw()
+        self.add_figure(Rectangle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img))
 
     def draw_circle(self) -> None:
-        circle = Circle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img)
-        circle.draw()
+        self.add_figure(Circle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img))
 
     def draw_triangle(self) -> None:
-        triangle = Triangle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img)
-        triangle.draw()
-
-    def choose_color(self) -> None:
-        (rqb, hx) = colorchooser.askcolor()
-        self.color = hx
-        self.color_lab[Settings.COLUMN_BG] = hx
+        self.add_figure(Triangle(self.x, self.y, self.canvas, self.brush_size, self.color, self.draw_img))
 
     def select(self, value) -> None:
         self.brush_size = int(value)
 
-    def pour(self) -> None:
-        self.canvas.delete(Settings.ALL)
-        self.canvas[Settings.COLUMN_BG] = self.color
-        self.draw_img.rectangle((Settings.POINT_ZERO, Settings.POINT_ZERO, Settings.POINT_1280, Settings.POINT_720),
-                                width=Settings.WIDTH_ZERO,
-                                fill=self.color)
-        self.draw_img.rectangle((Settings.POINT_ZERO, Settings.POINT_ZERO, Settings.POINT_1280, Settings.POINT_720),
-                                width=Settings.WIDTH_ZERO,
-                                fill=self.color)
+    def _set_background(self, color: str) -> None:
+        self.end_stroke()
+        self.scene.clear(color)
+        if self.frontend is not None:
+            self.frontend.set_background(color)
+
+    def pour(self) -> str:
+        """Switches the fill tool on and off, returns the current tool."""
+        self.end_stroke()
+        self.tool = Tool.PEN if self.tool == Tool.FILL else Tool.FILL
+        return self.tool
+
+    def click(self, event) -> None:
+        if self.tool == Tool.FILL:
+            self.flood_fill(event.x, event.y)
+
+    def flood_fill(self, x: int, y: int, color: Optional[str] = None,
+                   tolerance: Optional[int] = None) -> Optional[int]:
+        """Fills the region of the similar color around (x, y), the region is added to the scene as one figure.
+        Returns id of the figure, or None when the point is out of the image."""
+        self.draw()
+        pixels = np.asarray(self.image1.to_image())
+        region = flood_fill_mask(pixels, x, y, self.fill_tolerance if tolerance is None else tolerance)
+        if region is None:
+            return None
+        mask, (x1, y1, _, _) = region
+        return self.add_figure(FillArea(x1, y1, self.canvas, mask, color or self.color, self.draw_img))
 
     def clear_canvas(self) -> None:
-        self.canvas.delete(Settings.ALL)
-        self.canvas[Settings.COLUMN_BG] = Color.WHITE
-        self.draw_img.rectangle((Settings.POINT_ZERO, Settings.POINT_ZERO, Settings.POINT_1280, Settings.POINT_720),
-                                width=Settings.WIDTH_ZERO,
-                                fill=Color.WHITE)
-
-    def save_img(self) -> None:
-        filename = f'image_{randint(0, 10000)}.png'
+        self._set_background(Color.WHITE)
+
+    def save_img(self, filename: Optional[str] = None) -> str:
+        self.draw()
+        if filename is None:
+            filename = f'image_{randint(0, 10000)}.png'
         self.image1.save(filename)
-        messagebox.showinfo(Title.SAVE, 'Saved under name %s' % filename)
+        return filename
+
+    def export_tiles(self, directory: str) -> List[Tuple[int, int]]:
+        """Writes only tiles changed since the previous export, returns them."""
+        self.draw()
+        return self.image1.export_tiles(directory)
+
+    @property
+    def figures(self) -> List[Figure]:
+        return list(self.scene)
 
     def draw(self) -> None:
-        for figure in self.figures:
-            figure.draw()
-        self.clear_canvas()
+        """Draws changed figures at once, without waiting for the next frame."""
+        self.scene.render()
 
-    def add_figure(self, figure) -> None:
-        self.figures.append(figure)
+    def add_figure(self, figure: Figure, z: Optional[int] = None) -> int:
+        return self.scene.add(figure, z)
 
     def start(self) -> None:
-        self.root.mainloop()
+        if self.frontend is not None:
+            self.frontend.start()
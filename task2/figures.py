@@ -1,7 +1,32 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
 from constants import Settings
 
 
+def capsules_mask(points: np.ndarray, radius: float, box: Tuple[int, int, int, int]) -> np.ndarray:
+    """Boolean mask of the box: pixels closer than radius to the polyline points[0] - points[1] - ... .
+    Distances from all pixels to all segments are computed by numpy, segments are processed in chunks."""
+    x1, y1, x2, y2 = box
+    px = np.arange(x1, x2, dtype=np.float64)[None, None, :]
+    py = np.arange(y1, y2, dtype=np.float64)[None, :, None]
+    start, direction = points[:-1], np.diff(points, axis=0)
+    length = (direction ** 2).sum(axis=1)
+    length[length == 0] = 1  # zero length segment is the circle around its start
+
+    mask = np.zeros((y2 - y1, x2 - x1), dtype=bool)
+    chunk = max(1, Settings.STROKE_CHUNK_PIXELS // mask.size)
+    for first in range(0, len(start), chunk):
+        ax, ay = (start[first:first + chunk, i][:, None, None] for i in (0, 1))
+        dx, dy = (direction[first:first + chunk, i][:, None, None] for i in (0, 1))
+        t = np.clip(((px - ax) * dx + (py - ay) * dy) / length[first:first + chunk, None, None], 0, 1)
+        mask |= (((px - ax - t * dx) ** 2 + (py - ay - t * dy) ** 2) <= radius ** 2).any(axis=0)
+    return mask
+
+
 class Figure(ABC):
     def __init__(self, x, y, canvas, color, draw_img) -> None:
         self.x = x
@@ -9,11 +34,56 @@ class Figure(ABC):
         self.canvas = canvas
         self.color = color
         self.draw_img = draw_img
+        # retained state, managed by the scene
+        self.id: Optional[int] = None
+        self.z: int = 0
+        self.dirty: bool = True
 
     @abstractmethod
-    def draw(self) -> None:
+    def bbox(self) -> Tuple[float, float, float, float]:
+        pass
+
+    @abstractmethod
+    def canvas_coords(self) -> List[float]:
         pass
 
+    @abstractmethod
+    def create_item(self, canvas) -> int:
+        """Creates the canvas item of the figure, returns its id."""
+        pass
+
+    @abstractmethod
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        """Draws the figure by ImageDraw, shifted by (dx, dy) - the figure can be drawn into a part of the image."""
+        pass
+
+    def update_item(self, canvas, item: int) -> None:
+        """Moves the existing canvas item to the figure position."""
+        canvas.coords(item, *self.canvas_coords())
+        canvas.itemconfigure(item, fill=self.color)
+
+    def extend_item(self, canvas, item: int) -> None:
+        """Adds new parts of the figure to the existing canvas item (moves all item by default)."""
+        self.update_item(canvas, item)
+
+    def rasterize_pending(self, draw_img) -> None:
+        """Draws the part of the figure, which was added after the last mark_rasterized (all figure by default)."""
+        self.rasterize(draw_img)
+
+    def mark_rasterized(self) -> None:
+        """Called by the scene, when the whole figure is in the image: parts drawn later are pending."""
+        pass
+
+    def log(self) -> None:
+        pass
+
+    def draw(self) -> None:
+        if self.canvas is not None:
+            self.create_item(self.canvas)
+        self.rasterize(self.draw_img)
+        self.mark_rasterized()
+        self.log()
+
 
 class Circle(Figure):
 
@@ -21,27 +91,155 @@ class Circle(Figure):
         super().__init__(x, y, canvas, color, draw_img)
         self.radius = radius
 
-    def draw(self) -> None:
-        self.canvas.create_oval(self.x, self.y, self.x + self.radius, self.y + self.radius,
-                                fill=self.color,
-                                width=Settings.WIDTH_ZERO)
-        self.draw_img.ellipse((self.x, self.y, self.x + self.radius, self.y + self.radius), fill=self.color)
+    def bbox(self) -> Tuple[float, float, float, float]:
+        return self.x, self.y, self.x + self.radius, self.y + self.radius
+
+    def canvas_coords(self) -> List[float]:
+        return list(self.bbox())
+
+    def create_item(self, canvas) -> int:
+        return canvas.create_oval(*self.canvas_coords(),
+                                  fill=self.color,
+                                  width=Settings.WIDTH_ZERO)
+
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        draw_img.ellipse((self.x + dx, self.y + dy, self.x + self.radius + dx, self.y + self.radius + dy),
+                         fill=self.color)
+
+    def log(self) -> None:
         print(f'Drawing Circle at ({self.x}, {self.y}) with radius {self.radius}')
 
 
+class Stroke(Figure):
+    """Pen stroke: motion points are buffered and joined into a continuous polyline of the brush width.
+    The stroke is one canvas line item, new segments are rasterized by one numpy pass (capsule fill)."""
+
+    def __init__(self, x, y, canvas, brush_size, color, draw_img) -> None:
+        super().__init__(x, y, canvas, color, draw_img)
+        self.brush_size = brush_size
+        self._points: np.ndarray = np.empty((Settings.STROKE_BUFFER_SIZE, 2), dtype=np.float64)
+        self._points[0] = x, y
+        self._count: int = 1
+        self._rasterized: int = 0  # points drawn into the image
+        self._on_canvas: int = 0  # points of the canvas item
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points[:self._count]
+
+    def add_point(self, x, y) -> None:
+        if self._count == len(self._points):
+            self._points = np.concatenate((self._points, np.empty_like(self._points)))
+        self._points[self._count] = x, y
+        self._count += 1
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        points = self.points
+        (x1, y1), (x2, y2) = points.min(axis=0), points.max(axis=0)
+        return x1 - self.brush_size, y1 - self.brush_size, x2 + self.brush_size, y2 + self.brush_size
+
+    def canvas_coords(self) -> List[float]:
+        points = self.points if self._count > 1 else np.repeat(self.points, 2, axis=0)
+        return points.ravel().tolist()
+
+    def create_item(self, canvas) -> int:
+        self._on_canvas = self._count
+        return canvas.create_line(*self.canvas_coords(),
+                                  fill=self.color,
+                                  width=self.brush_size * 2,
+                                  capstyle=Settings.ROUND,
+                                  joinstyle=Settings.ROUND)
+
+    def update_item(self, canvas, item: int) -> None:
+        super().update_item(canvas, item)
+        self._on_canvas = self._count
+
+    def extend_item(self, canvas, item: int) -> None:
+        # only new points are sent to Tk, so the frame cost doesn't depend on the stroke length
+        if self._on_canvas < self._count:
+            canvas.insert(item, Settings.END, self.points[self._on_canvas:].ravel().tolist())
+            self._on_canvas = self._count
+
+    def _rasterize_points(self, draw_img, points: np.ndarray, dx: int, dy: int) -> None:
+        points = points + (dx, dy)
+        if len(points) == 1:
+            points = np.repeat(points, 2, axis=0)
+        # neighbour segments are close to each other, so every chunk is drawn in its own small box
+        for first in range(0, len(points) - 1, Settings.STROKE_CHUNK_SEGMENTS):
+            chunk = points[first:first + Settings.STROKE_CHUNK_SEGMENTS + 1]
+            x1, y1 = np.floor(chunk.min(axis=0) - self.brush_size).astype(int)
+            x2, y2 = np.ceil(chunk.max(axis=0) + self.brush_size).astype(int) + 1
+            mask = capsules_mask(chunk, self.brush_size, (x1, y1, x2, y2))
+            draw_img.bitmap((x1, y1), Image.fromarray(mask.view(np.uint8) * 255, 'L'), fill=self.color)
+
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        # the scene can draw only a clipped part of the stroke, so the drawn points are marked by the scene
+        self._rasterize_points(draw_img, self.points, dx, dy)
+
+    def rasterize_pending(self, draw_img) -> None:
+        # the last drawn point is the start of the first new segment
+        self._rasterize_points(draw_img, self.points[max(self._rasterized - 1, 0):], 0, 0)
+
+    def mark_rasterized(self) -> None:
+        self._rasterized = self._count
+
+
+class FillArea(Figure):
+    """Result of the flood fill: the region mask, painted by the color.
+    On the canvas it is one image item, transparent out of the region."""
+
+    def __init__(self, x, y, canvas, mask: np.ndarray, color, draw_img) -> None:
+        super().__init__(x, y, canvas, color, draw_img)
+        self.mask: Image.Image = Image.fromarray(mask.view(np.uint8) * 255, 'L')
+        self._photo = None  # Tk image should be referenced while it is on the canvas
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        return self.x, self.y, self.x + self.mask.width - 1, self.y + self.mask.height - 1
+
+    def canvas_coords(self) -> List[float]:
+        return [self.x, self.y]
+
+    def _create_photo(self):
+        from PIL import ImageTk
+        layer = Image.new('RGBA', self.mask.size, self.color)
+        layer.putalpha(self.mask)
+        self._photo = ImageTk.PhotoImage(layer)
+        return self._photo
+
+    def create_item(self, canvas) -> int:
+        return canvas.create_image(*self.canvas_coords(), image=self._create_photo(), anchor=Settings.ANCHOR_NW)
+
+    def update_item(self, canvas, item: int) -> None:
+        canvas.coords(item, *self.canvas_coords())
+        canvas.itemconfigure(item, image=self._create_photo())
+
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        draw_img.bitmap((self.x + dx, self.y + dy), self.mask, fill=self.color)
+
+
 class Rectangle(Figure):
     def __init__(self, x, y, canvas, brush_size, color, draw_img) -> None:
         super().__init__(x, y, canvas, color, draw_img)
         self.height = int(brush_size / 2)
         self.width = brush_size
 
-    def draw(self) -> None:
-        self.canvas.create_rectangle(self.x, self.y, self.x + self.width, self.y + self.height,
-                                     fill=self.color,
-                                     width=Settings.WIDTH_ZERO)
-        self.draw_img.polygon((self.x, self.y, self.x + self.width, self.y, self.x + self.width,
-                               self.y + self.height, self.x, self.y + self.height),
-                              fill=self.color)
+    def bbox(self) -> Tuple[float, float, float, float]:
+        return self.x, self.y, self.x + self.width, self.y + self.height
+
+    def canvas_coords(self) -> List[float]:
+        return list(self.bbox())
+
+    def create_item(self, canvas) -> int:
+        return canvas.create_rectangle(*self.canvas_coords(),
+                                       fill=self.color,
+                                       width=Settings.WIDTH_ZERO)
+
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        x, y = self.x + dx, self.y + dy
+        draw_img.polygon((x, y, x + self.width, y, x + self.width, y + self.height, x, y + self.height),
+                         fill=self.color)
+
+    def log(self) -> None:
         print(f'Drawing Rectangle at ({self.x}, {self.y}) with width {self.width}, height {self.height}')
 
 
@@ -51,14 +249,23 @@ class Triangle(Figure):
         super().__init__(x, y, canvas, color, draw_img)
         self.size = size
 
-    def draw(self) -> None:
-        self.canvas.create_polygon([self.x, self.y],
-                                   [self.x + self.size / 2, self.y + self.size],
-                                   [self.x - self.size / 2, self.y + self.size],
-                                   fill=self.color)
-        self.draw_img.polygon([(self.x, self.y),
-                               (self.x + self.size / 2, self.y + self.size),
-                               (self.x - self.size / 2, self.y + self.size)],
-                              fill=self.color)
+    def bbox(self) -> Tuple[float, float, float, float]:
+        return self.x - self.size / 2, self.y, self.x + self.size / 2, self.y + self.size
+
+    def canvas_coords(self) -> List[float]:
+        return [self.x, self.y,
+                self.x + self.size / 2, self.y + self.size,
+                self.x - self.size / 2, self.y + self.size]
+
+    def create_item(self, canvas) -> int:
+        return canvas.create_polygon(*self.canvas_coords(), fill=self.color)
+
+    def rasterize(self, draw_img, dx: int = 0, dy: int = 0) -> None:
+        draw_img.polygon([(self.x + dx, self.y + dy),
+                          (self.x + self.size / 2 + dx, self.y + self.size + dy),
+                          (self.x - self.size / 2 + dx, self.y + self.size + dy)],
+                         fill=self.color)
+
+    def log(self) -> None:
         print(f'Drawing Triangle with vertices [({self.x}, {self.y}), ({int(self.x + self.size / 2)}, '
               f'{self.y + self.size}), ({int(self.x - self.size / 2)}, {self.y + self.size})]')
@@ -0,0 +1,67 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+Box = Tuple[int, int, int, int]
+
+
+def similar_mask(pixels: np.ndarray, color: np.ndarray, tolerance: int) -> np.ndarray:
+    """Pixels, which channels differ from the color not more than tolerance.
+    Channels are compared one by one: reduction over the short last axis is much slower."""
+    mask = None
+    for channel in range(pixels.shape[-1]):
+        plane, value = pixels[..., channel], color[channel]
+        if tolerance <= 0:
+            similar = plane == value
+        else:
+            # uint8 difference without overflow
+            similar = (np.maximum(plane, value) - np.minimum(plane, value)) <= tolerance
+        mask = similar if mask is None else np.logical_and(mask, similar, out=mask)
+    return mask
+
+
+def flood_fill_mask(pixels: np.ndarray, x: int, y: int, tolerance: int = 0) -> Optional[Tuple[np.ndarray, Box]]:
+    """Connected region (4-neighbours) of pixels similar to the pixel (x, y).
+
+    Rows of the similar pixels are split into runs by numpy, then runs are joined row by row:
+    the python loop works with runs, not with pixels, so one color region of any size is cheap.
+    Returns the region mask cropped by its bounding box, and the box (x1, y1, x2, y2), or None out of image.
+    """
+    height, width = pixels.shape[:2]
+    if not (0 <= x < width and 0 <= y < height):
+        return None
+    mask = similar_mask(pixels, pixels[y, x], tolerance)
+
+    # runs of the similar pixels: [start, end) in every row, in row-major order
+    edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).view(np.int8), axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    run_ends = np.nonzero(edges == -1)[1]
+    row_first = np.searchsorted(run_rows, np.arange(height + 1))
+
+    seed = row_first[y] + np.searchsorted(run_starts[row_first[y]:row_first[y + 1]], x, side='right') - 1
+    filled = np.zeros(len(run_rows), dtype=bool)
+    filled[seed] = True
+    stack = [seed]
+    while stack:
+        run = stack.pop()
+        row, start, end = run_rows[run], run_starts[run], run_ends[run]
+        for neighbour_row in (row - 1, row + 1):
+            if not 0 <= neighbour_row < height:
+                continue
+            first, last = row_first[neighbour_row], row_first[neighbour_row + 1]
+            # runs of the neighbour row, which overlap [start, end)
+            low = first + run_ends[first:last].searchsorted(start, side='right')
+            high = first + run_starts[first:last].searchsorted(end, side='left')
+            for neighbour in range(low, high):
+                if not filled[neighbour]:
+                    filled[neighbour] = True
+                    stack.append(neighbour)
+
+    rows, starts, ends = run_rows[filled], run_starts[filled], run_ends[filled]
+    x1, y1, x2, y2 = int(starts.min()), int(rows.min()), int(ends.max()), int(rows.max()) + 1
+    # region mask from the runs: +1 at the run start, -1 at the run end, cumulative sum.
+    # Every row sums to zero, so the rows can be summed as one flat array
+    steps = np.zeros((y2 - y1, x2 - x1 + 1), dtype=np.int8)
+    steps[rows - y1, starts - x1] = 1
+    steps[rows - y1, ends - x1] = -1
+    return steps.ravel().cumsum(dtype=np.int8).reshape(steps.shape)[:, :-1].view(bool), (x1, y1, x2, y2)
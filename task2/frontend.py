@@ -0,0 +1,122 @@
+from tkinter import *
+from tkinter import colorchooser, messagebox
+from constants import Settings, Title, Color, Tool
+
+
+class TkFrontend:
+    """Tk window of the engine: canvas, menu and controls. Engine can work without it (headless)."""
+
+    def __init__(self, engine) -> None:
+        self.engine = engine
+        self.root: Tk = Tk()
+        self.canvas: Canvas = Canvas(self.root, bg=Color.WHITE)
+        self.menu: Menu = Menu(tearoff=0)
+        self.color_lab: Label = Label(self.root, bg=engine.color, width=Settings.WIDTH_TEN)
+        self.start_value: IntVar = IntVar(value=Settings.TEN_VALUE)
+        self._post_init()
+
+    def _post_init(self) -> None:
+        self._init_root()
+        self._init_canvas()
+        self._create_menu()
+        self._create_interface()
+
+    def _init_root(self) -> None:
+        self.root.title(Title.ENGINE2D)
+        self.root.geometry(Settings.SIZE_1280x720)
+        self.root.resizable(Settings.FALSE_VALUE,
+                            Settings.FALSE_VALUE)
+        self.root.columnconfigure(Settings.SIX_COLUMN,
+                                  weight=Settings.WEIGHT_ONE)
+        self.root.rowconfigure(Settings.TWO_ROW,
+                               weight=Settings.WEIGHT_ONE)
+
+    def _init_canvas(self) -> None:
+        self.canvas.grid(row=Settings.TWO_ROW,
+                         column=Settings.ZERO_COLUMN,
+                         columnspan=Settings.SEVEN_COLUMN,
+                         padx=Settings.FIVE_PIXELS,
+                         pady=Settings.FIVE_PIXELS,
+                         sticky=E + W + S + N)
+        self.canvas.bind(Settings.BUTTON_B1, self.engine.draw_pen)
+        self.canvas.bind(Settings.BUTTON_1, self.engine.click)
+        self.canvas.bind(Settings.BUTTON_B1_RELEASE, self.engine.end_stroke)
+        self.canvas.bind(Settings.BUTTON_3, self.popup)
+
+    def _create_menu(self) -> None:
+        self.menu.add_command(label=Title.RECTANGLE, command=self.engine.draw_rectangle)
+        self.menu.add_command(label=Title.CIRCLE, command=self.engine.draw_circle)
+        self.menu.add_command(label=Title.TRIANGLE, command=self.engine.draw_triangle)
+
+    def _create_interface(self) -> None:
+        Label(self.root,
+              text=Title.OPTIONS + Settings.COLON).grid(row=Settings.ZERO_ROW,
+                                                        column=Settings.ZERO_COLUMN,
+                                                        padx=Settings.SIX_PIXELS)
+        Button(self.root,
+               text=Title.CHOOSE_COLOR,
+               width=Settings.WEIGHT_ELEVEN,
+               command=self.choose_color).grid(row=Settings.ZERO_ROW,
+                                               column=Settings.ONE_COLUMN,
+                                               padx=Settings.SIX_PIXELS)
+
+        self.color_lab.grid(row=Settings.ZERO_ROW,
+                            column=Settings.TWO_COLUMN,
+                            padx=Settings.SIX_PIXELS)
+
+        Scale(self.root,
+              variable=self.start_value,
+              from_=Settings.VALUE_ONE,
+              to=Settings.VALUE_ONE_HUNDRED,
+              orient=HORIZONTAL,
+              command=self.engine.select).grid(row=Settings.ZERO_ROW,
+                                               column=Settings.THREE_COLUMN,
+                                               padx=Settings.SIX_PIXELS)
+
+        Label(self.root,
+              text=Title.ACTIONS + Settings.COLON).grid(row=Settings.ONE_ROW,
+                                                        column=Settings.ONE_COLUMN)
+
+        self.fill_button = Button(self.root,
+                                  text=Title.FILL,
+                                  width=Settings.WEIGHT_TEN,
+                                  command=self.pour)
+        self.fill_button.grid(row=Settings.ONE_ROW,
+                              column=Settings.ONE_COLUMN)
+
+        Button(self.root,
+               text=Title.CLEAR,
+               width=Settings.WEIGHT_TEN,
+               command=self.engine.clear_canvas).grid(row=Settings.ONE_ROW,
+                                                      column=Settings.TWO_COLUMN)
+
+        Button(self.root,
+               text=Title.SAVE,
+               width=Settings.WEIGHT_TEN,
+               command=self.save_img).grid(row=Settings.ONE_ROW,
+                                           column=Settings.SIX_COLUMN)
+
+    def popup(self, event) -> None:
+        self.engine.x = event.x
+        self.engine.y = event.y
+        self.menu.post(event.x_root, event.y_root)
+
+    def choose_color(self) -> None:
+        (rqb, hx) = colorchooser.askcolor()
+        self.engine.color = hx
+        self.color_lab[Settings.COLUMN_BG] = hx
+
+    def pour(self) -> None:
+        """Fill button is pressed down, while the fill tool is on."""
+        tool = self.engine.pour()
+        self.fill_button.config(relief=Settings.RELIEF_SUNKEN if tool == Tool.FILL else Settings.RELIEF_RAISED)
+
+    def set_background(self, color: str) -> None:
+        self.canvas[Settings.COLUMN_BG] = color
+
+    def save_img(self) -> None:
+        filename = self.engine.save_img()
+        messagebox.showinfo(Title.SAVE, 'Saved under name %s' % filename)
+
+    def start(self) -> None:
+        self.root.mainloop()
@@ -0,0 +1,271 @@
+import bisect
+import math
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from PIL import Image, ImageDraw
+
+from figures import Figure
+from tiled_image import TileKey, TiledImage
+
+Box = Tuple[int, int, int, int]
+
+
+class Scene:
+    """Retained scene graph: figures have ids, z-order and dirty flags.
+    render() draws only changed figures: a new figure on top is rasterized at once, other changes repaint only
+    the changed region of the image (background and figures under the region, in z-order).
+    Canvas items are created once per figure and moved by coords, render is called once per frame.
+    Figures are indexed by the tiles of the image, so repainting of a region visits only the figures near it."""
+
+    def __init__(self, image: TiledImage, canvas=None, background: str = 'white') -> None:
+        self.image: TiledImage = image
+        self.canvas = canvas
+        self.background: str = background
+        self._figures: Dict[int, Figure] = {}
+        self._items: Dict[int, int] = {}  # figure id: canvas item id
+        self._next_id: int = 0
+        self._top_z: int = -1
+        self._top_item_z: int = -1  # z of the top canvas item
+        self._dirty: Dict[int, Figure] = {}
+        self._grown: Set[int] = set()  # figures, which only got new parts on top of the scene
+        self._dirty_regions: List[Box] = []
+        self._deleted_items: List[int] = []
+        self._render_requested: bool = False
+        # spatial index: figure ids by tiles under their regions
+        self._regions: Dict[int, Box] = {}
+        self._tiles: Dict[int, Set[TileKey]] = {}
+        self._buckets: Dict[TileKey, Set[int]] = defaultdict(set)
+        # canvas items in z-order: sorted (z, figure id), and z of every item in it
+        self._item_order: List[Tuple[int, int]] = []
+        self._item_z: Dict[int, int] = {}
+        self._logged: Set[int] = set()  # figures, which were drawn at least once
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def __iter__(self) -> Iterator[Figure]:
+        """Figures in z-order, from bottom to top. Figures with the same z are in order of adding."""
+        return iter(sorted(self._figures.values(), key=lambda figure: (figure.z, figure.id)))
+
+    def get(self, figure_id: int) -> Figure:
+        return self._figures[figure_id]
+
+    def add(self, figure: Figure, z: Optional[int] = None) -> int:
+        figure.id = self._next_id
+        self._next_id += 1
+        region = self._index(figure)
+        if z is None or z > self._top_z:
+            figure.z = self._top_z = self._top_z + 1 if z is None else z
+        else:
+            # inserted under the other figures - the region should be composed again
+            figure.z = z
+            self._dirty_regions.append(region)
+        self._figures[figure.id] = figure
+        self._mark_dirty(figure)
+        return figure.id
+
+    def update(self, figure_id: int, **attributes) -> None:
+        """Changes figure attributes (position, size, color, z), the old and the new regions are repainted."""
+        figure = self._figures[figure_id]
+        self._dirty_regions.append(self._regions[figure_id])
+        for name, value in attributes.items():
+            setattr(figure, name, value)
+        self._top_z = max(self._top_z, figure.z)
+        self._dirty_regions.append(self._index(figure))
+        self._grown.discard(figure_id)  # moved figure is drawn again whole
+        self._mark_dirty(figure)
+
+    def extend(self, figure_id: int) -> None:
+        """The figure got new parts (for example the stroke got new points): only new parts are drawn,
+        if the figure is on top of the scene."""
+        figure = self._figures[figure_id]
+        region = self._index(figure)
+        if figure.z < self._top_z:
+            self._dirty_regions.append(region)
+        elif not figure.dirty:
+            self._grown.add(figure_id)
+        self._mark_dirty(figure)
+
+    def remove(self, figure_id: int) -> None:
+        self._figures.pop(figure_id)
+        self._dirty_regions.append(self._unindex(figure_id))
+        self._logged.discard(figure_id)
+        if figure_id in self._items:
+            self._deleted_items.append(self._items.pop(figure_id))
+            del self._item_order[bisect.bisect_left(self._item_order, (self._item_z.pop(figure_id), figure_id))]
+        self.request_render()
+
+    def clear(self, background: Optional[str] = None) -> None:
+        """Removes all figures and paints the whole image by the background color."""
+        if background is not None:
+            self.background = background
+        self._figures.clear()
+        self._items.clear()
+        self._dirty.clear()
+        self._grown.clear()
+        self._dirty_regions.clear()
+        self._deleted_items.clear()
+        self._regions.clear()
+        self._tiles.clear()
+        self._buckets.clear()
+        self._item_order.clear()
+        self._item_z.clear()
+        self._logged.clear()
+        self._top_z = self._top_item_z = -1
+        self.image.fill(self.background)
+        if self.canvas is not None:
+            self.canvas.delete('all')
+
+    def _mark_dirty(self, figure: Figure) -> None:
+        figure.dirty = True
+        self._dirty[figure.id] = figure
+        self.request_render()
+
+    def request_render(self) -> None:
+        """Changes are rendered by one render() per frame, when Tk is idle."""
+        if self.canvas is None or self._render_requested:
+            return
+        self._render_requested = True
+        self.canvas.after_idle(self.render)
+
+    def _region(self, figure: Figure) -> Box:
+        x1, y1, x2, y2 = figure.bbox()
+        width, height = self.image.size
+        return (max(0, math.floor(x1) - 1), max(0, math.floor(y1) - 1),
+                min(width, math.ceil(x2) + 2), min(height, math.ceil(y2) + 2))
+
+    def _index(self, figure: Figure) -> Box:
+        """Saves the region of the figure and moves the figure to the buckets of the tiles under it."""
+        region = self._regions[figure.id] = self._region(figure)
+        tiles = set(self.image.tile_keys((region[0], region[1], region[2] - 1, region[3] - 1)))
+        old_tiles = self._tiles.get(figure.id, set())
+        for key in old_tiles - tiles:
+            self._buckets[key].discard(figure.id)
+        for key in tiles - old_tiles:
+            self._buckets[key].add(figure.id)
+        self._tiles[figure.id] = tiles
+        return region
+
+    def _unindex(self, figure_id: int) -> Box:
+        for key in self._tiles.pop(figure_id):
+            self._buckets[key].discard(figure_id)
+        return self._regions.pop(figure_id)
+
+    def _figures_in(self, region: Box) -> List[Figure]:
+        """Figures intersecting the region, in z-order."""
+        x1, y1, x2, y2 = region
+        ids = set()
+        for key in self.image.tile_keys((x1, y1, x2 - 1, y2 - 1)):
+            ids.update(self._buckets.get(key, ()))
+        figures = [self._figures[figure_id] for figure_id in ids
+                   if self._intersects(region, self._regions[figure_id])]
+        figures.sort(key=lambda figure: (figure.z, figure.id))
+        return figures
+
+    @classmethod
+    def _merge(cls, regions: List[Box]) -> List[Box]:
+        """Overlapping regions are joined into their bounding box, so no pixel is composed twice."""
+        merged: List[Box] = []
+        for region in regions:
+            if region[0] >= region[2] or region[1] >= region[3]:
+                continue
+            overlapping = [other for other in merged if cls._intersects(region, other)]
+            while overlapping:
+                for other in overlapping:
+                    merged.remove(other)
+                    region = (min(region[0], other[0]), min(region[1], other[1]),
+                              max(region[2], other[2]), max(region[3], other[3]))
+                # the joined box can overlap the other regions
+                overlapping = [other for other in merged if cls._intersects(region, other)]
+            merged.append(region)
+        return merged
+
+    @staticmethod
+    def _intersects(first: Box, second: Box) -> bool:
+        return first[0] < second[2] and second[0] < first[2] and first[1] < second[3] and second[1] < first[3]
+
+    @staticmethod
+    def _contains(outer: Box, inner: Box) -> bool:
+        return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+    def _compose_region(self, region: Box) -> None:
+        x1, y1, x2, y2 = region
+        part = Image.new(self.image.mode, (x2 - x1, y2 - y1), self.background)
+        draw_part = ImageDraw.Draw(part)
+        for figure in self._figures_in(region):
+            figure.rasterize(draw_part, -x1, -y1)
+        self.image.paste(part, (x1, y1))
+
+    def render(self) -> None:
+        self._render_requested = False
+        dirty, self._dirty = sorted(self._dirty.values(), key=lambda figure: (figure.z, figure.id)), {}
+        regions, self._dirty_regions = self._merge(self._dirty_regions), []
+        grown, self._grown = self._grown, set()
+
+        draw_img = self.image.draw()
+        for figure in dirty:
+            if figure.id not in self._figures:
+                continue
+            if not any(self._contains(region, self._regions[figure.id]) for region in regions):
+                # on top of the scene, nothing should be drawn over it.
+                # The part in the dirty regions is drawn again by the composing below, in z-order
+                if figure.id in grown:
+                    figure.rasterize_pending(draw_img)
+                else:
+                    figure.rasterize(draw_img)
+            figure.mark_rasterized()
+            figure.dirty = False
+            if figure.id not in self._logged:
+                # changes of the drawn figure are not logged again
+                self._logged.add(figure.id)
+                figure.log()
+        for region in regions:
+            self._compose_region(region)
+
+        if self.canvas is not None:
+            self._render_canvas(dirty, grown)
+
+    def _render_canvas(self, dirty: List[Figure], grown: Set[int]) -> None:
+        for item in self._deleted_items:
+            self.canvas.delete(item)
+        self._deleted_items.clear()
+        for figure in dirty:
+            if figure.id not in self._figures:
+                continue
+            item = self._items.get(figure.id)
+            if item is None:
+                item = self._items[figure.id] = figure.create_item(self.canvas)
+                self._order_item(figure)
+                if figure.z >= self._top_item_z:
+                    # new item is on top of the canvas already
+                    self._top_item_z = figure.z
+                    continue
+            elif figure.id in grown:
+                # on top of the scene already, only new parts are added to the item
+                figure.extend_item(self.canvas, item)
+                continue
+            else:
+                figure.update_item(self.canvas, item)
+                self._order_item(figure)
+            self._restack(figure, item)
+
+    def _order_item(self, figure: Figure) -> None:
+        """Keeps the canvas items sorted by z, the item above the figure is found by binary search."""
+        old_z = self._item_z.get(figure.id)
+        if old_z == figure.z:
+            return
+        if old_z is not None:
+            del self._item_order[bisect.bisect_left(self._item_order, (old_z, figure.id))]
+        bisect.insort(self._item_order, (figure.z, figure.id))
+        self._item_z[figure.id] = figure.z
+
+    def _restack(self, figure: Figure, item: int) -> None:
+        if figure.z >= self._top_item_z:
+            self._top_item_z = figure.z
+            self.canvas.tag_raise(item)
+            return
+        # the lowest item with z above the figure
+        above = bisect.bisect_left(self._item_order, (figure.z + 1, -1))
+        if above < len(self._item_order):
+            self.canvas.tag_lower(item, self._items[self._item_order[above][1]])
@@ -1,9 +1,19 @@
+import os
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
 from engine import Engine2D
-from figures import Circle, Rectangle, Triangle
+from figures import Circle, Rectangle, Stroke, Triangle
+from scene import Scene
+from tiled_image import TiledImage
 
 
 def test_engine_with_shapes(capsys):
-    engine = Engine2D()
+    engine = Engine2D(headless=True)
     engine.add_figure(Circle(x=0, y=0, radius=10, canvas=engine.canvas, color=engine.color, draw_img=engine.draw_img))
     engine.add_figure(Triangle(x=100, y=100, canvas=engine.canvas, size=10, color=engine.color,
                                draw_img=engine.draw_img))
@@ -20,9 +30,204 @@ def test_engine_with_shapes(capsys):
 
 
 def test_engine_without_figures(capsys):
-    engine = Engine2D()
+    engine = Engine2D(headless=True)
 
     # Тест: отрисовка без добавленных фигур
     engine.draw()
     captured = capsys.readouterr()
     assert captured.out == ''
+
+
+def test_headless_engine_draws_into_image():
+    engine = Engine2D(headless=True)
+    engine.add_figure(Rectangle(x=200, y=200, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                draw_img=engine.draw_img))
+
+    engine.draw()
+    assert engine.image1.getpixel((205, 202)) == (0, 0, 0)
+    assert engine.image1.getpixel((100, 100)) == (255, 255, 255)
+
+
+def test_pen_stroke_is_continuous():
+    engine = Engine2D(headless=True)
+    engine.brush_size = 20
+    for x, y in ((100, 100), (600, 120)):
+        engine.draw_pen(SimpleNamespace(x=x, y=y))
+    engine.end_stroke()
+
+    engine.draw()
+    assert len(engine.figures) == 1
+    assert all(engine.image1.getpixel((x, 110)) == (0, 0, 0) for x in range(100, 600))
+
+
+def test_export_writes_only_changed_tiles(tmp_path):
+    engine = Engine2D(headless=True)
+    engine.add_figure(Rectangle(x=10, y=10, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                draw_img=engine.draw_img))
+    engine.add_figure(Rectangle(x=1000, y=500, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                draw_img=engine.draw_img))
+    assert len(engine.export_tiles(str(tmp_path))) == 2
+
+    engine.add_figure(Rectangle(x=20, y=20, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                draw_img=engine.draw_img))
+    assert engine.export_tiles(str(tmp_path)) == [(0, 0)]
+
+
+def test_tiled_image_draws_same_pixels_as_plain_image():
+    # small tiles: every figure crosses tile borders, some of them cross the image edges
+    plain, tiled = Image.new('RGB', (97, 83), 'white'), TiledImage((97, 83), 'white', tile_size=16)
+    figures = [Circle(x=10, y=-7, radius=37, canvas=None, color='red', draw_img=None),
+               Rectangle(x=60, y=14, brush_size=45, canvas=None, color='green', draw_img=None),
+               Triangle(x=3, y=40, size=41, canvas=None, color='blue', draw_img=None),
+               Triangle(x=50, y=50, size=33, canvas=None, color='black', draw_img=None),
+               Stroke(x=5, y=75, brush_size=4, canvas=None, color='gray', draw_img=None)]
+    figures[-1].add_point(90, 30)
+    for figure in figures:
+        figure.rasterize(ImageDraw.Draw(plain))
+        figure.rasterize(tiled.draw())
+    tiled.draw().line([(-5, 20), (100, 33)], fill='yellow', width=5)
+    ImageDraw.Draw(plain).line([(-5, 20), (100, 33)], fill='yellow', width=5)
+
+    assert np.array_equal(np.asarray(tiled.to_image()), np.asarray(plain))
+
+
+def test_getpixel_out_of_image_raises():
+    image = TiledImage((32, 32), tile_size=16)
+    assert image.getpixel((31, 31)) == (255, 255, 255)
+    for xy in ((-1, 5), (5, -1), (32, 0), (0, 32)):
+        with pytest.raises(IndexError):
+            image.getpixel(xy)
+
+
+def test_load_tiles_restores_exported_image(tmp_path):
+    image = TiledImage((100, 40), 'white', tile_size=16)
+    image.draw().ellipse((10, 5, 40, 30), fill='red')
+    image.export_tiles(str(tmp_path))
+    image.draw().rectangle((60, 10, 70, 20), fill='blue')
+    image.export_tiles(str(tmp_path))
+
+    loaded = TiledImage.load_tiles(str(tmp_path))
+    assert (loaded.size, loaded.tile_size, loaded.background) == ((100, 40), 16, 'white')
+    assert loaded.tiles_count == image.tiles_count
+    assert np.array_equal(np.asarray(loaded.to_image()), np.asarray(image.to_image()))
+    # loaded tiles are exported already, cleared image removes them from the directory
+    loaded.fill('white')
+    assert loaded.export_tiles(str(tmp_path)) == []
+    assert sorted(os.listdir(tmp_path)) == ['tiles.json']
+
+
+def test_flood_fill_stops_at_the_stroke():
+    engine = Engine2D(headless=True)
+    engine.brush_size = 10
+    for x, y in ((100, 0), (100, 700)):
+        engine.draw_pen(SimpleNamespace(x=x, y=y))
+    engine.end_stroke()
+
+    engine.flood_fill(5, 5, color='red')
+    engine.draw()
+    assert engine.image1.getpixel((50, 300)) == (255, 0, 0)
+    assert engine.image1.getpixel((100, 300)) == (0, 0, 0)
+    assert engine.image1.getpixel((500, 300)) == (255, 255, 255)
+
+
+def test_figure_added_over_removed_one_is_drawn_whole():
+    engine = Engine2D(headless=True)
+    rectangle = engine.add_figure(Rectangle(x=100, y=100, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                            draw_img=engine.draw_img))
+    engine.draw()
+
+    # removed figure and the new one are rendered in one frame
+    engine.scene.remove(rectangle)
+    engine.add_figure(Circle(x=50, y=50, radius=300, canvas=engine.canvas, color='red', draw_img=engine.draw_img))
+    engine.draw()
+    assert engine.image1.getpixel((105, 102)) == (255, 0, 0)
+    assert engine.image1.getpixel((200, 200)) == (255, 0, 0)
+
+
+class FakeCanvas:
+    """Records calls of the Tk canvas, which are used by the scene."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args)) or len(self.calls)
+
+
+def test_stroke_frame_sends_only_new_points_to_canvas():
+    canvas = FakeCanvas()
+    scene = Scene(TiledImage((1280, 640)), canvas)
+    stroke = Stroke(0, 0, canvas, 5, 'black', scene.image.draw())
+    scene.add(stroke)
+    scene.render()
+    item = scene._items[stroke.id]
+    for frame in range(1, 100):
+        stroke.add_point(frame * 10, frame)
+        scene.extend(stroke.id)
+        canvas.calls.clear()
+        scene.render()
+        assert canvas.calls == [('insert', (item, 'end', [frame * 10.0, float(frame)]))]
+
+
+def test_stroke_grown_over_removed_figure_keeps_new_segments():
+    engine = Engine2D(headless=True)
+    engine.brush_size = 5
+    rectangle = engine.add_figure(Rectangle(x=100, y=100, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                            draw_img=engine.draw_img))
+    engine.draw_pen(SimpleNamespace(x=100, y=100))
+    engine.draw()
+
+    engine.scene.remove(rectangle)
+    engine.draw_pen(SimpleNamespace(x=500, y=100))
+    engine.draw()
+    engine.draw_pen(SimpleNamespace(x=500, y=400))
+    engine.draw()
+    assert all(engine.image1.getpixel((x, 100)) == (0, 0, 0) for x in range(100, 500))
+    assert all(engine.image1.getpixel((500, y)) == (0, 0, 0) for y in range(100, 400))
+
+
+def test_scene_changes_give_same_image_as_full_redraw(capsys):
+    random.seed(16)
+    scene = Scene(TiledImage((200, 150), tile_size=32))
+    ids = []
+    for frame in range(10):
+        for _ in range(10):
+            operation = random.random()
+            if operation < 0.4 or not ids:
+                figure = random.choice((Circle, Rectangle))(random.randint(-10, 200), random.randint(-10, 150), None,
+                                                            random.randint(3, 60), random.choice(('red', 'blue')), None)
+                # some figures are inserted under the others, some of them with the same z
+                ids.append(scene.add(figure, z=random.choice((None, random.randint(0, 50)))))
+            elif operation < 0.8:
+                scene.update(random.choice(ids), x=random.randint(-10, 200), y=random.randint(-10, 150))
+            else:
+                scene.remove(ids.pop(random.randrange(len(ids))))
+        scene.render()
+
+    plain = Image.new('RGB', (200, 150), 'white')
+    for figure in scene:
+        figure.rasterize(ImageDraw.Draw(plain))
+    assert np.array_equal(np.asarray(scene.image.to_image()), np.asarray(plain))
+
+
+def test_figure_is_logged_only_when_it_is_drawn_first(capsys):
+    engine = Engine2D(headless=True)
+    rectangle = engine.add_figure(Rectangle(x=100, y=100, canvas=engine.canvas, brush_size=10, color=engine.color,
+                                            draw_img=engine.draw_img))
+    engine.draw()
+    engine.scene.update(rectangle, x=200)
+    engine.draw()
+    assert capsys.readouterr().out == 'Drawing Rectangle at (100, 100) with width 10, height 5\n'
+
+
+def test_moved_figure_item_is_lowered_under_the_next_item():
+    canvas = FakeCanvas()
+    scene = Scene(TiledImage((1280, 640)), canvas)
+    figures = [scene.add(Rectangle(x=10 * z, y=10, canvas=canvas, brush_size=10, color='red', draw_img=None), z=z)
+               for z in (0, 5, 10)]
+    scene.render()
+    canvas.calls.clear()
+
+    scene.update(figures[0], z=7)
+    scene.render()
+    assert canvas.calls[-1] == ('tag_lower', (scene._items[figures[0]], scene._items[figures[2]]))
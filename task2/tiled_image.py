@@ -0,0 +1,195 @@
+import json
+import math
+import os
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from PIL import Image, ImageColor, ImageDraw
+
+from constants import Settings
+
+Box = Tuple[int, int, int, int]
+TileKey = Tuple[int, int]  # (column, row)
+
+MANIFEST_FILE = 'tiles.json'
+
+
+class TiledImage:
+    """Backing image split into square tiles. Tiles are created on the first drawing into them,
+    untouched tiles are the background color, so memory and repaint cost depend on the edited area,
+    not on the image size. Changed tiles are tracked, export_tiles() writes only them."""
+
+    def __init__(self, size: Tuple[int, int], background: str = 'white', mode: str = 'RGB',
+                 tile_size: int = Settings.TILE_SIZE) -> None:
+        self.size: Tuple[int, int] = size
+        self.mode: str = mode
+        self.tile_size: int = tile_size
+        self.background: str = background
+        self._tiles: Dict[TileKey, Image.Image] = {}
+        self._dirty: Set[TileKey] = set()
+        self._exported: Set[TileKey] = set()  # tiles in the exported directory
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
+
+    @property
+    def height(self) -> int:
+        return self.size[1]
+
+    @property
+    def tiles_count(self) -> int:
+        return len(self._tiles)
+
+    @property
+    def dirty_tiles(self) -> Set[TileKey]:
+        return set(self._dirty)
+
+    def draw(self) -> 'TiledDraw':
+        return TiledDraw(self)
+
+    def _tile_box(self, key: TileKey) -> Box:
+        x, y = key[0] * self.tile_size, key[1] * self.tile_size
+        return x, y, min(x + self.tile_size, self.width), min(y + self.tile_size, self.height)
+
+    def tile_keys(self, box: Sequence[float]) -> Iterator[TileKey]:
+        """Keys of the tiles intersecting the box, the box is clipped by the image."""
+        x1, y1 = max(0, math.floor(box[0])), max(0, math.floor(box[1]))
+        x2, y2 = min(self.width, math.ceil(box[2]) + 1), min(self.height, math.ceil(box[3]) + 1)
+        if x1 >= x2 or y1 >= y2:
+            return
+        for row in range(y1 // self.tile_size, (y2 - 1) // self.tile_size + 1):
+            for column in range(x1 // self.tile_size, (x2 - 1) // self.tile_size + 1):
+                yield column, row
+
+    def tile(self, key: TileKey) -> Image.Image:
+        """Tile for drawing, it is created by the first call and marked as changed."""
+        tile = self._tiles.get(key)
+        if tile is None:
+            x1, y1, x2, y2 = self._tile_box(key)
+            tile = self._tiles[key] = Image.new(self.mode, (x2 - x1, y2 - y1), self.background)
+        self._dirty.add(key)
+        return tile
+
+    def fill(self, color: str) -> None:
+        """Whole image is the color: all tiles are dropped."""
+        self.background = color
+        self._dirty.update(self._tiles)
+        self._dirty.update(self._exported)
+        self._tiles.clear()
+
+    def paste(self, image: Image.Image, xy: Tuple[int, int]) -> None:
+        x, y = xy
+        for key in self.tile_keys((x, y, x + image.width - 1, y + image.height - 1)):
+            tile_x, tile_y = key[0] * self.tile_size, key[1] * self.tile_size
+            self.tile(key).paste(image, (x - tile_x, y - tile_y))
+
+    def crop(self, box: Box) -> Image.Image:
+        x1, y1, x2, y2 = box
+        image = Image.new(self.mode, (x2 - x1, y2 - y1), self.background)
+        for key in self.tile_keys((x1, y1, x2 - 1, y2 - 1)):
+            tile = self._tiles.get(key)
+            if tile is not None:
+                image.paste(tile, (key[0] * self.tile_size - x1, key[1] * self.tile_size - y1))
+        return image
+
+    def to_image(self) -> Image.Image:
+        return self.crop((0, 0, self.width, self.height))
+
+    def getpixel(self, xy: Tuple[int, int]):
+        x, y = xy
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError('image index out of range')
+        tile = self._tiles.get((x // self.tile_size, y // self.tile_size))
+        if tile is None:
+            return ImageColor.getcolor(self.background, self.mode)
+        return tile.getpixel((x % self.tile_size, y % self.tile_size))
+
+    def save(self, filename: str) -> None:
+        self.to_image().save(filename)
+
+    def export_tiles(self, directory: str) -> List[TileKey]:
+        """Writes changed tiles since the previous export into the directory (PNG per tile and the manifest),
+        tiles of the background color are removed from the directory. Returns written tiles."""
+        os.makedirs(directory, exist_ok=True)
+        written = []
+        for key in sorted(self._dirty):
+            path = os.path.join(directory, f'tile_{key[0]}_{key[1]}.png')
+            tile = self._tiles.get(key)
+            if tile is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                self._exported.discard(key)
+                continue
+            tile.save(path)
+            self._exported.add(key)
+            written.append(key)
+        self._dirty.clear()
+        with open(os.path.join(directory, MANIFEST_FILE), 'w') as manifest:
+            json.dump({'size': self.size, 'mode': self.mode, 'tile_size': self.tile_size,
+                       'background': self.background, 'tiles': sorted(self._exported)}, manifest)
+        return written
+
+    @classmethod
+    def load_tiles(cls, directory: str) -> 'TiledImage':
+        with open(os.path.join(directory, MANIFEST_FILE)) as manifest:
+            data = json.load(manifest)
+        image = cls(tuple(data['size']), data['background'], data['mode'], data['tile_size'])
+        for column, row in data['tiles']:
+            with Image.open(os.path.join(directory, f'tile_{column}_{row}.png')) as tile:
+                image._tiles[column, row] = tile.convert(image.mode)
+            image._exported.add((column, row))
+        return image
+
+
+class TiledDraw:
+    """ImageDraw for the tiled image: every operation is drawn only into the tiles under its bounding box."""
+
+    def __init__(self, image: TiledImage) -> None:
+        self.image: TiledImage = image
+
+    @staticmethod
+    def _points(xy) -> List[Tuple[float, float]]:
+        if xy and isinstance(xy[0], (tuple, list)):
+            return [tuple(point) for point in xy]
+        return list(zip(xy[::2], xy[1::2]))
+
+    def _draw(self, points: List[Tuple[float, float]], method: str, **kwargs) -> None:
+        xs, ys = [x for x, _ in points], [y for _, y in points]
+        margin = math.ceil((kwargs.get('width') or 0) / 2) + 1  # line width is outside of the points
+        # the box is clipped by the image: Pillow clips the shape by the image edges,
+        # so the mask should have the same edges to get the same pixels as the plain image
+        x1, y1 = max(0, math.floor(min(xs)) - margin), max(0, math.floor(min(ys)) - margin)
+        x2 = min(self.image.width - 1, math.ceil(max(xs)) + margin)
+        y2 = min(self.image.height - 1, math.ceil(max(ys)) + margin)
+        if x1 > x2 or y1 > y2:
+            return
+        fill = kwargs.pop('fill', None)
+        if 'outline' in kwargs or fill is None:
+            # two colors can't be drawn by one mask
+            for key in self.image.tile_keys((x1, y1, x2, y2)):
+                dx, dy = key[0] * self.image.tile_size, key[1] * self.image.tile_size
+                getattr(ImageDraw.Draw(self.image.tile(key)), method)([(x - dx, y - dy) for x, y in points],
+                                                                      fill=fill, **kwargs)
+            return
+        # the shape is drawn whole, as into the plain image, and its mask is copied into the tiles under it
+        mask = Image.new('1', (x2 - x1 + 1, y2 - y1 + 1), 0)
+        getattr(ImageDraw.Draw(mask), method)([(x - x1, y - y1) for x, y in points], fill=1, **kwargs)
+        self.bitmap((x1, y1), mask, fill=fill)
+
+    def ellipse(self, xy, **kwargs) -> None:
+        self._draw(self._points(xy), 'ellipse', **kwargs)
+
+    def rectangle(self, xy, **kwargs) -> None:
+        self._draw(self._points(xy), 'rectangle', **kwargs)
+
+    def polygon(self, xy, **kwargs) -> None:
+        self._draw(self._points(xy), 'polygon', **kwargs)
+
+    def line(self, xy, **kwargs) -> None:
+        self._draw(self._points(xy), 'line', **kwargs)
+
+    def bitmap(self, xy: Tuple[int, int], bitmap: Image.Image, fill=None) -> None:
+        x, y = xy
+        for key in self.image.tile_keys((x, y, x + bitmap.width - 1, y + bitmap.height - 1)):
+            dx, dy = key[0] * self.image.tile_size, key[1] * self.image.tile_size
+            ImageDraw.Draw(self.image.tile(key)).bitmap((x - dx, y - dy), bitmap, fill=fill)